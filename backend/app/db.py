@@ -1,24 +1,427 @@
-from sqlmodel import SQLModel, create_engine, Session
-from typing import Generator
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event, exc, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import AsyncGenerator, List, Optional
+import itertools
+import math
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./workfair.db")
 
+# 요청 처리용 async 드라이버 (ASYNC_DATABASE_URL 로 직접 지정 가능)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """sqlite:///x.db -> sqlite+aiosqlite:///x.db, mysql+pymysql://... -> mysql+aiomysql://..."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# 읽기 전용 복제본 (쉼표로 구분, 예: mysql+pymysql://ro1/db,mysql+pymysql://ro2/db)
+REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# 쓰기 커밋 후 N초 동안은 그 클라이언트의 읽기도 primary 로 (read-your-writes, 복제 지연 대비)
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "2"))
+# 마지막 쓰기 시각 (epoch 초) 을 실어 나르는 쿠키 / 헤더 (ReadYourWritesMiddleware)
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "x-last-write"
+
+# SQL 로그 출력 (개발용, 요청별 집계는 app/services/sql_metrics.py)
+SQL_ECHO = os.getenv("SQL_ECHO", "0").lower() in ("1", "true", "yes")
+
 # MySQL의 경우 connect_args 불필요
 connect_args = {"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-engine = create_engine(DATABASE_URL, echo=True, connect_args=connect_args)
+
+_is_sqlite = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+
+# 커넥션 풀 설정 (엔진별, 워커별 값)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# MySQL wait_timeout 보다 짧게 유지해서 끊긴 커넥션을 재사용하지 않도록 함
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0" if _is_sqlite else "1").lower() in ("1", "true", "yes")
+
+# SQLite 운영 모드: WAL 로 읽기와 쓰기가 서로 막지 않도록 함 (SQLITE_TUNING=0 으로 해제)
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "1").lower() in ("1", "true", "yes")
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    # WAL 에서는 NORMAL 로도 손상 없음 (전원 장애 시 마지막 커밋만 유실 가능)
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    # 음수는 KiB 단위 (-65536 = 64MB)
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),
+    "temp_store": "MEMORY",
+}
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None):
+    """Connect-event listener applying SQLITE_PRAGMAS to every new connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def register_sqlite_functions(dbapi_connection, connection_record=None):
+    """Connect-event listener adding the SQL functions queries rely on (radius search)"""
+    # geo 가 app.db 를 import 하므로 여기서 지연 import
+    from app.services.geo import sql_haversine_km
+
+    dbapi_connection.create_function("haversine_km", 4, sql_haversine_km, deterministic=True)
+
+
+class PoolStats:
+    """Checkout counters and wait times of one pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+class _TimedPoolMixin:
+    """Measures how long each checkout waits for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    # 인메모리 SQLite 는 커넥션마다 DB 가 달라지므로 기본 풀 유지
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": POOL_PRE_PING,
+    }
+
+
+# 동기 엔진: 테이블 생성, seed, 백그라운드 작업 (스레드에서 실행)
+engine = create_engine(
+    DATABASE_URL,
+    echo=SQL_ECHO,
+    connect_args=connect_args,
+    **_pool_options(DATABASE_URL, TimedQueuePool),
+)
+
+# 비동기 엔진: 라우터 요청 처리 (이벤트 루프를 블로킹하지 않음)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQL_ECHO,
+    connect_args=connect_args,
+    **_pool_options(ASYNC_DATABASE_URL, TimedAsyncQueuePool),
+)
+
+# 읽기 전용 엔진 (GET 트래픽 분산용)
+replica_engines = [
+    create_async_engine(
+        to_async_url(url),
+        echo=SQL_ECHO,
+        connect_args={"check_same_thread": False} if make_url(url).get_backend_name() == "sqlite" else {},
+        **_pool_options(to_async_url(url), TimedAsyncQueuePool),
+    )
+    for url in REPLICA_URLS
+]
+_replica_cycle = itertools.cycle(replica_engines)
+
+for _engine in (engine, async_engine.sync_engine, *(e.sync_engine for e in replica_engines)):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", register_sqlite_functions)
+        if SQLITE_TUNING:
+            event.listen(_engine, "connect", apply_sqlite_pragmas)
+
+
+def pool_status(name: str, sync_engine: Engine) -> dict:
+    """Pool occupancy and checkout wait times for /health/db"""
+    pool = sync_engine.pool
+    status = {"name": name, "pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checkedOut=pool.checkedout(),
+            idle=pool.checkedin(),
+            # QueuePool.overflow() 는 -size 부터 시작
+            overflow=max(pool.overflow(), 0),
+            maxOverflow=pool._max_overflow,
+            timeoutSeconds=pool.timeout(),
+            recycleSeconds=pool._recycle,
+            prePing=pool._pre_ping,
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(
+            checkouts=stats.checkouts,
+            checkoutTimeouts=stats.timeouts,
+            waitMsAvg=round(stats.wait_total / stats.checkouts * 1000, 3) if stats.checkouts else 0.0,
+            waitMsMax=round(stats.wait_max * 1000, 3),
+        )
+    return status
 
 
 def create_db_and_tables():
     """Create all tables in the database"""
     SQLModel.metadata.create_all(engine)
+    upgrade_existing_tables()
+
+
+# 모델에서 제거된 인덱스 (기존 DB 에서 삭제, schema.sql 의 idx_* 이름 포함)
+DROPPED_INDEXES = {
+    # (role, phone) / (role, email) 복합 인덱스가 대신함
+    "signup_users": ("ix_signup_users_phone", "ix_signup_users_email", "idx_phone", "idx_email"),
+    # 상호명 검색은 FULLTEXT / FTS5, LIKE '%...%' 는 B-tree 인덱스를 못 씀
+    "employers": ("ix_employers_shopName", "idx_shopName"),
+}
+
+
+def upgrade_existing_tables():
+    """Add columns and indexes declared on the models but missing from existing tables
+
+    create_all() only creates new tables, so columns added to a model later
+    (e.g. Job.lat/lng) are added here with ALTER TABLE. Only nullable columns
+    or columns with a scalar default can be added this way. Indexes listed in
+    DROPPED_INDEXES are dropped.
+    """
+    preparer = engine.dialect.identifier_preparer
+    
+    with engine.begin() as conn:
+        # 같은 커넥션으로 조회 (풀에서 두 번째 커넥션을 잡지 않도록)
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                
+                ddl = (
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                )
+                default = column.default.arg if column.default is not None and column.default.is_scalar else None
+                if default is not None:
+                    literal = int(default) if isinstance(default, bool) else default
+                    ddl += f" DEFAULT {literal!r}" if isinstance(literal, str) else f" DEFAULT {literal}"
+                elif not column.nullable:
+                    print(f"Warning: cannot add NOT NULL column {table.name}.{column.name} without a default")
+                    continue
+                
+                conn.exec_driver_sql(ddl)
+                print(f"Added column {table.name}.{column.name}")
+            
+            existing_indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(conn, checkfirst=True)
+            for name in DROPPED_INDEXES.get(table.name, ()):
+                if name in existing_indexes:
+                    conn.exec_driver_sql(f"DROP INDEX {preparer.quote(name)}" + (
+                        "" if engine.dialect.name == "sqlite" else f" ON {preparer.format_table(table)}"
+                    ))
+                    print(f"Dropped index {table.name}.{name}")
+
+
+class PrimarySession(Session):
+    """Request session on the primary; commits open the client's read-your-writes window"""
+
+
+class ReadOnlySession(Session):
+    """Replica session; refuses to flush pending changes"""
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Read-only session: write routes must use get_session")
+        super().flush(objects)
+
+
+class ClientWrites:
+    """Last primary write of the client making the current request (epoch seconds)"""
+
+    def __init__(self, last_write: float = 0.0):
+        self.last_write = last_write
+        self.wrote = False
+
+    def sticky(self) -> bool:
+        # 워커 간 시계 차이 1초까지 허용, 미래 값으로 primary 에 계속 붙는 것은 막음
+        return -1.0 < time.time() - self.last_write < REPLICA_STICKY_SECONDS
+
+
+_client_writes: ContextVar[Optional[ClientWrites]] = ContextVar("client_writes", default=None)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _note_primary_write(session):
+    client = _client_writes.get()
+    if client is not None:
+        client.last_write = time.time()
+        client.wrote = True
+
+
+def reads_pinned_to_primary() -> bool:
+    """True while the current client is inside its read-your-writes window"""
+    client = _client_writes.get()
+    return client is not None and client.sticky()
+
+
+def pick_read_engine():
+    """Next replica (round robin), or the primary right after this client's write"""
+    if not replica_engines or reads_pinned_to_primary():
+        return async_engine
+    return next(_replica_cycle)
+
+
+def is_replica(session: AsyncSession) -> bool:
+    return session.bind is not async_engine
+
+
+def _request_last_write(scope) -> float:
+    """Last-write timestamp sent back by the client (header, else cookie)"""
+    headers = dict(scope.get("headers") or [])
+    raw = headers.get(LAST_WRITE_HEADER.encode())
+    if raw is None and b"cookie" in headers:
+        morsel = SimpleCookie(headers[b"cookie"].decode("latin-1")).get(LAST_WRITE_COOKIE)
+        raw = morsel.value.encode() if morsel else None
+    try:
+        value = float(raw) if raw else 0.0
+    except ValueError:
+        return 0.0
+    return value if math.isfinite(value) else 0.0
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware carrying each client's last write time across requests and workers
+
+    A request that commits on the primary gets ``X-Last-Write`` and a short-lived
+    ``last_write`` cookie; while a client sends either back within
+    REPLICA_STICKY_SECONDS its reads go to the primary.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replica_engines:
+            await self.app(scope, receive, send)
+            return
+
+        client = ClientWrites(_request_last_write(scope))
+        token = _client_writes.set(client)
+
+        async def send_with_last_write(message):
+            if message["type"] == "http.response.start" and client.wrote:
+                value = f"{client.last_write:.3f}"
+                cookie = (
+                    f"{LAST_WRITE_COOKIE}={value}; Max-Age={math.ceil(REPLICA_STICKY_SECONDS)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message.setdefault("headers", []).extend([
+                    (LAST_WRITE_HEADER.encode(), value.encode()),
+                    (b"set-cookie", cookie.encode()),
+                ])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_last_write)
+        finally:
+            _client_writes.reset(token)
+
+
+def all_engines() -> List[tuple]:
+    """(name, sync engine) of every engine, for telemetry and shutdown"""
+    return [
+        ("async", async_engine.sync_engine),
+        ("sync", engine),
+        *((f"replica-{i}", e.sync_engine) for i, e in enumerate(replica_engines)),
+    ]
+
+
+async def dispose_engines():
+    for e in (async_engine, *replica_engines):
+        await e.dispose()
+    engine.dispose()
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session (primary)
+
+    Objects stay loaded after commit (expire_on_commit=False) so routes can
+    read them without an implicit refresh query. Synchronous service helpers
+    run on the same transaction via ``await session.run_sync(fn, ...)``.
+    """
+    async with AsyncSession(
+        async_engine, expire_on_commit=False, sync_session_class=PrimarySession
+    ) as session:
+        yield session
+
 
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only session on a replica
 
-def get_session() -> Generator[Session, None, None]:
-    """Dependency to get database session"""
-    with Session(engine) as session:
+    Falls back to the primary when no DATABASE_REPLICA_URLS are configured or
+    the client committed a write in the last REPLICA_STICKY_SECONDS
+    (ReadYourWritesMiddleware).
+    """
+    async with AsyncSession(
+        pick_read_engine(), expire_on_commit=False, sync_session_class=ReadOnlySession
+    ) as session:
         yield session
 
@@ -1,9 +1,14 @@
+import time
+
+_BOOT_STARTED = time.perf_counter()
+
 from fastapi import FastAPI, WebSocket, Request, HTTPException
+import asyncio
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
-from app.db import create_db_and_tables
+from app.db import ReadYourWritesMiddleware, all_engines, dispose_engines, pool_status
 from app.routers import (
     auth,
     jobs,
@@ -17,7 +22,11 @@ from app.routers import (
     job_seeker,
     employer,
 )
-from app.ws import websocket_endpoint
+from app.services import boot
+from app.services.compression import CompressionMiddleware
+from app.services.sql_metrics import SQLMetricsMiddleware, instrument
+from app.ws import manager as ws_manager, user_websocket_endpoint, websocket_endpoint
+from app.services.chat_persistence import chat_writer
 
 # Translation service는 선택적으로 import
 try:
@@ -27,21 +36,53 @@ except ImportError:
     TRANSLATION_AVAILABLE = False
     print("Warning: Translation service not available. Some features may not work.")
 
+_IMPORTS_MS = (time.perf_counter() - _BOOT_STARTED) * 1000
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    create_db_and_tables()
+    timer = boot.BootTimer(_BOOT_STARTED)
+    timer.phases["imports"] = _IMPORTS_MS
+    
+    # 스키마/시드 (schema_version 이 같으면 생략)
+    boot.run_boot_tasks(timer)
+    
+    # FAST_START 에서는 번역 제공자를 첫 번역 요청 때 초기화
+    if TRANSLATION_AVAILABLE and not boot.FAST_START:
+        with timer.phase("translation"):
+            initialize_translation_service()
     
-    # Seed data
-    from app.seed import seed_nationalities
-    seed_nationalities()
+    from app.services.view_counter import view_counter
+    view_flusher = asyncio.create_task(view_counter.run())
     
-    if TRANSLATION_AVAILABLE:
-        initialize_translation_service()
+    # WebSocket 채팅 메시지 배치 저장
+    chat_flusher = asyncio.create_task(chat_writer.run())
+    
+    # WebSocket pub/sub backplane (WS_BACKPLANE_URL, 기본은 프로세스 내)
+    with timer.phase("ws_backplane"):
+        await ws_manager.start()
+    
+    timer.log()
+    boot.last_boot.update(timer.report())
     yield
     # Shutdown
-    pass
+    view_flusher.cancel()
+    try:
+        await view_flusher
+    except asyncio.CancelledError:
+        pass
+    view_counter.flush()
+    await ws_manager.close()
+    chat_flusher.cancel()
+    try:
+        await chat_flusher
+    except asyncio.CancelledError:
+        pass
+    await chat_writer.flush()
+    
+    # 풀에 남아 있는 커넥션 정리
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -60,6 +101,16 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 클라이언트별 read-your-writes (쓰기 후 REPLICA_STICKY_SECONDS 동안 읽기를 primary 로)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# 요청별 쿼리 수 / DB 시간 (Server-Timing 헤더, N+1 로그)
+instrument([e for _, e in all_engines()])
+app.add_middleware(SQLMetricsMiddleware)
+
+# brotli/gzip 압축 (COMPRESSION_MIN_SIZE 바이트 이상 text/JSON 응답)
+app.add_middleware(CompressionMiddleware)
+
 # Global exception handler to ensure CORS headers are always present on errors
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -107,6 +158,11 @@ async def websocket_conversation(websocket: WebSocket, conversation_id: str):
     await websocket_endpoint(websocket, conversation_id)
 
 
+@app.websocket("/ws/users/{user_id}")
+async def websocket_user(websocket: WebSocket, user_id: str):
+    await user_websocket_endpoint(websocket, user_id)
+
+
 @app.get("/")
 async def root():
     return {"message": "WorkFair API is running"}
@@ -116,3 +172,27 @@ async def root():
 async def health():
     return {"status": "healthy"}
 
+
+@app.get("/health/cache")
+async def health_cache():
+    """In-process cache counters (per worker)"""
+    from app.services.cache import job_detail_cache, meta_cache
+    return {"caches": [job_detail_cache.stats(), meta_cache.stats()]}
+
+
+@app.get("/health/db")
+async def health_db():
+    """Connection pool occupancy and checkout wait times (per worker)"""
+    return {"engines": [pool_status(name, e) for name, e in all_engines()]}
+
+
+@app.get("/health/boot")
+async def health_boot():
+    """Startup phase timings of this worker"""
+    return boot.last_boot
+
+
+@app.get("/health/ws")
+async def health_ws():
+    """WebSocket connections, backplane and message-writer counters (per worker)"""
+    return {**ws_manager.stats(), "persistence": chat_writer.stats()}
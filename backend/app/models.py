@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List
 from datetime import datetime, date
 import json
@@ -28,10 +29,10 @@ class JobSeeker(SQLModel, table=True):
     
     id: str = Field(primary_key=True)
     name: str
-    nationality: str
+    nationality: str = Field(index=True)
     phone: str
     languageLevel: str
-    visaType: str
+    visaType: str = Field(index=True)
     availability: str
     location: Optional[str] = None  # JSON string of GeoPoint
     experience: str = Field(default="[]")  # JSON string of Experience[]
@@ -40,13 +41,22 @@ class JobSeeker(SQLModel, table=True):
 
 class Employer(SQLModel, table=True):
     __tablename__ = "employers"
+    __table_args__ = (
+        # 상호명 검색용 (MySQL 전용, SQLite 는 jobs_fts 사용)
+        Index(
+            "ft_employers_shopName", "shopName",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
     
     id: str = Field(primary_key=True)
-    businessNo: str
-    shopName: str
-    industry: str
+    businessNo: str = Field(index=True)  # EmployerProfile.id (공고 등록 시 조회)
+    shopName: str  # 검색은 ft_employers_shopName / jobs_fts 사용
+    industry: str = Field(index=True)
     address: str
     location: Optional[str] = None  # JSON string of GeoPoint
+    lat: Optional[float] = None
+    lng: Optional[float] = None
     openHours: str
     contact: str
     media: str = Field(default="[]")  # JSON string of media URLs
@@ -59,36 +69,76 @@ class Employer(SQLModel, table=True):
 
 class Job(SQLModel, table=True):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # 공고 검색용 (MySQL 전용, SQLite 는 jobs_fts 사용)
+        Index(
+            "ft_jobs_search", "title", "description", "category",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+        # 공고 피드 keyset 페이지네이션용 (postedAt DESC, id DESC)
+        Index("ix_jobs_postedAt_id", "postedAt", "id"),
+    )
     
     id: str = Field(primary_key=True)
-    employerId: str = Field(foreign_key="employers.id")
+    employerId: str = Field(foreign_key="employers.id", index=True)
     title: str
     description: str
-    category: str
+    category: str = Field(index=True)
     wage: int
     workDays: str
     workHours: str
-    deadline: str  # ISO8601
+    deadline: str = Field(index=True)  # ISO8601
     positions: int
-    requiredLanguage: str
+    requiredLanguage: str = Field(index=True)
     requiredVisa: str = Field(default="[]")  # JSON string
     benefits: Optional[str] = None
     employerMessage: Optional[str] = None
     createdAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    status: str = Field(default="active")  # active, paused, closed
+    status: str = Field(default="active", index=True)  # active, paused, closed
     views: int = Field(default=0)
-    applications: int = Field(default=0)
-    postedAt: Optional[str] = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    location: Optional[str] = None
+    applications: int = Field(default=0)  # 전체 지원자 수
+    appliedCount: int = Field(default=0)  # status 별 지원자 수
+    hiredCount: int = Field(default=0)
+    rejectedCount: int = Field(default=0)
+    # keyset 페이지네이션 키: NULL 이면 postedAt < :cursor 비교에서 빠지므로 NOT NULL
+    postedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    location: Optional[str] = Field(default=None, index=True)
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    geohash: Optional[str] = Field(default=None, index=True)  # precision 6, 반경 검색용
+
+
+class JobVisa(SQLModel, table=True):
+    """Job.requiredVisa 를 행 단위로 펼친 테이블 (비자 필터 인덱스용)"""
+    __tablename__ = "job_visas"
+    __table_args__ = (Index("ix_job_visas_visaType_jobId", "visaType", "jobId"),)
+    
+    jobId: str = Field(foreign_key="jobs.id", primary_key=True)
+    visaType: str = Field(primary_key=True)
+
+
+class EmployerVisa(SQLModel, table=True):
+    """Employer.needVisa 를 행 단위로 펼친 테이블"""
+    __tablename__ = "employer_visas"
+    __table_args__ = (Index("ix_employer_visas_visaType_employerId", "visaType", "employerId"),)
+    
+    employerId: str = Field(foreign_key="employers.id", primary_key=True)
+    visaType: str = Field(primary_key=True)
 
 
 class Application(SQLModel, table=True):
     __tablename__ = "applications"
+    __table_args__ = (
+        # 중복 지원 확인 + 구직자별 목록
+        Index("ix_applications_seekerId_jobId", "seekerId", "jobId"),
+        # 공고별 목록 + status 별 집계 (recount_all)
+        Index("ix_applications_jobId_status", "jobId", "status"),
+    )
     
     applicationId: str = Field(primary_key=True)
     seekerId: str = Field(foreign_key="jobseekers.id")
     jobId: str = Field(foreign_key="jobs.id")
-    status: str = Field(default="applied")  # applied, hired, rejected
+    status: str = Field(default="applied", index=True)  # applied, hired, rejected
     appliedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
     updatedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
     hiredAt: Optional[str] = None
@@ -99,18 +149,33 @@ class Conversation(SQLModel, table=True):
     
     id: str = Field(primary_key=True)
     participants: str = Field(default="[]")  # JSON string of user IDs
-    updatedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    updatedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat(), index=True)
+
+
+class ConversationParticipant(SQLModel, table=True):
+    """Conversation.participants 를 행 단위로 펼친 테이블 (사용자별 대화 목록 조회용)"""
+    __tablename__ = "conversation_participants"
+    __table_args__ = (
+        Index("ix_conversation_participants_userId_conversationId", "userId", "conversationId"),
+    )
+    
+    conversationId: str = Field(foreign_key="conversations.id", primary_key=True)
+    userId: str = Field(primary_key=True)
 
 
 class Message(SQLModel, table=True):
     __tablename__ = "messages"
+    __table_args__ = (
+        # 대화방 메시지 목록 (ORDER BY timestamp DESC LIMIT n)
+        Index("ix_messages_conversationId_timestamp", "conversationId", "timestamp"),
+    )
     
     id: str = Field(primary_key=True)
     conversationId: str = Field(foreign_key="conversations.id")
-    senderId: str
+    senderId: str = Field(index=True)
     text: str
     translatedText: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat(), index=True)
     read: bool = Field(default=False)
 
 
@@ -118,7 +183,7 @@ class LearningProgress(SQLModel, table=True):
     __tablename__ = "learning_progress"
     
     id: str = Field(primary_key=True)
-    seekerId: str = Field(foreign_key="jobseekers.id")
+    seekerId: str = Field(foreign_key="jobseekers.id", index=True)
     currentLevel: str
     completedLessons: int = 0
     totalLessons: int = 100
@@ -131,7 +196,7 @@ class User(SQLModel, table=True):
     id: str = Field(primary_key=True)
     email: str = Field(unique=True, index=True)
     hashedPassword: str
-    role: str  # jobseeker, employer
+    role: str = Field(index=True)  # jobseeker, employer
     profileId: str  # references JobSeeker.id or Employer.id
 
 
@@ -139,12 +204,17 @@ class Nationality(SQLModel, table=True):
     __tablename__ = "nationalities"
     
     code: str = Field(primary_key=True)
-    name: str
+    name: str = Field(index=True)
     phone_code: str
 
 
 class SignupUser(SQLModel, table=True):
     __tablename__ = "signup_users"
+    __table_args__ = (
+        # signin_new: 구직자는 (role, phone), 고용주는 (role, email) 로 조회
+        Index("ix_signup_users_role_phone", "role", "phone"),
+        Index("ix_signup_users_role_email", "role", "email"),
+    )
     
     id: str = Field(primary_key=True)
     role: str  # job_seeker, employer
@@ -166,7 +236,7 @@ class JobSeekerProfile(SQLModel, table=True):
     __tablename__ = "job_seeker_profiles"
     
     id: str = Field(primary_key=True)
-    user_id: str  # references signup_users.id
+    user_id: str = Field(index=True)  # references signup_users.id
     basic_info_file_name: Optional[str] = None
     preferred_regions: str = Field(default="[]")  # JSON string of list[str]
     preferred_jobs: str = Field(default="[]")  # JSON string of list[str]
@@ -184,15 +254,38 @@ class JobSeekerProfile(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class JobSeekerPreference(SQLModel, table=True):
+    """JobSeekerProfile 의 희망 지역/직종/요일 JSON 을 행 단위로 펼친 테이블
+
+    kind: 'region' | 'job' | 'day'
+    """
+    __tablename__ = "job_seeker_preferences"
+    __table_args__ = (
+        Index("ix_job_seeker_preferences_kind_value_profileId", "kind", "value", "profileId"),
+    )
+    
+    profileId: str = Field(foreign_key="job_seeker_profiles.id", primary_key=True)
+    kind: str = Field(primary_key=True)
+    value: str = Field(primary_key=True)
+
+
 class EmployerProfile(SQLModel, table=True):
     __tablename__ = "employer_profiles"
     
     id: str = Field(primary_key=True)
-    user_id: str  # references signup_users.id
+    user_id: str = Field(index=True)  # references signup_users.id
     business_type: str  # 'business' or 'individual'
-    company_name: str
+    company_name: str = Field(index=True)
     address: str
     address_detail: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+
+class AppMeta(SQLModel, table=True):
+    """앱 메타데이터 (key-value). schema_version: 부팅 시 스키마/시드 작업 생략 여부 판단용"""
+    __tablename__ = "app_meta"
+    
+    key: str = Field(primary_key=True)
+    value: str
+    updatedAt: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
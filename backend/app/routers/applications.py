@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional, List
 import uuid
 from datetime import datetime
@@ -7,6 +8,9 @@ from datetime import datetime
 from app.db import get_session
 from app.models import Application
 from app.schemas import ApplicationCreate, ApplicationUpdate
+from app.services.application_counters import record_application, record_status_change
+from app.services.cache import invalidate_job
+from app.services.serializers import application_serializer
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -14,7 +18,7 @@ router = APIRouter(prefix="/applications", tags=["applications"])
 @router.post("", response_model=dict, status_code=201)
 async def create_application(
     request: ApplicationCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Create new application"""
     # Check for duplicate
@@ -22,7 +26,7 @@ async def create_application(
         Application.seekerId == request.seekerId,
         Application.jobId == request.jobId
     )
-    existing = session.exec(statement).first()
+    existing = (await session.exec(statement)).first()
     
     if existing:
         raise HTTPException(status_code=409, detail="Already applied to this job")
@@ -34,9 +38,14 @@ async def create_application(
         status="applied",
     )
     
+    # 지원 내역 저장과 공고 지원자 수 증가를 같은 트랜잭션에서 처리
+    if not await session.run_sync(record_application, request.jobId, application.status):
+        await session.rollback()
+        raise HTTPException(status_code=404, detail="Job not found")
     session.add(application)
-    session.commit()
-    session.refresh(application)
+    await session.commit()
+    await session.refresh(application)
+    invalidate_job(application.jobId)
     
     return application.dict()
 
@@ -45,7 +54,7 @@ async def create_application(
 async def list_applications(
     seekerId: Optional[str] = None,
     jobId: Optional[str] = None,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """List applications with filters"""
     statement = select(Application)
@@ -55,23 +64,24 @@ async def list_applications(
     if jobId:
         statement = statement.where(Application.jobId == jobId)
     
-    applications = session.exec(statement).all()
-    return [app.dict() for app in applications]
+    applications = (await session.exec(statement)).all()
+    return application_serializer.response(applications)
 
 
 @router.patch("/{application_id}", response_model=dict)
 async def update_application(
     application_id: str,
     request: ApplicationUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Update application status"""
     statement = select(Application).where(Application.applicationId == application_id)
-    application = session.exec(statement).first()
+    application = (await session.exec(statement)).first()
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
+    await session.run_sync(record_status_change, application.jobId, application.status, request.status)
     application.status = request.status
     application.updatedAt = datetime.utcnow().isoformat()
     
@@ -79,8 +89,9 @@ async def update_application(
         application.hiredAt = datetime.utcnow().isoformat()
     
     session.add(application)
-    session.commit()
-    session.refresh(application)
+    await session.commit()
+    await session.refresh(application)
+    invalidate_job(application.jobId)
     
     return application.dict()
 
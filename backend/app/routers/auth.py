@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from jose import jwt
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from jose import JWTError, jwt
 from datetime import datetime, timedelta
 import os
 import uuid
 import hashlib
 import traceback
+from typing import Optional
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models import User, JobSeeker, Employer, SignupUser, Nationality, EmployerProfile
 from app.schemas import (
     SignInRequest, NewSignInRequest, SignUpRequest, AuthResponse, SignupPayload, SignupResponse, 
     SignupUserResponse, EmployerSignupPayload, EmployerSignupResponse
 )
+from app.services.child_tables import sync_employer_visas
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -35,10 +38,18 @@ def create_access_token(data: dict):
     return jwt.encode(to_encode, SECRET_KEY, algorithm="HS256")
 
 
+def decode_access_token(token: str) -> Optional[dict]:
+    """Claims of a valid, unexpired token (None otherwise)"""
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    except JWTError:
+        return None
+
+
 @router.post("/signin", response_model=AuthResponse)
-async def signin(request: SignInRequest, session: Session = Depends(get_session)):
+async def signin(request: SignInRequest, session: AsyncSession = Depends(get_session)):
     statement = select(User).where(User.email == request.email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
     
     if not user or not verify_password(request.password, user.hashedPassword):
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -46,10 +57,10 @@ async def signin(request: SignInRequest, session: Session = Depends(get_session)
     # Get profile
     if user.role == "jobseeker":
         profile_stmt = select(JobSeeker).where(JobSeeker.id == user.profileId)
-        profile = session.exec(profile_stmt).first()
+        profile = (await session.exec(profile_stmt)).first()
     else:
         profile_stmt = select(Employer).where(Employer.id == user.profileId)
-        profile = session.exec(profile_stmt).first()
+        profile = (await session.exec(profile_stmt)).first()
     
     token = create_access_token({"sub": user.id, "role": user.role})
     
@@ -65,7 +76,7 @@ async def signin(request: SignInRequest, session: Session = Depends(get_session)
 
 
 @router.post("/signin/new")
-async def signin_new(request: NewSignInRequest, session: Session = Depends(get_session)):
+async def signin_new(request: NewSignInRequest, session: AsyncSession = Depends(get_session)):
     """New signin endpoint for identifier (email or phone) + password + role"""
     try:
         # 전화번호에서 하이픈(-) 제거
@@ -87,7 +98,7 @@ async def signin_new(request: NewSignInRequest, session: Session = Depends(get_s
                 SignupUser.role == "job_seeker"
             )
         
-        user = session.exec(statement).first()
+        user = (await session.exec(statement)).first()
         
         if not user:
             print(f"❌ 사용자를 찾을 수 없음: {request.identifier}")
@@ -129,10 +140,10 @@ async def signin_new(request: NewSignInRequest, session: Session = Depends(get_s
 
 
 @router.post("/signup/legacy", response_model=AuthResponse)
-async def signup_legacy(request: SignUpRequest, session: Session = Depends(get_session)):
+async def signup_legacy(request: SignUpRequest, session: AsyncSession = Depends(get_session)):
     # Check if user exists
     statement = select(User).where(User.email == request.email)
-    existing = session.exec(statement).first()
+    existing = (await session.exec(statement)).first()
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -164,6 +175,7 @@ async def signup_legacy(request: SignUpRequest, session: Session = Depends(get_s
             schedule="",
         )
         session.add(profile)
+        await session.run_sync(sync_employer_visas, profile)
     
     # Create user
     user = User(
@@ -174,9 +186,9 @@ async def signup_legacy(request: SignUpRequest, session: Session = Depends(get_s
         profileId=profile_id,
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
-    session.refresh(profile)
+    await session.commit()
+    await session.refresh(user)
+    await session.refresh(profile)
     
     token = create_access_token({"sub": user.id, "role": user.role})
     
@@ -192,7 +204,7 @@ async def signup_legacy(request: SignUpRequest, session: Session = Depends(get_s
 
 
 @router.post("/signup", response_model=SignupResponse, status_code=201)
-async def signup_new(request: SignupPayload, session: Session = Depends(get_session)):
+async def signup_new(request: SignupPayload, session: AsyncSession = Depends(get_session)):
     """New signup endpoint for wizard flow"""
     try:
         # Validate required terms
@@ -209,10 +221,10 @@ async def signup_new(request: SignupPayload, session: Session = Depends(get_sess
                     status_code=400,
                     detail="구직자는 국적 코드가 필요합니다."
                 )
-            nationality = session.get(Nationality, request.nationality_code)
+            nationality = await session.get(Nationality, request.nationality_code)
             if not nationality:
                 # 사용 가능한 국적 코드 목록 가져오기
-                all_nationalities = session.exec(select(Nationality)).all()
+                all_nationalities = (await session.exec(select(Nationality))).all()
                 available_codes = [n.code for n in all_nationalities]
                 raise HTTPException(
                     status_code=400,
@@ -262,8 +274,8 @@ async def signup_new(request: SignupPayload, session: Session = Depends(get_sess
         )
         
         session.add(signup_user)
-        session.commit()
-        session.refresh(signup_user)
+        await session.commit()
+        await session.refresh(signup_user)
         
         return SignupResponse(
             id=signup_user.id,
@@ -281,10 +293,10 @@ async def signup_new(request: SignupPayload, session: Session = Depends(get_sess
 
 
 @router.get("/signup-user/{user_id}", response_model=SignupUserResponse)
-async def get_signup_user(user_id: str, session: Session = Depends(get_session)):
+async def get_signup_user(user_id: str, session: AsyncSession = Depends(get_read_session)):
     """Get SignupUser info by user_id"""
     statement = select(SignupUser).where(SignupUser.id == user_id)
-    signup_user = session.exec(statement).first()
+    signup_user = (await session.exec(statement)).first()
     
     if not signup_user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -292,7 +304,7 @@ async def get_signup_user(user_id: str, session: Session = Depends(get_session))
     # Get nationality name (optional for employers)
     nationality_name = None
     if signup_user.nationality_code:
-        nationality = session.get(Nationality, signup_user.nationality_code)
+        nationality = await session.get(Nationality, signup_user.nationality_code)
         nationality_name = nationality.name if nationality else None
     
     return SignupUserResponse(
@@ -309,7 +321,7 @@ async def get_signup_user(user_id: str, session: Session = Depends(get_session))
 
 
 @router.post("/signup/employer", response_model=EmployerSignupResponse, status_code=201)
-async def signup_employer(request: EmployerSignupPayload, session: Session = Depends(get_session)):
+async def signup_employer(request: EmployerSignupPayload, session: AsyncSession = Depends(get_session)):
     """Employer signup endpoint"""
     # Create SignupUser for employer
     user_id = f"employer-{uuid.uuid4().hex[:8]}"
@@ -328,8 +340,8 @@ async def signup_employer(request: EmployerSignupPayload, session: Session = Dep
     )
     
     session.add(signup_user)
-    session.commit()
-    session.refresh(signup_user)
+    await session.commit()
+    await session.refresh(signup_user)
     
     # Create EmployerProfile
     profile_id = f"profile-{uuid.uuid4().hex[:8]}"
@@ -343,8 +355,8 @@ async def signup_employer(request: EmployerSignupPayload, session: Session = Dep
     )
     
     session.add(employer_profile)
-    session.commit()
-    session.refresh(employer_profile)
+    await session.commit()
+    await session.refresh(employer_profile)
     
     return EmployerSignupResponse(
         id=signup_user.id,
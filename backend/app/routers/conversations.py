@@ -1,34 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
-import json
 
 from app.db import get_session
-from app.models import Conversation, Message
+from app.models import Conversation, ConversationParticipant, Message
+from app.services.serializers import JSONBytesResponse, conversation_serializer, message_serializer
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
 
 @router.get("/{user_id}", response_model=List[dict])
-async def list_conversations(user_id: str, session: Session = Depends(get_session)):
+async def list_conversations(user_id: str, session: AsyncSession = Depends(get_session)):
     """List all conversations for a user"""
-    statement = select(Conversation)
-    conversations = session.exec(statement).all()
-    
+    # conversation_participants (userId, conversationId) 인덱스로 조회
+    statement = (
+        select(Conversation)
+        .join(ConversationParticipant, ConversationParticipant.conversationId == Conversation.id)
+        .where(ConversationParticipant.userId == user_id)
+    )
+    conversations = (await session.exec(statement)).all()
+
+    # 대화방별 마지막 메시지를 한 번에 조회 (ix_messages_conversationId_timestamp)
+    last_messages = {}
+    if conversations:
+        ranked = (
+            select(
+                Message,
+                func.row_number().over(
+                    partition_by=Message.conversationId,
+                    order_by=(Message.timestamp.desc(), Message.id.desc()),
+                ).label("rn"),
+            )
+            .where(Message.conversationId.in_([conv.id for conv in conversations]))
+            .subquery()
+        )
+        latest = aliased(Message, ranked)
+        rows = (await session.exec(select(latest).where(ranked.c.rn == 1))).all()
+        last_messages = {msg.conversationId: msg for msg in rows}
+
     result = []
     for conv in conversations:
-        participants = json.loads(conv.participants)
-        if user_id in participants:
-            # Get last message
-            msg_stmt = select(Message).where(
-                Message.conversationId == conv.id
-            ).order_by(Message.timestamp.desc()).limit(1)
-            last_msg = session.exec(msg_stmt).first()
-            
-            conv_dict = conv.dict()
-            conv_dict["participants"] = participants
-            conv_dict["lastMessage"] = last_msg.dict() if last_msg else None
-            result.append(conv_dict)
-    
-    return result
+        conv_dict = conversation_serializer.to_dict(conv)
+        last_msg = last_messages.get(conv.id)
+        conv_dict["lastMessage"] = message_serializer.to_dict(last_msg) if last_msg else None
+        result.append(conv_dict)
 
+    return JSONBytesResponse(result)
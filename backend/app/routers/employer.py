@@ -1,24 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 import uuid
 
-from app.db import get_session
+from app.db import get_read_session
 from app.models import EmployerProfile, SignupUser
 from app.schemas import EmployerProfileResponse
+from app.services.http_cache import conditional_response, encode
 
 router = APIRouter(prefix="/employer", tags=["employer"])
 
 
 @router.get("/profile/{user_id}", response_model=EmployerProfileResponse)
-async def get_employer_profile(user_id: str, session: Session = Depends(get_session)):
-    """Get employer profile by user_id"""
+async def get_employer_profile(
+    user_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Get employer profile by user_id (ETag / Last-Modified supported)"""
     statement = select(EmployerProfile).where(EmployerProfile.user_id == user_id)
-    profile = session.exec(statement).first()
+    profile = (await session.exec(statement)).first()
     
     if not profile:
         raise HTTPException(status_code=404, detail="고용주 프로필을 찾을 수 없습니다.")
     
-    return EmployerProfileResponse(
+    payload = EmployerProfileResponse(
         id=profile.id,
         user_id=profile.user_id,
         business_type=profile.business_type,
@@ -28,4 +34,5 @@ async def get_employer_profile(user_id: str, session: Session = Depends(get_sess
         created_at=profile.created_at.isoformat(),
         updated_at=profile.updated_at.isoformat(),
     )
+    return conditional_response(request, encode(payload.model_dump(), last_modified=profile.updated_at))
 
@@ -1,26 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 import uuid
 import json
 from datetime import datetime
 
-from app.db import get_session
-from app.models import JobSeekerProfile
+from app.db import get_read_session, get_session
+from app.models import Job, JobSeekerProfile
 from app.schemas import JobSeekerProfileCreate, JobSeekerProfileResponse
+from app.services.child_tables import sync_profile_preferences
+from app.services.hydration import hydrate_jobs, load_by_ids
 
 router = APIRouter(prefix="/job-seeker", tags=["job-seeker"])
 
 
 @router.post("/profile", response_model=JobSeekerProfileResponse, status_code=201)
 async def create_job_seeker_profile(
-    request: JobSeekerProfileCreate, session: Session = Depends(get_session)
+    request: JobSeekerProfileCreate, session: AsyncSession = Depends(get_session)
 ):
     """Create or update job seeker profile"""
     # Check if profile already exists
     statement = select(JobSeekerProfile).where(
         JobSeekerProfile.user_id == request.user_id
     )
-    existing = session.exec(statement).first()
+    existing = (await session.exec(statement)).first()
 
     # Convert work_schedule to DB format
     work_available_dates_json = json.dumps(request.work_schedule.available_dates)
@@ -57,8 +61,9 @@ async def create_job_seeker_profile(
         existing.experience_introduction = experience_introduction
         existing.updated_at = datetime.utcnow()
         session.add(existing)
-        session.commit()
-        session.refresh(existing)
+        await session.run_sync(sync_profile_preferences, existing)
+        await session.commit()
+        await session.refresh(existing)
 
         return JobSeekerProfileResponse(
             id=existing.id,
@@ -98,8 +103,9 @@ async def create_job_seeker_profile(
             experience_introduction=experience_introduction,
         )
         session.add(profile)
-        session.commit()
-        session.refresh(profile)
+        await session.run_sync(sync_profile_preferences, profile)
+        await session.commit()
+        await session.refresh(profile)
 
         return JobSeekerProfileResponse(
             id=profile.id,
@@ -123,11 +129,11 @@ async def create_job_seeker_profile(
 
 @router.get("/profile/{user_id}", response_model=JobSeekerProfileResponse)
 async def get_job_seeker_profile(
-    user_id: str, session: Session = Depends(get_session)
+    user_id: str, session: AsyncSession = Depends(get_read_session)
 ):
     """Get job seeker profile by user_id"""
     statement = select(JobSeekerProfile).where(JobSeekerProfile.user_id == user_id)
-    profile = session.exec(statement).first()
+    profile = (await session.exec(statement)).first()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -151,3 +157,40 @@ async def get_job_seeker_profile(
         updated_at=profile.updated_at.isoformat(),
     )
 
+
+
+@router.get("/{user_id}/recommendations", response_model=List[dict])
+async def get_recommendations(
+    user_id: str,
+    limit: int = Query(default=20, le=100),
+    languageLevel: Optional[str] = None,
+    visaType: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Recommend active jobs for a job seeker, best match first
+
+    Jobs whose language or visa requirement the seeker does not meet are
+    excluded when ``languageLevel`` / ``visaType`` are given.
+    """
+    statement = select(JobSeekerProfile).where(JobSeekerProfile.user_id == user_id)
+    profile = (await session.exec(statement)).first()
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    from app.services import recommendation  # numpy 는 첫 추천 요청 때 로드
+
+    ranked = await session.run_sync(
+        recommendation.recommend,
+        profile,
+        limit=limit,
+        language_level=languageLevel,
+        visa_type=visaType,
+    )
+    jobs = await session.run_sync(load_by_ids, Job, [job_id for job_id, _ in ranked])
+    ordered = [(jobs[job_id], score) for job_id, score in ranked if job_id in jobs]
+
+    result = await session.run_sync(hydrate_jobs, [job for job, _ in ordered])
+    for job_dict, (_, score) in zip(result, ordered):
+        job_dict["matchScore"] = round(score, 4)
+    return result
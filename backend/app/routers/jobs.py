@@ -1,16 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
-from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import insert
+from sqlmodel import Session, select, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Dict, Optional, List, Tuple, Union
 import json
 import uuid
+from datetime import datetime
 
-from app.db import get_session
-from app.models import Job, Employer, EmployerProfile, SignupUser
+from app.db import REPLICA_STICKY_SECONDS, get_read_session, get_session, is_replica, reads_pinned_to_primary
+from app.models import Job, JobVisa, Employer, EmployerProfile, SignupUser
 from app.schemas import JobCreateRequest, JobResponse
+from app.services.hydration import hydrate_jobs, serialize_job
+from app.services.http_cache import conditional_response, encode
+from app.services.serializers import JSONBytesResponse
+from app.services.job_filters import apply_job_filters, sync_job_visas
+from app.services.job_search import index_job, index_jobs, remove_job
+from app.services.job_import import iter_job_requests
+from app.services.pagination import after_desc, decode_cursor, split_page
+from app.services.geo import apply_near, geohash_for, haversine_km, parse_point, valid_point
+from app.services.cache import invalidate_job, job_detail_cache
+from app.services.child_tables import sync_employer_visas
+from app.services.view_counter import view_counter
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _recommender():
+    # numpy 기반 추천 엔진은 첫 사용 시 import (부팅 시간 단축)
+    from app.services import recommendation
+    return recommendation
+
+
 @router.get("", response_model=List[dict])
 async def list_jobs(
     query: Optional[str] = None,
@@ -20,55 +40,104 @@ async def list_jobs(
     visaType: Optional[str] = None,
     limit: int = Query(default=20, le=100),
     offset: int = 0,
-    session: Session = Depends(get_session),
+    cursor: Optional[str] = None,
+    near: Optional[str] = Query(default=None, description="lat,lng"),
+    radiusKm: float = Query(default=10, gt=0, le=200),
+    session: AsyncSession = Depends(get_read_session),
 ):
-    """List jobs with filters"""
-    statement = select(Job).offset(offset).limit(limit)
-    jobs = session.exec(statement).all()
+    """List jobs with filters
+
+    Feed order is newest first (postedAt DESC, id DESC). Pass the
+    ``X-Next-Cursor`` response header back as ``cursor`` to fetch the next page
+    with an index range scan instead of ``offset``. Search results (``query``)
+    are ordered by relevance and paginated with ``offset``.
+    
+    With ``near=lat,lng`` only jobs within ``radiusKm`` are returned, nearest
+    first, each with a ``distanceKm`` field.
+    """
+    statement = apply_job_filters(
+        select(Job),
+        query=query,
+        location=location,
+        industry=industry,
+        language_level=languageLevel,
+        visa_type=visaType,
+    )
     
-    # Get employer info for each job
-    result = []
-    for job in jobs:
-        employer_stmt = select(Employer).where(Employer.id == job.employerId)
-        employer = session.exec(employer_stmt).first()
-        
-        job_dict = job.dict()
-        job_dict["employer"] = employer.dict() if employer else {}
-        job_dict["requiredVisa"] = json.loads(job.requiredVisa)
-        result.append(job_dict)
+    if near:
+        try:
+            lat, lng = parse_point(near)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="near must be 'lat,lng'")
+        # geohash 셀 + 거리순 정렬/LIMIT 을 DB 에서 처리 (페이지 크기만큼만 로드)
+        statement = apply_near(statement, lat, lng, radiusKm).offset(offset).limit(limit)
+        jobs = (await session.exec(statement)).all()
+        result = await session.run_sync(hydrate_jobs, jobs)
+        for job_dict, job in zip(result, jobs):
+            job_dict["distanceKm"] = round(haversine_km(lat, lng, job.lat, job.lng), 3)
+        return JSONBytesResponse(result)
     
-    return result
+    if query:
+        jobs = (await session.exec(statement.offset(offset).limit(limit))).all()
+        return JSONBytesResponse(await session.run_sync(hydrate_jobs, jobs))
+    
+    if cursor:
+        try:
+            posted_at, last_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        statement = statement.where(after_desc(Job.postedAt, Job.id, posted_at, last_id))
+    else:
+        statement = statement.offset(offset)
+    
+    # ix_jobs_postedAt_id 로 정렬 + 범위 조회, 다음 페이지 여부 확인용으로 1건 더 조회
+    statement = statement.order_by(Job.postedAt.desc(), Job.id.desc()).limit(limit + 1)
+    jobs, next_cursor = split_page((await session.exec(statement)).all(), limit, "postedAt", "id")
+    
+    # Employers for the whole page are loaded with one IN (...) query
+    result = await session.run_sync(hydrate_jobs, jobs)
+    return JSONBytesResponse(result, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
 
 
 @router.get("/{job_id}", response_model=dict)
-async def get_job(job_id: str, session: Session = Depends(get_session)):
-    """Get single job detail"""
-    statement = select(Job).where(Job.id == job_id)
-    job = session.exec(statement).first()
+async def get_job(job_id: str, request: Request, session: AsyncSession = Depends(get_read_session)):
+    """Get single job detail (ETag / If-None-Match supported)"""
+    # 방금 쓴 클라이언트는 다른 워커의 캐시를 거치지 않고 primary 에서 읽음
+    cached = None if reads_pinned_to_primary() else job_detail_cache.get(job_id)
+    if cached is not None:
+        view_counter.bump(job_id)
+        return conditional_response(request, cached)
     
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    # Get employer
-    employer_stmt = select(Employer).where(Employer.id == job.employerId)
-    employer = session.exec(employer_stmt).first()
+    # Job and employer in a single joined query
+    statement = (
+        select(Job, Employer)
+        .outerjoin(Employer, Employer.id == Job.employerId)
+        .where(Job.id == job_id)
+    )
+    row = (await session.exec(statement)).first()
     
-    job_dict = job.dict()
-    job_dict["employer"] = employer.dict() if employer else {}
-    job_dict["requiredVisa"] = json.loads(job.requiredVisa)
+    if not row:
+        raise HTTPException(status_code=404, detail="Job not found")
     
-    return job_dict
+    job, employer = row
+    view_counter.bump(job_id)
+    # 인코딩된 body 와 ETag 를 함께 캐시
+    encoded = encode(serialize_job(job, employer))
+    # 수정 직후에는 복제본이 아직 이전 값일 수 있으므로 캐시에 넣지 않음
+    if not (is_replica(session) and job_detail_cache.invalidated_within(job_id, REPLICA_STICKY_SECONDS)):
+        job_detail_cache.set(job_id, encoded)
+    return conditional_response(request, encoded)
 
 
 @router.patch("/{job_id}/status")
 async def update_job_status(
     job_id: str, 
     status_data: dict,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Update job status (active, paused, closed)"""
     statement = select(Job).where(Job.id == job_id)
-    job = session.exec(statement).first()
+    job = (await session.exec(statement)).first()
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -79,23 +148,29 @@ async def update_job_status(
     
     job.status = new_status
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    await session.commit()
+    await session.refresh(job)
+    invalidate_job(job_id)
+    _recommender().upsert_job(job)
     
     return {"message": "Status updated successfully", "status": new_status}
 
 
 @router.delete("/{job_id}")
-async def delete_job(job_id: str, session: Session = Depends(get_session)):
+async def delete_job(job_id: str, session: AsyncSession = Depends(get_session)):
     """Delete a job posting"""
     statement = select(Job).where(Job.id == job_id)
-    job = session.exec(statement).first()
+    job = (await session.exec(statement)).first()
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    session.delete(job)
-    session.commit()
+    await session.exec(delete(JobVisa).where(JobVisa.jobId == job_id))
+    await session.run_sync(remove_job, job_id)
+    await session.delete(job)
+    await session.commit()
+    invalidate_job(job_id)
+    _recommender().remove_job(job_id)
     
     return {"message": "Job deleted successfully"}
 
@@ -104,11 +179,11 @@ async def delete_job(job_id: str, session: Session = Depends(get_session)):
 async def update_job(
     job_id: str,
     job_data: dict,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Update a job posting"""
     statement = select(Job).where(Job.id == job_id)
-    job = session.exec(statement).first()
+    job = (await session.exec(statement)).first()
     
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -134,21 +209,33 @@ async def update_job(
         job.requiredLanguage = job_data['required_language']
     if 'required_visa' in job_data:
         job.requiredVisa = json.dumps(job_data['required_visa'])
+        await session.run_sync(sync_job_visas, job)
     if 'benefits' in job_data:
         job.benefits = job_data['benefits']
     if 'employer_message' in job_data:
         job.employerMessage = job_data['employer_message']
+    if 'lat' in job_data and 'lng' in job_data:
+        lat, lng = job_data['lat'], job_data['lng']
+        if lat is not None and lng is not None and not (
+            isinstance(lat, (int, float)) and isinstance(lng, (int, float)) and valid_point(lat, lng)
+        ):
+            raise HTTPException(status_code=400, detail="lat must be -90..90 and lng -180..180")
+        job.lat = job_data['lat']
+        job.lng = job_data['lng']
+        job.geohash = geohash_for(job.lat, job.lng)
     
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    await session.run_sync(index_job, job, await session.get(Employer, job.employerId))
+    await session.commit()
+    await session.refresh(job)
+    invalidate_job(job_id)
+    _recommender().upsert_job(job)
     
     return {"message": "Job updated successfully", "job_id": job.id}
 
 
-@router.post("", response_model=JobResponse, status_code=201)
-async def create_job(request: JobCreateRequest, session: Session = Depends(get_session)):
-    """Create a new job posting"""
+def _get_or_create_employer(session: Session, request: JobCreateRequest) -> Employer:
+    """Resolve the legacy Employer row for an employer profile (flush, no commit)"""
     # Get EmployerProfile
     employer_profile = session.get(EmployerProfile, request.employer_profile_id)
     if not employer_profile:
@@ -176,13 +263,18 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
             minLanguageLevel=request.required_language,
             baseWage=request.wage,
             schedule=request.work_hours,
+            lat=request.lat,
+            lng=request.lng,
         )
         session.add(employer)
-        session.commit()
-        session.refresh(employer)
+        session.flush()
+        sync_employer_visas(session, employer)
     
-    # Create Job
-    from datetime import datetime
+    return employer
+
+
+def _build_job(request: JobCreateRequest, employer: Employer) -> Job:
+    """Build (but do not add) a Job from a create request"""
     job_id = f"job-{uuid.uuid4().hex[:8]}"
     current_time = datetime.utcnow().isoformat()
     
@@ -196,7 +288,12 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
         if len(parts) >= 2:
             location = f"{parts[0]} {parts[1]}"
     
-    job = Job(
+    # 근무지 좌표: 요청 값 > 고용주 좌표
+    lat, lng = request.lat, request.lng
+    if lat is None or lng is None:
+        lat, lng = employer.lat, employer.lng
+    
+    return Job(
         id=job_id,
         employerId=employer.id,
         title=request.title,
@@ -217,11 +314,24 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
         views=0,
         applications=0,
         location=location,
+        lat=lat,
+        lng=lng,
+        geohash=geohash_for(lat, lng),
     )
+
+
+@router.post("", response_model=JobResponse, status_code=201)
+async def create_job(request: JobCreateRequest, session: AsyncSession = Depends(get_session)):
+    """Create a new job posting"""
+    employer = await session.run_sync(_get_or_create_employer, request)
+    job = _build_job(request, employer)
     
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    await session.run_sync(sync_job_visas, job)
+    await session.run_sync(index_job, job, employer)
+    await session.commit()
+    await session.refresh(job)
+    _recommender().upsert_job(job)
     
     return JobResponse(
         id=job.id,
@@ -242,3 +352,94 @@ async def create_job(request: JobCreateRequest, session: Session = Depends(get_s
         employer=employer.dict(),
     )
 
+
+BULK_CHUNK_SIZE = 500
+
+
+def _insert_job_batch(
+    session: Session,
+    batch: List[Tuple[int, JobCreateRequest]],
+    employers: Dict[str, Union[Employer, str]],
+) -> List[dict]:
+    """Insert one chunk of bulk rows in a single transaction; returns per-row results"""
+    results = []
+    jobs: List[Tuple[int, Job, Employer]] = []
+    for row, request in batch:
+        # Employer 는 프로필당 한 번만 조회/생성
+        employer = employers.get(request.employer_profile_id)
+        if employer is None:
+            try:
+                employer = _get_or_create_employer(session, request)
+            except HTTPException as e:
+                employer = e.detail
+            employers[request.employer_profile_id] = employer
+        if isinstance(employer, str):
+            results.append({"row": row, "status": "error", "errors": [employer]})
+            continue
+        jobs.append((row, _build_job(request, employer), employer))
+    
+    if not jobs:
+        session.commit()
+        return results
+    
+    try:
+        session.execute(insert(Job.__table__), [job.dict() for _, job, _ in jobs])
+        visa_rows = [
+            {"jobId": job.id, "visaType": visa}
+            for _, job, _ in jobs
+            for visa in set(json.loads(job.requiredVisa))
+        ]
+        if visa_rows:
+            session.execute(insert(JobVisa.__table__), visa_rows)
+        index_jobs(session, [(job, employer) for _, job, employer in jobs])
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        # 롤백된 트랜잭션에서 생성한 Employer 는 무효
+        employers.clear()
+        results.extend({"row": row, "status": "error", "errors": [str(e)]} for row, _, _ in jobs)
+        return sorted(results, key=lambda r: r["row"])
+    
+    for row, job, _ in jobs:
+        _recommender().upsert_job(job)
+        results.append({"row": row, "status": "created", "id": job.id})
+    return sorted(results, key=lambda r: r["row"])
+
+
+@router.post("/bulk")
+async def bulk_create_jobs(
+    request: Request,
+    format: Optional[str] = Query(default=None, pattern="^(csv|ndjson)$"),
+    employer_profile_id: Optional[str] = None,
+    session: AsyncSession = Depends(get_session),
+):
+    """Bulk-create jobs from a streamed CSV or NDJSON request body
+
+    The body is parsed as it arrives; rows are validated against
+    JobCreateRequest and inserted in chunks of BULK_CHUNK_SIZE per transaction.
+    The format comes from ``format`` or the Content-Type (``text/csv`` /
+    ``application/x-ndjson``). Returns a summary and one result per row.
+    """
+    fmt = format or ("csv" if "csv" in request.headers.get("content-type", "") else "ndjson")
+    
+    employers: Dict[str, Union[Employer, str]] = {}
+    results: List[dict] = []
+    batch: List[Tuple[int, JobCreateRequest]] = []
+    
+    async for row, parsed in iter_job_requests(request.stream(), fmt, employer_profile_id):
+        if isinstance(parsed, list):
+            results.append({"row": row, "status": "error", "errors": parsed})
+            continue
+        batch.append((row, parsed))
+        if len(batch) >= BULK_CHUNK_SIZE:
+            results.extend(await session.run_sync(_insert_job_batch, batch, employers))
+            batch = []
+    if batch:
+        results.extend(await session.run_sync(_insert_job_batch, batch, employers))
+    
+    results.sort(key=lambda r: r["row"])
+    created = sum(1 for r in results if r["status"] == "created")
+    return {
+        "summary": {"created": created, "error": len(results) - created},
+        "results": results,
+    }
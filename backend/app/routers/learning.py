@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import get_session
 from app.models import LearningProgress
@@ -11,11 +12,11 @@ router = APIRouter(tags=["learning"])
 @router.get("/learning/summary", response_model=dict)
 async def get_learning_summary(
     seekerId: str = Query(...),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Get learning progress summary for a jobseeker"""
     statement = select(LearningProgress).where(LearningProgress.seekerId == seekerId)
-    progress = session.exec(statement).first()
+    progress = (await session.exec(statement)).first()
     
     if not progress:
         # Return default
@@ -33,19 +34,19 @@ async def get_learning_summary(
 @router.post("/leveltest")
 async def submit_level_test(
     request: LevelTestSubmit,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Submit level test answers"""
     # Process test and determine level
     # This is a placeholder implementation
     
     statement = select(LearningProgress).where(LearningProgress.seekerId == request.seekerId)
-    progress = session.exec(statement).first()
+    progress = (await session.exec(statement)).first()
     
     if progress:
         progress.currentLevel = "TOPIK 2급"
         session.add(progress)
-        session.commit()
+        await session.commit()
     
     return {"success": True, "level": "TOPIK 2급"}
 
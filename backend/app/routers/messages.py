@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional
 import uuid
 from datetime import datetime
@@ -7,6 +8,7 @@ from datetime import datetime
 from app.db import get_session
 from app.models import Message
 from app.schemas import MessageCreate, MessageRead
+from app.services.serializers import JSONBytesResponse, message_serializer
 
 router = APIRouter(tags=["messages"])
 
@@ -16,25 +18,25 @@ async def list_messages(
     conversation_id: str,
     cursor: Optional[str] = None,
     limit: int = Query(default=50, le=100),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """List messages in a conversation with pagination"""
     statement = select(Message).where(
         Message.conversationId == conversation_id
     ).order_by(Message.timestamp.desc()).limit(limit)
     
-    messages = session.exec(statement).all()
+    messages = (await session.exec(statement)).all()
     
-    return {
-        "messages": [msg.dict() for msg in reversed(messages)],
+    return JSONBytesResponse({
+        "messages": message_serializer.many(reversed(messages)),
         "nextCursor": None if len(messages) < limit else messages[-1].id
-    }
+    })
 
 
 @router.post("/messages", response_model=dict, status_code=201)
 async def send_message(
     request: MessageCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Send a new message"""
     message = Message(
@@ -45,8 +47,8 @@ async def send_message(
     )
     
     session.add(message)
-    session.commit()
-    session.refresh(message)
+    await session.commit()
+    await session.refresh(message)
     
     return message.dict()
 
@@ -54,18 +56,18 @@ async def send_message(
 @router.post("/messages/read")
 async def mark_message_read(
     request: MessageRead,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Mark message as read"""
     statement = select(Message).where(Message.id == request.messageId)
-    message = session.exec(statement).first()
+    message = (await session.exec(statement)).first()
     
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
     
     message.read = True
     session.add(message)
-    session.commit()
+    await session.commit()
     
     return {"success": True}
 
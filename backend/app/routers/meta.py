@@ -1,18 +1,26 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
+from app.db import get_read_session
 from app.models import Nationality
 from app.schemas import NationalityResponse
+from app.services.cache import meta_cache
+from app.services.http_cache import conditional_response, encode
 
 router = APIRouter(prefix="/meta", tags=["meta"])
 
 
 @router.get("/nationalities", response_model=list[NationalityResponse])
-async def get_nationalities(session: Session = Depends(get_session)):
-    """Get all nationalities"""
-    statement = select(Nationality)
-    nationalities = session.exec(statement).all()
-    return [NationalityResponse(code=n.code, name=n.name, phone_code=n.phone_code) for n in nationalities]
-
-
+async def get_nationalities(request: Request, session: AsyncSession = Depends(get_read_session)):
+    """Get all nationalities (ETag / If-None-Match supported)"""
+    encoded = meta_cache.get("nationalities")
+    if encoded is None:
+        statement = select(Nationality)
+        nationalities = (await session.exec(statement)).all()
+        encoded = encode([
+            NationalityResponse(code=n.code, name=n.name, phone_code=n.phone_code).model_dump()
+            for n in nationalities
+        ])
+        meta_cache.set("nationalities", encoded)
+    return conditional_response(request, encoded)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import get_session
 from app.models import Message
@@ -18,7 +19,7 @@ router = APIRouter(tags=["translate"])
 @router.post("/translate", response_model=TranslateResponse)
 async def translate_message(
     request: TranslateRequest,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     """Translate a message"""
     if not TRANSLATE_AVAILABLE:
@@ -32,11 +33,11 @@ async def translate_message(
     # Optionally save translation to database
     if request.messageId:
         statement = select(Message).where(Message.id == request.messageId)
-        message = session.exec(statement).first()
+        message = (await session.exec(statement)).first()
         if message:
             message.translatedText = translated
             session.add(message)
-            session.commit()
+            await session.commit()
     
     return TranslateResponse(translatedText=translated)
 
@@ -1,18 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 import json
 
-from app.db import get_session
+from app.db import get_read_session
 from app.models import JobSeeker, Employer
+from app.services.http_cache import conditional_response, encode
 
 router = APIRouter(tags=["users"])
 
 
 @router.get("/jobseekers/{seeker_id}", response_model=dict)
-async def get_jobseeker(seeker_id: str, session: Session = Depends(get_session)):
+async def get_jobseeker(seeker_id: str, session: AsyncSession = Depends(get_read_session)):
     """Get jobseeker profile"""
     statement = select(JobSeeker).where(JobSeeker.id == seeker_id)
-    seeker = session.exec(statement).first()
+    seeker = (await session.exec(statement)).first()
     
     if not seeker:
         raise HTTPException(status_code=404, detail="JobSeeker not found")
@@ -25,10 +27,14 @@ async def get_jobseeker(seeker_id: str, session: Session = Depends(get_session))
 
 
 @router.get("/employers/{employer_id}", response_model=dict)
-async def get_employer(employer_id: str, session: Session = Depends(get_session)):
-    """Get employer profile"""
+async def get_employer(
+    employer_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Get employer profile (ETag / If-None-Match supported)"""
     statement = select(Employer).where(Employer.id == employer_id)
-    employer = session.exec(statement).first()
+    employer = (await session.exec(statement)).first()
     
     if not employer:
         raise HTTPException(status_code=404, detail="Employer not found")
@@ -37,5 +43,5 @@ async def get_employer(employer_id: str, session: Session = Depends(get_session)
     employer_dict["media"] = json.loads(employer.media)
     employer_dict["needVisa"] = json.loads(employer.needVisa)
     
-    return employer_dict
+    return conditional_response(request, encode(employer_dict))
 
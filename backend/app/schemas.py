@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date, time
 
@@ -186,6 +186,8 @@ class JobCreateRequest(BaseModel):
     benefits: Optional[str] = None
     employer_message: Optional[str] = None
     status: Optional[str] = "active"  # 'active', 'paused', 'closed'
+    lat: Optional[float] = Field(default=None, ge=-90, le=90)  # 근무지 좌표 (없으면 고용주 좌표 사용)
+    lng: Optional[float] = Field(default=None, ge=-180, le=180)
 
 
 class JobResponse(BaseModel):
@@ -0,0 +1,93 @@
+"""
+Denormalized application counters on ``jobs``.
+
+``Job.applications`` (total) and the per-status ``appliedCount`` /
+``hiredCount`` / ``rejectedCount`` are maintained with atomic
+``SET col = col + n`` updates issued in the same transaction as the
+application write, so dashboards can read them without COUNT queries.
+
+``recount_all`` is the repair job: it recomputes every counter from a single
+``GROUP BY jobId, status`` query. Run it with::
+
+    python -m app.services.application_counters
+"""
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func, update
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Application, Job
+
+STATUS_COLUMNS = {
+    "applied": "appliedCount",
+    "hired": "hiredCount",
+    "rejected": "rejectedCount",
+}
+
+
+def record_application(session: Session, job_id: str, status: str = "applied") -> bool:
+    """Count a new application (no commit); False if the job does not exist"""
+    values = {"applications": Job.applications + 1}
+    column = STATUS_COLUMNS.get(status)
+    if column:
+        values[column] = getattr(Job, column) + 1
+    result = session.exec(update(Job).where(Job.id == job_id).values(**values))
+    return result.rowcount > 0
+
+
+def record_status_change(session: Session, job_id: str, old_status: str, new_status: Optional[str]):
+    """Move one application between status counters (no commit)
+
+    ``new_status=None`` removes the application from the counters entirely.
+    """
+    if old_status == new_status:
+        return
+    values = {}
+    old_column = STATUS_COLUMNS.get(old_status)
+    new_column = STATUS_COLUMNS.get(new_status)
+    if old_column:
+        values[old_column] = getattr(Job, old_column) - 1
+    if new_column:
+        values[new_column] = getattr(Job, new_column) + 1
+    if new_status is None:
+        values["applications"] = Job.applications - 1
+    if values:
+        session.exec(update(Job).where(Job.id == job_id).values(**values))
+
+
+def recount_all(session: Session) -> int:
+    """Recompute every job's counters with one GROUP BY; returns jobs updated"""
+    rows = session.exec(
+        select(Application.jobId, Application.status, func.count())
+        .group_by(Application.jobId, Application.status)
+    ).all()
+
+    counts: Dict[str, Dict[str, int]] = {}
+    for job_id, status, count in rows:
+        job_counts = counts.setdefault(
+            job_id, {"applications": 0, **{column: 0 for column in STATUS_COLUMNS.values()}}
+        )
+        job_counts["applications"] += count
+        column = STATUS_COLUMNS.get(status)
+        if column:
+            job_counts[column] += count
+
+    # 전체를 조건 없는 UPDATE 한 번으로 0 으로 초기화 (NOT IN 목록은 바인드 변수 한도를 넘을 수 있음)
+    reset = {"applications": 0, **{column: 0 for column in STATUS_COLUMNS.values()}}
+    session.exec(update(Job).values(**reset))
+
+    # 지원 내역이 있는 공고만 executemany 한 번으로 갱신 (같은 트랜잭션)
+    if counts:
+        session.connection().execute(
+            Job.__table__.update().where(Job.__table__.c.id == bindparam("job_id")),
+            [{"job_id": job_id, **values} for job_id, values in counts.items()],
+        )
+    session.commit()
+    return len(counts)
+
+
+if __name__ == "__main__":
+    with Session(engine) as session:
+        updated = recount_all(session)
+    print(f"Recounted application counters for {updated} jobs")
@@ -0,0 +1,168 @@
+"""
+Pub/sub backplane for WebSocket fan-out across workers.
+
+Every uvicorn worker only knows its own sockets. ``ConnectionManager.broadcast``
+therefore publishes each chat frame once to the backplane on channel
+``<prefix><conversation_id>``. Every worker that has local sockets in that
+conversation is subscribed to the channel and delivers the frame to those
+sockets only. The publishing worker also receives its own frame through the
+subscription, so there is a single delivery path and a single ordering.
+
+- ``InMemoryBackplane``: single-process default (no extra service needed)
+- ``RedisBackplane``: Redis PUBLISH / SUBSCRIBE, selected with
+  ``WS_BACKPLANE_URL=redis://host:6379/0``; any server speaking the Redis
+  pub/sub protocol works (see ``check_ws_backplane.py`` for a local stand-in)
+"""
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional, Set
+
+from app.services.serializers import dumps, loads
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+WS_BACKPLANE_URL = os.getenv("WS_BACKPLANE_URL", "")
+WS_CHANNEL_PREFIX = os.getenv("WS_CHANNEL_PREFIX", "chat:")
+
+# (message, conversation_id) -> 이 워커의 소켓으로 전달 (ConnectionManager.send_message)
+Deliver = Callable[[dict, str], Awaitable[None]]
+
+
+class Backplane(ABC):
+    """Publish chat frames to every worker subscribed to a conversation"""
+
+    def __init__(self, prefix: str = WS_CHANNEL_PREFIX):
+        self.prefix = prefix
+        self.published = 0
+        self.received = 0
+        self._deliver: Optional[Deliver] = None
+        self._channels: Set[str] = set()
+
+    async def start(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def publish(self, conversation_id: str, message: dict):
+        ...
+
+    @abstractmethod
+    async def subscribe(self, conversation_id: str):
+        """Called when the first local socket joins ``conversation_id``"""
+
+    @abstractmethod
+    async def unsubscribe(self, conversation_id: str):
+        """Called when the last local socket leaves ``conversation_id``"""
+
+    async def _dispatch(self, conversation_id: str, message: dict):
+        self.received += 1
+        if self._deliver is not None:
+            await self._deliver(message, conversation_id)
+
+    def stats(self) -> dict:
+        return {
+            "backplane": self.__class__.__name__,
+            "published": self.published,
+            "received": self.received,
+            "channels": len(self._channels),
+        }
+
+
+class InMemoryBackplane(Backplane):
+    """Single-worker backplane: publish delivers straight to the local subscribers"""
+
+    async def publish(self, conversation_id: str, message: dict):
+        self.published += 1
+        if conversation_id in self._channels:
+            await self._dispatch(conversation_id, message)
+
+    async def subscribe(self, conversation_id: str):
+        self._channels.add(conversation_id)
+
+    async def unsubscribe(self, conversation_id: str):
+        self._channels.discard(conversation_id)
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub backplane (one subscriber connection per worker)"""
+
+    def __init__(self, url: str, prefix: str = WS_CHANNEL_PREFIX):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("WS_BACKPLANE_URL is set but the 'redis' package is not installed")
+        super().__init__(prefix)
+        self.url = url
+        self._redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        # pubsub 는 구독이 하나도 없으면 읽을 커넥션이 없음
+        self._has_channels = asyncio.Event()
+
+    async def start(self, deliver: Deliver):
+        await super().start(deliver)
+        self._redis = aioredis.from_url(self.url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def publish(self, conversation_id: str, message: dict):
+        self.published += 1
+        await self._redis.publish(self.prefix + conversation_id, dumps(message))
+
+    async def subscribe(self, conversation_id: str):
+        self._channels.add(conversation_id)
+        await self._pubsub.subscribe(self.prefix + conversation_id)
+        self._has_channels.set()
+
+    async def unsubscribe(self, conversation_id: str):
+        self._channels.discard(conversation_id)
+        await self._pubsub.unsubscribe(self.prefix + conversation_id)
+        if not self._channels:
+            self._has_channels.clear()
+
+    async def _read(self):
+        while True:
+            await self._has_channels.wait()
+            try:
+                item = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 연결 끊김 등: 잠시 후 재시도 (redis-py 가 재연결하며 구독을 복구)
+                print(f"[ws] backplane read failed: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if item is None or item.get("type") != "message":
+                continue
+            channel = item["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            try:
+                await self._dispatch(channel[len(self.prefix):], loads(item["data"]))
+            except Exception as e:
+                print(f"[ws] backplane delivery failed on {channel}: {e}")
+
+
+def create_backplane(url: str = WS_BACKPLANE_URL) -> Backplane:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackplane(url)
+    if url:
+        raise ValueError(f"Unsupported WS_BACKPLANE_URL: {url}")
+    return InMemoryBackplane()
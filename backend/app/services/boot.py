@@ -0,0 +1,135 @@
+"""
+Startup tasks and boot-phase timings.
+
+Every worker used to run ``create_all``, the column/index upgrade, seeding and
+the child-table / search-index backfills on boot. They are idempotent, but on
+a large database they cost a few hundred ms per worker and autoscale event.
+
+After a full boot the fingerprint of the model schema (DDL of every table and
+index, plus ``BOOT_TASKS_VERSION``) is stored in ``app_meta``. With
+``FAST_START=1`` (default) a worker that finds the same fingerprint skips the
+schema/seed work (it still checks the conversation_participants triggers);
+``FAST_START=0`` always runs it. Bump ``BOOT_TASKS_VERSION``
+when a seed or data backfill changes without a schema change.
+
+Phase timings are printed at startup and served at ``/health/boot``.
+"""
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel import Session, SQLModel
+
+from app.db import create_db_and_tables, engine
+from app.models import AppMeta
+
+FAST_START = os.getenv("FAST_START", "1") == "1"
+BOOT_TASKS_VERSION = 2
+SCHEMA_VERSION_KEY = "schema_version"
+
+
+class BootTimer:
+    """Wall-clock time of each startup phase (ms)"""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.mode = "full"
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    def report(self) -> dict:
+        return {
+            "mode": self.mode,
+            "phases": {name: round(ms, 1) for name, ms in self.phases.items()},
+            "totalMs": round((time.perf_counter() - self.started) * 1000, 1),
+        }
+
+    def log(self):
+        report = self.report()
+        phases = " ".join(f"{name}={ms:.1f}ms" for name, ms in report["phases"].items())
+        print(f"[boot] mode={report['mode']} {phases} total={report['totalMs']:.1f}ms")
+
+
+# 마지막 부팅 결과 (/health/boot)
+last_boot: Dict[str, object] = {}
+
+
+def schema_fingerprint() -> str:
+    """Hash of the DDL the models would emit for the current dialect"""
+    dialect = engine.dialect
+    ddl = []
+    for table in SQLModel.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    ddl.append(f"boot-tasks:{BOOT_TASKS_VERSION}")
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()[:16]
+
+
+def stored_fingerprint() -> Optional[str]:
+    try:
+        with Session(engine) as session:
+            row = session.get(AppMeta, SCHEMA_VERSION_KEY)
+    except exc.DBAPIError:
+        # app_meta 테이블이 없음 (첫 부팅)
+        return None
+    return row.value if row else None
+
+
+def mark_schema_current(fingerprint: str):
+    with Session(engine) as session:
+        session.merge(AppMeta(
+            key=SCHEMA_VERSION_KEY,
+            value=fingerprint,
+            updatedAt=datetime.utcnow().isoformat(),
+        ))
+        session.commit()
+
+
+def run_boot_tasks(timer: BootTimer):
+    """Schema upgrade, seed and backfills; skipped when the stored marker matches"""
+    from app.services.child_tables import backfill_child_tables, ensure_participant_triggers
+    from app.services.job_search import ensure_search_index
+
+    with timer.phase("schema_check"):
+        fingerprint = schema_fingerprint()
+        stored = stored_fingerprint() if FAST_START else None
+
+    if stored == fingerprint:
+        timer.mode = "fast"
+        with timer.phase("triggers"):
+            # 트리거가 없으면 (권한 없음 등) conversation_participants 를 보충
+            if not ensure_participant_triggers():
+                backfill_child_tables()
+        with timer.phase("search_index"):
+            ensure_search_index(backfill=False)
+        return
+
+    from app.seed import seed_nationalities
+    from app.services.job_filters import backfill_job_posted_at, backfill_job_visas
+
+    with timer.phase("create_tables"):
+        create_db_and_tables()
+    with timer.phase("seed"):
+        seed_nationalities()
+    with timer.phase("triggers"):
+        ensure_participant_triggers()
+    with timer.phase("backfill"):
+        backfill_job_posted_at()
+        backfill_job_visas()
+        backfill_child_tables()
+    with timer.phase("search_index"):
+        ensure_search_index()
+    mark_schema_current(fingerprint)
@@ -0,0 +1,110 @@
+"""
+In-process LRU + TTL cache.
+
+Writers drop the entries they make stale with ``invalidate``; the time of the
+last invalidation per key is kept so readers can avoid refilling an entry from
+a replica that may not have the write yet (``invalidated_within``). Hit / miss /
+eviction / expiration counters are kept for sizing (see ``GET /health/cache``).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after ``ttl`` seconds"""
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 60.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # key -> 마지막 invalidate 시각 (monotonic, 최대 maxsize 개)
+        self._invalidated: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._invalidated[key] = time.monotonic()
+            self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self.maxsize:
+                self._invalidated.popitem(last=False)
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidated_within(self, key: Hashable, seconds: float) -> bool:
+        with self._lock:
+            invalidated_at = self._invalidated.get(key)
+        return invalidated_at is not None and time.monotonic() - invalidated_at < seconds
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._invalidated.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttlSeconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+# GET /jobs/{job_id} 응답 (job + employer) 캐시
+job_detail_cache = TTLCache(
+    "job_detail",
+    maxsize=int(os.getenv("JOB_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("JOB_CACHE_TTL", "60")),
+)
+
+
+# 국적 목록 등 거의 바뀌지 않는 메타 데이터 응답 캐시
+meta_cache = TTLCache(
+    "meta",
+    maxsize=16,
+    ttl=float(os.getenv("META_CACHE_TTL", "300")),
+)
+
+
+def invalidate_job(job_id: str):
+    """Drop the cached detail payload of one job"""
+    job_detail_cache.invalidate(job_id)
@@ -0,0 +1,167 @@
+"""
+Write-behind persistence for chat messages sent over WebSocket.
+
+``websocket_endpoint`` assigns the message id and timestamp, broadcasts the
+frame right away and hands the row to ``chat_writer``. A background task
+started in the app lifespan drains the queue in batches: one multi-row
+``INSERT INTO messages`` plus one ``UPDATE conversations SET updatedAt = CASE
+id ... END`` per batch, in a single transaction. Only after that commit is the
+sender sent ``{"type": "ack", "id": ..., "clientId": ...}``, so an ack always
+means the message is stored.
+
+If a batch fails (e.g. a conversation id that does not exist on MySQL), its
+rows are retried one by one so a single bad row does not take the others
+down; rows that still fail are answered with ``{"type": "error"}`` instead
+of an ack. The lifespan shutdown hook writes whatever is still queued.
+"""
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy import case, insert, update
+from sqlmodel import Session
+
+from app.db import engine
+from app.models import Conversation, Message
+
+BATCH_SIZE = int(os.getenv("CHAT_WRITE_BATCH_SIZE", "200"))
+# 첫 메시지 이후 배치를 모으기 위해 기다리는 최대 시간
+BATCH_WAIT = float(os.getenv("CHAT_WRITE_BATCH_WAIT_MS", "5")) / 1000
+QUEUE_SIZE = int(os.getenv("CHAT_WRITE_QUEUE_SIZE", "10000"))
+
+# (응답 프레임) -> 보낸 소켓으로 전달 (Connection.offer)
+Reply = Callable[[dict], None]
+
+
+def _summary(error: Exception) -> str:
+    # SQLAlchemy 오류 메시지에서 SQL/파라미터 부분 제외
+    return str(error).splitlines()[0]
+
+
+@dataclass
+class PendingMessage:
+    row: dict
+    client_id: Optional[str] = None
+    reply: Optional[Reply] = None
+
+    def ack(self):
+        if self.reply is not None:
+            self.reply({"type": "ack", "id": self.row["id"], "clientId": self.client_id,
+                        "conversationId": self.row["conversationId"], "timestamp": self.row["timestamp"]})
+
+    def fail(self, error: str):
+        if self.reply is not None:
+            self.reply({"type": "error", "id": self.row["id"], "clientId": self.client_id, "detail": error})
+
+
+class ChatWriter:
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_batch = 0
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        return self._queue
+
+    async def submit(self, row: dict, client_id: Optional[str] = None, reply: Optional[Reply] = None):
+        """Queue one ``messages`` row; waits only when the queue is full (backpressure)"""
+        await self.queue.put(PendingMessage(row, client_id, reply))
+
+    def _take_batch(self, batch: List[PendingMessage]):
+        while len(batch) < BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+    def _insert(self, rows: List[dict]):
+        """One transaction: multi-row INSERT + updatedAt of every touched conversation"""
+        updated = {}
+        for row in rows:
+            updated[row["conversationId"]] = max(row["timestamp"], updated.get(row["conversationId"], ""))
+        with Session(engine) as session:
+            session.exec(insert(Message).values(rows))
+            session.exec(
+                update(Conversation)
+                .where(Conversation.id.in_(list(updated)))
+                .values(updatedAt=case(updated, value=Conversation.id, else_=Conversation.updatedAt))
+            )
+            session.commit()
+
+    def _write(self, batch: List[PendingMessage]) -> List[Optional[str]]:
+        """Persist a batch; returns an error per message (None = stored)"""
+        try:
+            self._insert([pending.row for pending in batch])
+            return [None] * len(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                return [_summary(e)]
+        # 배치 실패: 한 행씩 다시 시도해서 문제 있는 행만 실패 처리
+        errors = []
+        for pending in batch:
+            try:
+                self._insert([pending.row])
+                errors.append(None)
+            except Exception as e:
+                errors.append(_summary(e))
+        return errors
+
+    async def flush(self) -> int:
+        """Write everything currently queued; returns messages stored"""
+        stored = 0
+        while not self.queue.empty():
+            batch: List[PendingMessage] = []
+            self._take_batch(batch)
+            stored += await self._write_batch(batch)
+        return stored
+
+    async def _write_batch(self, batch: List[PendingMessage]) -> int:
+        errors = await asyncio.to_thread(self._write, batch)
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(batch))
+        stored = 0
+        for pending, error in zip(batch, errors):
+            if error is None:
+                stored += 1
+                pending.ack()
+            else:
+                self.failed += 1
+                print(f"[chat] message {pending.row['id']} not stored: {error}")
+                pending.fail("message could not be stored")
+        self.written += stored
+        return stored
+
+    async def run(self):
+        """Batch writer (started from the app lifespan)"""
+        while True:
+            batch = [await self.queue.get()]
+            self._take_batch(batch)
+            if len(batch) < BATCH_SIZE and BATCH_WAIT > 0:
+                # 짧게 기다려 동시에 들어오는 메시지를 같은 배치로 묶음
+                await asyncio.sleep(BATCH_WAIT)
+                self._take_batch(batch)
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # _write 자체는 예외를 삼키므로 여기는 예상 밖 오류
+                print(f"[chat] batch write failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "avgBatch": round(self.written / self.batches, 1) if self.batches else 0.0,
+            "maxBatch": self.max_batch,
+        }
+
+
+chat_writer = ChatWriter()
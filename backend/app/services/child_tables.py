@@ -0,0 +1,252 @@
+"""
+Child tables mirroring JSON-string list columns.
+
+The JSON columns stay the source for API payloads; every list element is also
+stored as one row of a child table so membership queries are index lookups
+instead of ``json.loads`` over every row:
+
+- ``Conversation.participants``                -> ``conversation_participants``
+- ``Employer.needVisa``                        -> ``employer_visas``
+- ``JobSeekerProfile.preferred_regions`` /
+  ``preferred_jobs`` / ``work_days_of_week``   -> ``job_seeker_preferences``
+- ``Job.requiredVisa``                         -> ``job_visas`` (app/services/job_filters.py)
+
+Employers and job seeker profiles are only written by this app, so those
+writers call the ``sync_*`` helper in the same transaction as the parent
+update. Conversations are created outside the app (no route writes them), so
+``conversation_participants`` is kept in sync by DB triggers on
+``conversations`` (``ensure_participant_triggers``, also in schema.sql).
+
+``backfill_child_tables`` fills child rows for parents that have none (rows
+written before the tables / triggers existed); it runs at startup and can
+rebuild every table with::
+
+    python -m app.services.child_tables
+"""
+import json
+from typing import List
+
+from sqlalchemy import insert, text
+from sqlmodel import Session, delete, select
+
+from app.db import engine
+from app.models import (
+    Conversation,
+    ConversationParticipant,
+    Employer,
+    EmployerVisa,
+    JobSeekerPreference,
+    JobSeekerProfile,
+)
+
+# job_seeker_preferences.kind -> JobSeekerProfile 컬럼
+PREFERENCE_COLUMNS = {
+    "region": "preferred_regions",
+    "job": "preferred_jobs",
+    "day": "work_days_of_week",
+}
+
+
+def _values(raw: str) -> List[str]:
+    """JSON list string -> unique non-empty string values (order kept)"""
+    try:
+        values = json.loads(raw or "[]")
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(values, list):
+        return []
+    return list(dict.fromkeys(str(v) for v in values if v not in (None, "")))
+
+
+def _participant_rows(conversation: Conversation) -> List[dict]:
+    return [
+        {"conversationId": conversation.id, "userId": user_id}
+        for user_id in _values(conversation.participants)
+    ]
+
+
+def _employer_visa_rows(employer: Employer) -> List[dict]:
+    return [{"employerId": employer.id, "visaType": visa} for visa in _values(employer.needVisa)]
+
+
+def _preference_rows(profile: JobSeekerProfile) -> List[dict]:
+    return [
+        {"profileId": profile.id, "kind": kind, "value": value}
+        for kind, column in PREFERENCE_COLUMNS.items()
+        for value in _values(getattr(profile, column))
+    ]
+
+
+def _replace(session: Session, model, where, rows: List[dict]):
+    session.exec(delete(model).where(where))
+    if rows:
+        session.execute(insert(model.__table__), rows)
+
+
+def sync_conversation_participants(session: Session, conversation: Conversation):
+    """Rewrite conversation_participants from ``participants`` (no commit)"""
+    _replace(
+        session,
+        ConversationParticipant,
+        ConversationParticipant.conversationId == conversation.id,
+        _participant_rows(conversation),
+    )
+
+
+def sync_employer_visas(session: Session, employer: Employer):
+    """Rewrite employer_visas from ``needVisa`` (no commit)"""
+    _replace(session, EmployerVisa, EmployerVisa.employerId == employer.id, _employer_visa_rows(employer))
+
+
+def sync_profile_preferences(session: Session, profile: JobSeekerProfile):
+    """Rewrite job_seeker_preferences from the profile's JSON lists (no commit)"""
+    _replace(
+        session,
+        JobSeekerPreference,
+        JobSeekerPreference.profileId == profile.id,
+        _preference_rows(profile),
+    )
+
+
+# conversations.participants -> conversation_participants 트리거 (이름 -> DDL)
+_SQLITE_PARTICIPANTS = (
+    "SELECT NEW.id, CAST(value AS TEXT) FROM json_each("
+    "CASE WHEN json_valid(NEW.participants) AND json_type(NEW.participants) = 'array' "
+    "THEN NEW.participants ELSE '[]' END) "
+    "WHERE value IS NOT NULL AND value <> ''"
+)
+_MYSQL_PARTICIPANTS = (
+    "SELECT NEW.id, jt.userId FROM JSON_TABLE("
+    "IF(JSON_VALID(NEW.participants), NEW.participants, '[]'), "
+    "'$[*]' COLUMNS (userId VARCHAR(50) PATH '$')) AS jt "
+    "WHERE jt.userId IS NOT NULL AND jt.userId <> ''"
+)
+PARTICIPANT_TRIGGERS = {
+    "sqlite": {
+        "trg_conversations_participants_insert": (
+            "CREATE TRIGGER trg_conversations_participants_insert AFTER INSERT ON conversations BEGIN "
+            f"INSERT OR IGNORE INTO conversation_participants (conversationId, userId) {_SQLITE_PARTICIPANTS}; "
+            "END"
+        ),
+        "trg_conversations_participants_update": (
+            "CREATE TRIGGER trg_conversations_participants_update "
+            "AFTER UPDATE OF id, participants ON conversations BEGIN "
+            "DELETE FROM conversation_participants WHERE conversationId = OLD.id; "
+            f"INSERT OR IGNORE INTO conversation_participants (conversationId, userId) {_SQLITE_PARTICIPANTS}; "
+            "END"
+        ),
+        # SQLite 는 외래키 CASCADE 가 꺼져 있으므로 삭제도 트리거로 처리
+        "trg_conversations_participants_delete": (
+            "CREATE TRIGGER trg_conversations_participants_delete AFTER DELETE ON conversations BEGIN "
+            "DELETE FROM conversation_participants WHERE conversationId = OLD.id; "
+            "END"
+        ),
+    },
+    "mysql": {
+        "trg_conversations_participants_insert": (
+            "CREATE TRIGGER trg_conversations_participants_insert AFTER INSERT ON conversations FOR EACH ROW "
+            f"INSERT IGNORE INTO conversation_participants (conversationId, userId) {_MYSQL_PARTICIPANTS}"
+        ),
+        "trg_conversations_participants_update": (
+            "CREATE TRIGGER trg_conversations_participants_update AFTER UPDATE ON conversations FOR EACH ROW BEGIN "
+            "IF NOT (OLD.id <=> NEW.id AND OLD.participants <=> NEW.participants) THEN "
+            "DELETE FROM conversation_participants WHERE conversationId = OLD.id; "
+            f"INSERT IGNORE INTO conversation_participants (conversationId, userId) {_MYSQL_PARTICIPANTS}; "
+            "END IF; "
+            "END"
+        ),
+    },
+}
+
+
+def _existing_triggers(session: Session, dialect: str) -> set:
+    if dialect == "sqlite":
+        statement = text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'conversations'")
+    else:
+        statement = text(
+            "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS "
+            "WHERE TRIGGER_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE = 'conversations'"
+        )
+    return {row[0] for row in session.exec(statement)}
+
+
+def ensure_participant_triggers() -> bool:
+    """Create the conversations -> conversation_participants triggers if missing
+
+    Returns False when they could not be created (e.g. no TRIGGER privilege on
+    MySQL); the caller then has to rely on ``backfill_child_tables``.
+    """
+    triggers = PARTICIPANT_TRIGGERS.get(engine.dialect.name)
+    if not triggers:
+        print(f"Warning: no conversation_participants triggers for {engine.dialect.name}")
+        return False
+    with Session(engine) as session:
+        missing = [name for name in triggers if name not in _existing_triggers(session, engine.dialect.name)]
+        for name in missing:
+            try:
+                session.exec(text(triggers[name]))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                # 다른 워커가 먼저 만든 경우
+                if name in _existing_triggers(session, engine.dialect.name):
+                    continue
+                print(f"Warning: could not create trigger {name} ({str(e).splitlines()[0]})")
+                return False
+    if missing:
+        print(f"Created {len(missing)} conversation_participants triggers")
+    return True
+
+
+def _migrate(session: Session, child, parents, to_rows, force: bool, has_rows) -> int:
+    """Insert child rows for parents that have none (``force``: rebuild the table)"""
+    if force:
+        session.exec(delete(child))
+    else:
+        parents = parents.where(~has_rows)
+    rows = [row for parent in session.exec(parents) for row in to_rows(parent)]
+    if rows:
+        session.execute(insert(child.__table__), rows)
+    return len(rows)
+
+
+def backfill_child_tables(force: bool = False):
+    """Add child rows for parents without any (``force`` rebuilds every table)"""
+    with Session(engine) as session:
+        migrated = {
+            "conversation_participants": _migrate(
+                session,
+                ConversationParticipant,
+                select(Conversation).where(Conversation.participants != "[]"),
+                _participant_rows,
+                force,
+                select(ConversationParticipant)
+                .where(ConversationParticipant.conversationId == Conversation.id)
+                .exists(),
+            ),
+            "employer_visas": _migrate(
+                session,
+                EmployerVisa,
+                select(Employer).where(Employer.needVisa != "[]"),
+                _employer_visa_rows,
+                force,
+                select(EmployerVisa).where(EmployerVisa.employerId == Employer.id).exists(),
+            ),
+            "job_seeker_preferences": _migrate(
+                session,
+                JobSeekerPreference,
+                select(JobSeekerProfile),
+                _preference_rows,
+                force,
+                select(JobSeekerPreference).where(JobSeekerPreference.profileId == JobSeekerProfile.id).exists(),
+            ),
+        }
+        session.commit()
+    for table, count in migrated.items():
+        if count:
+            print(f"Backfilled {count} rows into {table}")
+    return migrated
+
+
+if __name__ == "__main__":
+    backfill_child_tables(force=True)
@@ -0,0 +1,151 @@
+"""
+Response compression (brotli / gzip) with a size threshold.
+
+Bodies smaller than ``COMPRESSION_MIN_SIZE`` bytes are sent as-is, because
+the framing overhead and CPU cost outweigh the savings on tiny JSON payloads.
+brotli is preferred when the client accepts it and the ``brotli`` package is
+installed; otherwise gzip is used.
+
+Streaming responses (``more_body``) are compressed chunk by chunk with a sync
+flush so each chunk still reaches the client immediately. A strong ETag on
+a compressed response gets an encoding suffix (``"<hash>-gzip"``), because
+the compressed bytes are a different representation; ``app.services.http_cache``
+strips the suffix again when it compares ``If-None-Match``.
+"""
+import os
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))  # 0-11, 동적 응답은 4~5 가 적당
+
+_COMPRESSIBLE = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """'br' / 'gzip' / None from an Accept-Encoding header (q=0 means refused)"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    candidates = (("br",) if BROTLI_AVAILABLE else ()) + ("gzip",)
+    for encoding in candidates:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31 = gzip header
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.finish()
+        return self._gzip.compress(data) + self._gzip.flush()
+
+
+def _compressible(headers: Headers) -> bool:
+    return (
+        "content-encoding" not in headers
+        and headers.get("content-type", "").startswith(_COMPRESSIBLE)
+    )
+
+
+def _add_vary(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing text/JSON responses of ``minimum_size`` bytes or more"""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start: dict = {}
+        state = {"compressor": None, "passthrough": False}
+
+        async def send_compressed(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            if state["passthrough"]:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            compressor: Optional[_Compressor] = state["compressor"]
+
+            if compressor is None:
+                # 첫 body 메시지에서 압축 여부 결정
+                headers = MutableHeaders(raw=start.setdefault("headers", []))
+                compressible = start["status"] not in (204, 304) and _compressible(headers)
+                if compressible:
+                    _add_vary(headers)
+                if not compressible or encoding is None or (not more_body and len(body) < self.minimum_size):
+                    state["passthrough"] = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = state["compressor"] = _Compressor(encoding)
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and etag.endswith('"') and not etag.startswith("W/"):
+                    headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+                if more_body:
+                    del headers["content-length"]
+                    await send(start)
+                else:
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+            data = compressor.chunk(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
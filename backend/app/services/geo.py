@@ -0,0 +1,153 @@
+"""
+Geospatial helpers for radius search.
+
+Jobs store ``lat``/``lng`` plus a precision-6 geohash (``Job.geohash``, ~1.2km x
+0.6km cells, indexed). A radius query:
+
+1. picks a coarser geohash precision whose cells are at least as tall as the
+   radius and collects the few cells covering the search bounding box,
+2. prefilters with index range scans on those geohash prefixes and a lat/lng
+   bounding box,
+3. filters and orders the candidates by their exact great-circle distance in
+   SQL (``haversine_km()`` registered on every SQLite connection in app.db,
+   ``ST_Distance_Sphere`` on MySQL) and applies OFFSET/LIMIT there, so a page
+   costs ``limit`` rows in Python instead of the whole radius population and
+   never contains a job farther than the radius.
+"""
+import math
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlmodel import or_
+
+from app.db import engine
+from app.models import Job
+
+GEOHASH_PRECISION = 6
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base32 geohash of a point"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit, ch, even = 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            rng[0] = mid
+        else:
+            ch = ch << 1
+            rng[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[ch])
+            bit, ch = 0, 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """(height, width) of a geohash cell in degrees"""
+    bits = precision * 5
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in kilometers"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def sql_haversine_km(lat1, lng1, lat2, lng2) -> Optional[float]:
+    """``haversine_km()`` SQL function (NULL in, NULL out)"""
+    if lat1 is None or lng1 is None or lat2 is None or lng2 is None:
+        return None
+    return haversine_km(lat1, lng1, lat2, lng2)
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) enclosing the search circle"""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    dlng = min(180.0, math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)))
+    return max(-90.0, lat - dlat), min(90.0, lat + dlat), max(-180.0, lng - dlng), min(180.0, lng + dlng)
+
+
+def covering_cells(lat: float, lng: float, radius_km: float) -> List[str]:
+    """Geohash prefixes whose cells together cover the search bounding box"""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    radius_deg = max_lat - min_lat
+
+    # 셀 높이가 검색 반경(위도 범위의 절반) 이상인 가장 세밀한 precision 선택 → 셀 수 최대 ~9개
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        if _cell_size(p)[0] * 2 >= radius_deg:
+            precision = p
+            break
+
+    height, width = _cell_size(precision)
+    cells = set()
+    lat_steps = int((max_lat - min_lat) / height) + 2
+    lng_steps = int((max_lng - min_lng) / width) + 2
+    for i in range(lat_steps):
+        cell_lat = min(max_lat, min_lat + i * height)
+        for j in range(lng_steps):
+            cell_lng = min(max_lng, min_lng + j * width)
+            cells.add(geohash_encode(cell_lat, cell_lng, precision))
+    return sorted(cells)
+
+
+def valid_point(lat: float, lng: float) -> bool:
+    return -90 <= lat <= 90 and -180 <= lng <= 180
+
+
+def parse_point(value: str) -> Tuple[float, float]:
+    """Parse 'lat,lng' (ValueError if malformed or out of range)"""
+    lat_str, lng_str = value.split(",")
+    lat, lng = float(lat_str), float(lng_str)
+    if not valid_point(lat, lng):
+        raise ValueError("Coordinates out of range")
+    return lat, lng
+
+
+def distance_km(lat: float, lng: float):
+    """SQL expression: great-circle distance (km) from the point to Job.lat/lng"""
+    if engine.dialect.name == "mysql":
+        # POINT(x=경도, y=위도), 반지름을 haversine_km 과 같게 지정
+        return func.ST_Distance_Sphere(
+            func.point(Job.lng, Job.lat), func.point(lng, lat), EARTH_RADIUS_KM * 1000
+        ) / 1000
+    return func.haversine_km(Job.lat, Job.lng, lat, lng)
+
+
+def apply_near(statement, lat: float, lng: float, radius_km: float):
+    """Restrict ``statement`` (a select over Job) to the radius, nearest first"""
+    cells = covering_cells(lat, lng, radius_km)
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    # geohash prefix 범위 조회 (ix_jobs_geohash)
+    cell_ranges = [(Job.geohash >= cell) & (Job.geohash < cell + "~") for cell in cells]
+    distance = distance_km(lat, lng)
+    return statement.where(
+        or_(*cell_ranges),
+        Job.lat.between(min_lat, max_lat),
+        Job.lng.between(min_lng, max_lng),
+        distance <= radius_km,
+    ).order_by(distance, Job.id)
+
+
+def geohash_for(lat: Optional[float], lng: Optional[float]) -> Optional[str]:
+    """Geohash stored on Job rows (None when the position is unknown)"""
+    if lat is None or lng is None:
+        return None
+    return geohash_encode(lat, lng)
@@ -0,0 +1,98 @@
+"""
+Conditional GET for catalog endpoints (ETag / Last-Modified -> 304).
+
+The tables have no version column, so a response's strong ETag is a hash of
+its encoded body. Any change to a row the payload is built from changes the
+tag, and the same rows produce the same tag on every worker and replica. The
+body and the tag are computed once and cached together (``EncodedBody``), so a
+revalidation hit costs a header comparison.
+
+``If-None-Match`` uses the weak comparison required by RFC 9110, and ignores
+the ``-gzip`` / ``-br`` suffix that ``CompressionMiddleware`` appends to the
+tag of a compressed representation. ``If-Modified-Since`` is only consulted
+when the request has no ``If-None-Match``.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import Request
+from starlette.responses import Response
+
+from app.services.serializers import dumps
+
+# CompressionMiddleware 가 압축한 응답의 ETag 접미사 ('"<hash>-gzip"')
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+class EncodedBody(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: Optional[str] = None  # HTTP-date
+
+
+def etag_for(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """naive datetime 은 UTC 로 간주"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def encode(content: Any, last_modified: Optional[datetime] = None) -> EncodedBody:
+    body = dumps(content)
+    return EncodedBody(body, etag_for(body), http_date(last_modified) if last_modified else None)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(tag) == target for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, encoded: EncodedBody) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, encoded.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and encoded.last_modified:
+        try:
+            return parsedate_to_datetime(encoded.last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_response(
+    request: Request,
+    encoded: EncodedBody,
+    cache_control: str = "no-cache",
+) -> Response:
+    """200 with the cached body, or 304 when the client's copy is current
+
+    ``no-cache`` lets clients keep the body but makes them revalidate on
+    every use, which is what the ETag is for.
+    """
+    headers = {"ETag": encoded.etag, "Cache-Control": cache_control}
+    if encoded.last_modified:
+        headers["Last-Modified"] = encoded.last_modified
+    if not_modified(request, encoded):
+        return Response(status_code=304, headers=headers)
+    return Response(encoded.body, media_type="application/json", headers=headers)
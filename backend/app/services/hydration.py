@@ -0,0 +1,49 @@
+"""
+Batched hydration helpers.
+
+Routers that return a page of rows together with related records should load
+the related records with a single ``IN (...)`` query instead of one query per
+row (N+1).
+"""
+from typing import Dict, Iterable, List, Optional, Type, TypeVar
+
+from sqlmodel import Session, SQLModel, select
+
+from app.models import Job, Employer
+from app.services.serializers import employer_serializer, job_serializer
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+def load_by_ids(
+    session: Session,
+    model: Type[ModelT],
+    ids: Iterable[str],
+    key: str = "id",
+) -> Dict[str, ModelT]:
+    """Load rows of ``model`` whose ``key`` column is in ``ids`` with one query"""
+    unique_ids = {i for i in ids if i is not None}
+    if not unique_ids:
+        return {}
+
+    column = getattr(model, key)
+    statement = select(model).where(column.in_(unique_ids))
+    return {getattr(row, key): row for row in session.exec(statement).all()}
+
+
+def load_employers(session: Session, employer_ids: Iterable[str]) -> Dict[str, Employer]:
+    """Load employers by id in a single query"""
+    return load_by_ids(session, Employer, employer_ids)
+
+
+def serialize_job(job: Job, employer: Optional[Employer]) -> dict:
+    """Build the job payload returned by the jobs API"""
+    job_dict = job_serializer.to_dict(job)
+    job_dict["employer"] = employer_serializer.to_dict(employer) if employer else {}
+    return job_dict
+
+
+def hydrate_jobs(session: Session, jobs: List[Job]) -> List[dict]:
+    """Serialize a page of jobs with their employers (1 extra query per page)"""
+    employers = load_employers(session, (job.employerId for job in jobs))
+    return [serialize_job(job, employers.get(job.employerId)) for job in jobs]
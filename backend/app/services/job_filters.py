@@ -0,0 +1,123 @@
+"""
+Job filter engine.
+
+Every filter accepted by ``GET /jobs`` is translated into a SQL predicate so the
+database (not the client) narrows the result set. Each predicate is written so
+it can be served by an index:
+
+- query         -> full-text search (see app/services/job_search.py)
+- location      -> prefix range on ``jobs.location``      (ix_jobs_location)
+- industry      -> equality on ``jobs.category``          (ix_jobs_category)
+- languageLevel -> ``IN`` over ``jobs.requiredLanguage``  (ix_jobs_requiredLanguage)
+- visaType      -> semi-join on ``job_visas``             (ix_job_visas_visaType_jobId)
+"""
+import json
+import re
+from typing import List, Optional
+
+from sqlalchemy import func, update
+from sqlmodel import Session, delete, select
+
+from app.db import engine
+from app.models import Job, JobVisa
+from app.services.job_search import apply_search
+
+# 언어 레벨 표기 (프론트엔드 / 레거시 데이터에서 사용하는 값)
+LANGUAGE_LEVEL_LABELS = {
+    1: ["Lv.1", "Lv.1 기초", "TOPIK 1급"],
+    2: ["Lv.2", "Lv.2 초급", "TOPIK 2급"],
+    3: ["Lv.3", "Lv.3 중급", "TOPIK 3급"],
+    4: ["Lv.4", "Lv.4 상급", "TOPIK 4급"],
+    5: ["TOPIK 5급"],
+    6: ["TOPIK 6급"],
+}
+
+_LEVEL_RE = re.compile(r"(\d+)")
+
+
+def language_level_rank(level: str) -> Optional[int]:
+    """Extract the numeric rank from a level label ('Lv.2 초급' -> 2)"""
+    match = _LEVEL_RE.search(level or "")
+    return int(match.group(1)) if match else None
+
+
+def acceptable_language_levels(level: str) -> List[str]:
+    """Labels of every requirement a seeker with ``level`` satisfies"""
+    rank = language_level_rank(level)
+    if rank is None:
+        return [level]
+    labels = []
+    for r, names in LANGUAGE_LEVEL_LABELS.items():
+        if r <= rank:
+            labels.extend(names)
+    return labels
+
+
+def _prefix(column, value: str):
+    """Index-friendly prefix match (``col >= v AND col < v || U+FFFF``)"""
+    return (column >= value) & (column < value + "\uffff")
+
+
+def apply_job_filters(
+    statement,
+    query: Optional[str] = None,
+    location: Optional[str] = None,
+    industry: Optional[str] = None,
+    language_level: Optional[str] = None,
+    visa_type: Optional[str] = None,
+):
+    """Push the /jobs filters into ``statement`` as SQL predicates"""
+    if query:
+        statement = apply_search(statement, query)
+    if location:
+        statement = statement.where(_prefix(Job.location, location.strip()))
+    if industry:
+        statement = statement.where(Job.category == industry)
+    if language_level:
+        statement = statement.where(
+            Job.requiredLanguage.in_(acceptable_language_levels(language_level))
+        )
+    if visa_type:
+        visa_jobs = select(JobVisa.jobId).where(JobVisa.visaType == visa_type)
+        statement = statement.where(Job.id.in_(visa_jobs))
+    return statement
+
+
+def sync_job_visas(session: Session, job: Job):
+    """Rewrite the job_visas rows of ``job`` from its requiredVisa JSON (no commit)"""
+    session.exec(delete(JobVisa).where(JobVisa.jobId == job.id))
+    visas = set(json.loads(job.requiredVisa or "[]"))
+    for visa in visas:
+        session.add(JobVisa(jobId=job.id, visaType=visa))
+
+
+def backfill_job_posted_at():
+    """Fill NULL Job.postedAt with createdAt
+
+    postedAt is the keyset pagination key of the job feed; a NULL never
+    satisfies ``postedAt < :cursor``, so such rows (and everything after them)
+    were unreachable with cursors. Existing SQLite tables keep the nullable
+    column, so this runs on every full boot.
+    """
+    with Session(engine) as session:
+        result = session.exec(
+            update(Job).where(Job.postedAt.is_(None)).values(postedAt=func.coalesce(Job.createdAt, ""))
+        )
+        session.commit()
+    if result.rowcount:
+        print(f"Backfilled postedAt for {result.rowcount} jobs")
+
+
+def backfill_job_visas():
+    """Populate job_visas for jobs created before the table existed"""
+    with Session(engine) as session:
+        existing = session.exec(select(JobVisa)).first()
+        if existing:
+            return
+
+        jobs = session.exec(select(Job).where(Job.requiredVisa != "[]")).all()
+        for job in jobs:
+            sync_job_visas(session, job)
+        session.commit()
+        if jobs:
+            print(f"Backfilled job_visas for {len(jobs)} jobs")
@@ -0,0 +1,101 @@
+"""
+Streaming parser for bulk job imports (CSV or NDJSON).
+
+The request body is consumed chunk by chunk and turned into
+``(row_number, JobCreateRequest | error)`` items, so a large upload is never
+held in memory as a whole.
+
+CSV columns use the ``JobCreateRequest`` field names. ``required_visa`` may be a
+JSON array or a ``|`` / ``,`` separated list. Rows may omit
+``employer_profile_id`` when it is passed as a query parameter.
+"""
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from app.schemas import JobCreateRequest
+
+ParsedRow = Tuple[int, Union[JobCreateRequest, List[str]]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into text lines (UTF-8, BOM tolerant)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def _iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, str]]:
+    header: Optional[List[str]] = None
+    pending = ""
+    async for line in lines:
+        pending = f"{pending}\n{line}" if pending else line
+        # 따옴표 안의 줄바꿈이면 다음 줄과 합쳐서 한 레코드로 파싱
+        if pending.count('"') % 2:
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        yield {k: v for k, v in zip(header, values) if v != ""}
+
+
+async def _iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Union[dict, str]]:
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield f"Invalid JSON: {e}"
+            continue
+        yield record if isinstance(record, dict) else "Each line must be a JSON object"
+
+
+def _normalize(record: dict, employer_profile_id: Optional[str]) -> dict:
+    if employer_profile_id and not record.get("employer_profile_id"):
+        record["employer_profile_id"] = employer_profile_id
+    visas = record.get("required_visa")
+    if isinstance(visas, str):
+        visas = visas.strip()
+        if visas.startswith("["):
+            record["required_visa"] = json.loads(visas)
+        else:
+            separator = "|" if "|" in visas else ","
+            record["required_visa"] = [v.strip() for v in visas.split(separator) if v.strip()]
+    return record
+
+
+async def iter_job_requests(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    employer_profile_id: Optional[str] = None,
+) -> AsyncIterator[ParsedRow]:
+    """Yield validated JobCreateRequest objects (or error messages) row by row"""
+    lines = iter_lines(chunks)
+    records = _iter_csv_records(lines) if fmt == "csv" else _iter_ndjson_records(lines)
+    row = 0
+    async for record in records:
+        row += 1
+        if isinstance(record, str):
+            yield row, [record]
+            continue
+        try:
+            yield row, JobCreateRequest(**_normalize(record, employer_profile_id))
+        except ValidationError as e:
+            yield row, [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()]
+        except ValueError as e:
+            yield row, [str(e)]
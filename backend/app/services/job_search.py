@@ -0,0 +1,188 @@
+"""
+Full-text job search (title, description, category, employer shopName).
+
+- SQLite: ``jobs_fts`` FTS5 table. Documents and queries are tokenized into
+  character bigrams here in Python so Korean substrings ("바리스타" -> "바리",
+  "리스", "스타") hit without a dedicated tokenizer. Ranked with bm25().
+- MySQL: FULLTEXT ``WITH PARSER ngram`` indexes declared on the models
+  (``ft_jobs_search`` / ``ft_employers_shopName``), queried in BOOLEAN MODE and
+  ranked by MATCH() relevance.
+
+If FTS5 is not compiled into the local SQLite, search falls back to LIKE.
+"""
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, String, text
+from sqlalchemy.dialects.mysql import match
+from sqlmodel import Session, or_, select
+
+from app.db import engine
+from app.models import Job, Employer
+
+# bm25 가중치: title, category, shopName, description
+_BM25_WEIGHTS = "10.0, 5.0, 5.0, 1.0"
+_WORD_RE = re.compile(r"\w+")
+
+FTS_AVAILABLE = False
+
+
+def ngram_tokens(value: Optional[str], n: int = 2) -> List[str]:
+    """Split text into lowercase words and each word into character n-grams"""
+    tokens = []
+    for word in _WORD_RE.findall((value or "").lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def _ngram_text(value: Optional[str]) -> str:
+    return " ".join(ngram_tokens(value))
+
+
+def _fts5_query(query: str) -> str:
+    """Build an FTS5 MATCH expression: every bigram must match (implicit AND)"""
+    terms = []
+    for word in _WORD_RE.findall(query.lower()):
+        if len(word) == 1:
+            # 한 글자 검색어는 bigram 앞글자 prefix 로 매칭
+            terms.append(f'"{word}"*')
+        else:
+            terms.extend(f'"{token}"' for token in ngram_tokens(word))
+    return " ".join(terms)
+
+
+def _boolean_query(query: str) -> str:
+    """Build a MySQL BOOLEAN MODE expression: every word as a required phrase"""
+    return " ".join(f'+"{word}"' for word in _WORD_RE.findall(query))
+
+
+def ensure_search_index(backfill: bool = True):
+    """Create the SQLite FTS5 table and index existing jobs on first run
+
+    ``backfill=False`` only (re)detects FTS5 support, for boots where the
+    schema marker says the index is already populated.
+    """
+    global FTS_AVAILABLE
+    if engine.dialect.name != "sqlite":
+        # MySQL FULLTEXT 인덱스는 create_all / schema.sql 에서 생성됨
+        FTS_AVAILABLE = engine.dialect.name == "mysql"
+        return
+
+    with Session(engine) as session:
+        try:
+            session.exec(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+                "jobId UNINDEXED, title, category, shopName, description, "
+                "tokenize='unicode61')"
+            ))
+        except Exception as e:
+            print(f"Warning: FTS5 not available, job search falls back to LIKE ({e})")
+            FTS_AVAILABLE = False
+            return
+        FTS_AVAILABLE = True
+        if not backfill:
+            return
+
+        indexed = session.exec(text("SELECT count(*) FROM jobs_fts")).one()[0]
+        if indexed:
+            return
+
+        rows = session.exec(
+            select(Job, Employer).outerjoin(Employer, Employer.id == Job.employerId)
+        ).all()
+        for job, employer in rows:
+            index_job(session, job, employer)
+        session.commit()
+        if rows:
+            print(f"Indexed {len(rows)} jobs for full-text search")
+
+
+def index_job(session: Session, job: Job, employer: Optional[Employer]):
+    """(Re)index one job in the SQLite FTS table (no commit)"""
+    if not FTS_AVAILABLE or engine.dialect.name != "sqlite":
+        return
+    remove_job(session, job.id)
+    session.exec(
+        text(
+            "INSERT INTO jobs_fts (jobId, title, category, shopName, description) "
+            "VALUES (:jobId, :title, :category, :shopName, :description)"
+        ),
+        params={
+            "jobId": job.id,
+            "title": _ngram_text(job.title),
+            "category": _ngram_text(job.category),
+            "shopName": _ngram_text(employer.shopName if employer else None),
+            "description": _ngram_text(job.description),
+        },
+    )
+
+
+def index_jobs(session: Session, jobs: List[Tuple[Job, Optional[Employer]]]):
+    """Index newly inserted jobs in one executemany (no commit)"""
+    if not FTS_AVAILABLE or engine.dialect.name != "sqlite" or not jobs:
+        return
+    session.connection().execute(
+        text(
+            "INSERT INTO jobs_fts (jobId, title, category, shopName, description) "
+            "VALUES (:jobId, :title, :category, :shopName, :description)"
+        ),
+        [
+            {
+                "jobId": job.id,
+                "title": _ngram_text(job.title),
+                "category": _ngram_text(job.category),
+                "shopName": _ngram_text(employer.shopName if employer else None),
+                "description": _ngram_text(job.description),
+            }
+            for job, employer in jobs
+        ],
+    )
+
+
+def remove_job(session: Session, job_id: str):
+    """Drop one job from the SQLite FTS table (no commit)"""
+    if not FTS_AVAILABLE or engine.dialect.name != "sqlite":
+        return
+    session.exec(text("DELETE FROM jobs_fts WHERE jobId = :jobId"), params={"jobId": job_id})
+
+
+def apply_search(statement, query: str):
+    """Restrict ``statement`` (a select over Job) to matches, best first"""
+    if not _WORD_RE.search(query):
+        return statement
+
+    if not FTS_AVAILABLE:
+        shop_hits = select(Employer.id).where(Employer.shopName.contains(query))
+        return statement.where(
+            or_(
+                Job.title.contains(query),
+                Job.description.contains(query),
+                Job.category.contains(query),
+                Job.employerId.in_(shop_hits),
+            )
+        )
+
+    if engine.dialect.name == "sqlite":
+        hits = (
+            text(
+                f"SELECT jobId, bm25(jobs_fts, 0.0, {_BM25_WEIGHTS}) AS score "
+                "FROM jobs_fts WHERE jobs_fts MATCH :q"
+            )
+            .bindparams(q=_fts5_query(query))
+            .columns(jobId=String, score=Float)
+            .subquery("fts_hits")
+        )
+        # bm25() 는 값이 작을수록 관련도가 높음
+        return statement.join(hits, hits.c.jobId == Job.id).order_by(hits.c.score, Job.id)
+
+    against = _boolean_query(query)
+    job_match = match(Job.title, Job.description, Job.category, against=against).in_boolean_mode()
+    shop_hits = select(Employer.id).where(
+        match(Employer.shopName, against=against).in_boolean_mode()
+    )
+    return statement.where(
+        or_(job_match > 0, Job.employerId.in_(shop_hits))
+    ).order_by(job_match.desc(), Job.id)
@@ -0,0 +1,50 @@
+"""
+Opaque keyset (cursor) pagination helpers.
+
+A cursor encodes the sort key of the last row of a page. The next page is
+"rows strictly after that key", which the database answers with an index range
+scan instead of scanning and discarding ``offset`` rows.
+"""
+import base64
+import json
+from typing import List, Optional, Tuple
+
+from sqlmodel import and_, or_
+
+
+def encode_cursor(*values) -> str:
+    """Encode sort-key values into an opaque URL-safe cursor"""
+    raw = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List:
+    """Decode a cursor produced by ``encode_cursor`` (ValueError if malformed)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def after_desc(primary, tiebreak, primary_value, tiebreak_value):
+    """Rows after (primary_value, tiebreak_value) in ``primary DESC, tiebreak DESC`` order"""
+    return or_(
+        primary < primary_value,
+        and_(primary == primary_value, tiebreak < tiebreak_value),
+    )
+
+
+def split_page(rows: List, limit: int, *keys: str) -> Tuple[List, Optional[str]]:
+    """Trim rows fetched with ``LIMIT limit + 1`` and build the next cursor
+
+    Returns ``(page, nextCursor)``; nextCursor is None on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(*(getattr(last, key) for key in keys))
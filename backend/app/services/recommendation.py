@@ -0,0 +1,361 @@
+"""
+Vectorized job recommendation engine.
+
+Every job is kept as one row of fixed-width NumPy feature arrays (region code,
+category code, work-day bitmask, work hours, language rank, visa flags). A
+seeker profile is scored against all rows at once and the top-k is taken with
+``argpartition``; no per-job Python loop runs on the request path.
+
+The matrix is built from the database on first use and updated incrementally
+by the jobs router (``upsert_job`` / ``remove_job``). Each worker keeps its own
+copy, so it is also fully rebuilt every ``RECOMMENDER_REBUILD_SECONDS`` to pick
+up writes handled by other workers. That rebuild runs in a background thread
+into a new matrix object, which replaces ``matrix`` in one assignment once it
+is complete; requests keep scoring the previous matrix meanwhile. Upserts and
+removes that arrive during the rebuild are replayed on the new matrix.
+"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.db import engine
+from app.models import Job, JobSeekerProfile
+from app.services.job_filters import language_level_rank
+
+REBUILD_SECONDS = int(os.getenv("RECOMMENDER_REBUILD_SECONDS", "300"))
+
+# 점수 가중치 (합계 1.0)
+WEIGHTS = {"region": 0.3, "category": 0.3, "days": 0.2, "hours": 0.2}
+
+_DAY_NAMES = {
+    "월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6,
+    "MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6,
+}
+_DAY_RE = re.compile(r"MON|TUE|WED|THU|FRI|SAT|SUN|[월화수목금토일]", re.IGNORECASE)
+_RANGE_RE = re.compile(r"(MON|TUE|WED|THU|FRI|SAT|SUN|[월화수목금토일])\s*[~\-]\s*(MON|TUE|WED|THU|FRI|SAT|SUN|[월화수목금토일])", re.IGNORECASE)
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_REGION_SUFFIXES = ("특별자치시", "특별자치도", "특별시", "광역시", "도", "시")
+# 7-bit 요일 마스크의 popcount 룩업 테이블
+_POPCOUNT = np.array([bin(i).count("1") for i in range(128)], dtype=np.float32)
+
+# 온보딩 희망 직종 id ↔ 라벨 (PreferredJobStep)
+PREFERRED_JOB_LABELS = {
+    "store": "매장관리 · 판매",
+    "service": "서비스",
+    "serving": "서빙",
+    "kitchen": "주방",
+    "labor": "단순노무 · 분류 · 택배",
+    "delivery": "배달 · 운송 · 운전",
+    "event": "행사 · 스텝 · 미디어",
+    "office": "사무 · 회계 · 관리",
+    "sales": "영업 · 마케팅",
+}
+
+
+def normalize_region(value: Optional[str]) -> Optional[str]:
+    """'서울특별시 종로구' / '서울 종로구' / '서울' -> '서울'"""
+    if not value or not value.split():
+        return None
+    region = value.split()[0]
+    for suffix in _REGION_SUFFIXES:
+        if region.endswith(suffix) and len(region) > len(suffix) + 1:
+            return region[: -len(suffix)]
+    return region
+
+
+def parse_days(value: Optional[str]) -> int:
+    """Work-day text ('월,화,수', 'MON-FRI', '평일') -> 7-bit mask (bit 0 = Monday)"""
+    if not value:
+        return 0
+    text = value.upper()
+    mask = 0
+    if "평일" in text:
+        mask |= 0b0011111
+    if "주말" in text:
+        mask |= 0b1100000
+    for start, end in _RANGE_RE.findall(text):
+        a, b = _DAY_NAMES[start.upper()], _DAY_NAMES[end.upper()]
+        for day in range(a, (b if b >= a else b + 7) + 1):
+            mask |= 1 << (day % 7)
+    for day in _DAY_RE.findall(text):
+        mask |= 1 << _DAY_NAMES[day.upper()]
+    return mask
+
+
+def parse_hours(value: Optional[str]) -> Tuple[int, int]:
+    """'09:00-18:00' -> (540, 1080) minutes; overnight shifts end after 1440; (-1, -1) if unknown"""
+    times = _TIME_RE.findall(value or "")
+    if len(times) < 2:
+        return -1, -1
+    start = int(times[0][0]) * 60 + int(times[0][1])
+    end = int(times[1][0]) * 60 + int(times[1][1])
+    if end <= start:
+        end += 24 * 60
+    return start, end
+
+
+class JobFeatureMatrix:
+    """Column-oriented feature store for all jobs, updated in place"""
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._reset(capacity)
+
+    def _reset(self, capacity: int):
+        self.job_ids: List[Optional[str]] = [None] * capacity
+        self.rows: Dict[str, int] = {}
+        self.free: List[int] = []
+        self.size = 0
+        self.region_vocab: Dict[str, int] = {}
+        self.category_vocab: Dict[str, int] = {}
+        self.visa_vocab: Dict[str, int] = {}
+        self.active = np.zeros(capacity, dtype=bool)
+        self.region = np.full(capacity, -1, dtype=np.int32)
+        self.category = np.full(capacity, -1, dtype=np.int32)
+        self.days = np.zeros(capacity, dtype=np.uint8)
+        self.start = np.full(capacity, -1, dtype=np.int16)
+        self.end = np.full(capacity, -1, dtype=np.int16)
+        self.lang_rank = np.zeros(capacity, dtype=np.int8)
+        self.any_visa = np.ones(capacity, dtype=bool)
+        self.visas = np.zeros((capacity, 16), dtype=bool)
+        self.built_at = 0.0
+
+    def _grow(self):
+        capacity = len(self.job_ids) * 2
+        self.job_ids.extend([None] * (capacity - len(self.job_ids)))
+        for name in ("active", "region", "category", "days", "start", "end", "lang_rank", "any_visa"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            new[len(old):] = {"region": -1, "category": -1, "start": -1, "end": -1, "any_visa": True}.get(name, 0)
+            setattr(self, name, new)
+        visas = np.zeros((capacity, self.visas.shape[1]), dtype=bool)
+        visas[: len(self.visas)] = self.visas
+        self.visas = visas
+
+    def _visa_code(self, visa: str) -> int:
+        code = self.visa_vocab.setdefault(visa, len(self.visa_vocab))
+        if code >= self.visas.shape[1]:
+            visas = np.zeros((self.visas.shape[0], self.visas.shape[1] * 2), dtype=bool)
+            visas[:, : self.visas.shape[1]] = self.visas
+            self.visas = visas
+        return code
+
+    def _write(self, row: int, job: Job):
+        region = normalize_region(job.location)
+        start, end = parse_hours(job.workHours)
+        visas = json.loads(job.requiredVisa or "[]")
+        self.active[row] = job.status == "active"
+        self.region[row] = self.region_vocab.setdefault(region, len(self.region_vocab)) if region else -1
+        self.category[row] = self.category_vocab.setdefault(job.category, len(self.category_vocab)) if job.category else -1
+        self.days[row] = parse_days(job.workDays)
+        self.start[row], self.end[row] = start, end
+        self.lang_rank[row] = language_level_rank(job.requiredLanguage) or 0
+        self.any_visa[row] = not visas
+        codes = [self._visa_code(v) for v in visas]
+        self.visas[row] = False
+        self.visas[row, codes] = True
+
+    def upsert(self, job: Job):
+        with self._lock:
+            row = self.rows.get(job.id)
+            if row is None:
+                if self.free:
+                    row = self.free.pop()
+                else:
+                    if self.size == len(self.job_ids):
+                        self._grow()
+                    row = self.size
+                    self.size += 1
+                self.rows[job.id] = row
+                self.job_ids[row] = job.id
+            self._write(row, job)
+
+    def remove(self, job_id: str):
+        with self._lock:
+            row = self.rows.pop(job_id, None)
+            if row is None:
+                return
+            self.job_ids[row] = None
+            self.active[row] = False
+            self.free.append(row)
+
+    @classmethod
+    def build(cls, jobs: List[Job]) -> "JobFeatureMatrix":
+        """New matrix holding ``jobs`` (the live one is never reset in place)"""
+        built = cls(max(1024, len(jobs) * 2))
+        for job in jobs:
+            built.upsert(job)
+        built.built_at = time.monotonic()
+        return built
+
+    def score(
+        self,
+        regions: List[str],
+        categories: List[str],
+        days_mask: int,
+        start: int,
+        end: int,
+        lang_rank: Optional[int],
+        visa: Optional[str],
+    ) -> np.ndarray:
+        """Score every row (ineligible / inactive rows get -inf)"""
+        n = self.size
+        region_codes = [self.region_vocab[r] for r in regions if r in self.region_vocab]
+        category_codes = [self.category_vocab[c] for c in categories if c in self.category_vocab]
+
+        scores = np.zeros(n, dtype=np.float32)
+        if regions:
+            scores += WEIGHTS["region"] * np.isin(self.region[:n], region_codes)
+        else:
+            scores += WEIGHTS["region"]
+        if categories:
+            scores += WEIGHTS["category"] * np.isin(self.category[:n], category_codes)
+        else:
+            scores += WEIGHTS["category"]
+
+        # 요일: 공고 근무 요일 중 구직자가 가능한 요일 비율
+        job_days = self.days[:n]
+        if days_mask:
+            total = _POPCOUNT[job_days]
+            matched = _POPCOUNT[job_days & days_mask]
+            scores += WEIGHTS["days"] * np.where(total > 0, matched / np.maximum(total, 1), 0.5)
+        else:
+            scores += WEIGHTS["days"]
+
+        # 시간: 공고 근무 시간 중 구직자 가능 시간과 겹치는 비율
+        job_start = self.start[:n].astype(np.int32)
+        job_end = self.end[:n].astype(np.int32)
+        if start >= 0:
+            overlap = np.clip(np.minimum(job_end, end) - np.maximum(job_start, start), 0, None)
+            length = job_end - job_start
+            scores += WEIGHTS["hours"] * np.where(length > 0, overlap / np.maximum(length, 1), 0.5)
+        else:
+            scores += WEIGHTS["hours"]
+
+        eligible = self.active[:n].copy()
+        if lang_rank is not None:
+            eligible &= self.lang_rank[:n] <= lang_rank
+        if visa is not None:
+            accepts = self.any_visa[:n].copy()
+            if visa in self.visa_vocab:
+                accepts |= self.visas[:n, self.visa_vocab[visa]]
+            eligible &= accepts
+        return np.where(eligible, scores, -np.inf)
+
+    def top_k(self, scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Best ``k`` (job_id, score) pairs, highest first"""
+        valid = np.flatnonzero(np.isfinite(scores))
+        if valid.size == 0:
+            return []
+        k = min(k, valid.size)
+        candidates = valid[np.argpartition(-scores[valid], k - 1)[:k]]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.job_ids[i], float(scores[i])) for i in ordered]
+
+
+matrix = JobFeatureMatrix()
+
+# 재빌드 중 들어온 upsert/remove (새 matrix 에 다시 적용), None 이면 재빌드 중 아님
+_pending: Optional[List[Tuple[str, object]]] = None
+_swap_lock = threading.Lock()
+_first_build_lock = threading.Lock()
+
+
+def rebuild(session: Optional[Session] = None):
+    """Build a fresh matrix from the database and swap it in"""
+    global matrix, _pending
+    with _swap_lock:
+        if _pending is not None:
+            return  # 다른 스레드가 재빌드 중
+        _pending = []
+    try:
+        if session is None:
+            with Session(engine) as own_session:
+                jobs = own_session.exec(select(Job)).all()
+        else:
+            jobs = session.exec(select(Job)).all()
+        built = JobFeatureMatrix.build(jobs)
+    except Exception:
+        with _swap_lock:
+            _pending = None
+        raise
+    with _swap_lock:
+        for op, arg in _pending:
+            getattr(built, op)(arg)
+        _pending = None
+        matrix = built
+
+
+def _rebuild_in_background():
+    try:
+        rebuild()
+    except Exception as e:
+        print(f"[recommendation] rebuild failed: {e}")
+
+
+def _ensure_fresh(session: Session):
+    if not matrix.built_at:
+        # 첫 빌드만 요청 경로에서 (점수를 매길 matrix 가 없음), 동시 요청은 완료까지 대기
+        with _first_build_lock:
+            if not matrix.built_at:
+                rebuild(session)
+        return
+    if time.monotonic() - matrix.built_at >= REBUILD_SECONDS and _pending is None:
+        threading.Thread(target=_rebuild_in_background, name="recommender-rebuild", daemon=True).start()
+
+
+def upsert_job(job: Job):
+    """Reflect a created/updated job in the matrix (no-op before first build)"""
+    with _swap_lock:
+        if _pending is not None:
+            _pending.append(("upsert", job))
+        if matrix.built_at:
+            matrix.upsert(job)
+
+
+def remove_job(job_id: str):
+    """Drop a deleted job from the matrix"""
+    with _swap_lock:
+        if _pending is not None:
+            _pending.append(("remove", job_id))
+        if matrix.built_at:
+            matrix.remove(job_id)
+
+
+def recommend(
+    session: Session,
+    profile: JobSeekerProfile,
+    limit: int = 20,
+    language_level: Optional[str] = None,
+    visa_type: Optional[str] = None,
+) -> List[Tuple[str, float]]:
+    """Top ``limit`` (job_id, score) for a job seeker profile"""
+    _ensure_fresh(session)
+
+    regions = [r for r in (normalize_region(v) for v in json.loads(profile.preferred_regions or "[]")) if r]
+    categories = []
+    for job in json.loads(profile.preferred_jobs or "[]"):
+        categories.append(job)
+        if job in PREFERRED_JOB_LABELS:
+            categories.append(PREFERRED_JOB_LABELS[job])
+    days_mask = parse_days(",".join(json.loads(profile.work_days_of_week or "[]")))
+    start, end = parse_hours(f"{profile.work_start_time or ''}-{profile.work_end_time or ''}")
+
+    current = matrix  # 재빌드로 교체되어도 이 요청은 같은 matrix 로 계산
+    scores = current.score(
+        regions,
+        categories,
+        days_mask,
+        start,
+        end,
+        language_level_rank(language_level) if language_level else None,
+        visa_type,
+    )
+    return current.top_k(scores, limit)
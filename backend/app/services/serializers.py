@@ -0,0 +1,105 @@
+"""
+Fast JSON path for list endpoints.
+
+Returning ``List[dict]`` from a route makes FastAPI validate the list against
+the response model, walk it again with ``jsonable_encoder`` and finally encode
+it with ``json.dumps``; building the dicts with ``model.dict()`` adds one more
+pass through pydantic per row.
+
+``ModelSerializer`` compiles, once per model, a plain function that copies
+the columns of a row into a dict (decoding JSON-string columns on the way),
+and ``JSONBytesResponse`` encodes the result with orjson in a single pass.
+Routes that return a ``JSONBytesResponse`` skip FastAPI's validation and
+encoding; ``response_model`` is then only used for the OpenAPI docs.
+
+orjson is optional: without it the same output is produced with ``json``.
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Type
+
+from fastapi.responses import JSONResponse
+from sqlmodel import SQLModel
+
+from app.models import Application, Conversation, Employer, Job, Message
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(raw):
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    # Starlette JSONResponse 와 같은 형식
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class JSONBytesResponse(JSONResponse):
+    """JSONResponse encoded with orjson (no FastAPI validation / jsonable_encoder pass)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ModelSerializer:
+    """Precompiled row -> dict converter for one SQLModel class
+
+    ``json_fields`` hold JSON strings in the database and are decoded into
+    lists/objects, like the routers did with ``json.loads``.
+    """
+
+    def __init__(self, model: Type[SQLModel], json_fields: Sequence[str] = ()):
+        self.model = model
+        self.fields = list(model.model_fields)
+        unknown = set(json_fields) - set(self.fields)
+        if unknown:
+            raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+
+        # 로드된 컬럼 값은 인스턴스 __dict__ 에 있으므로 descriptor 를 거치지 않고 읽고,
+        # expire 등으로 빠진 값이 있으면 속성 접근(lazy load)으로 처리
+        def items(source: str) -> str:
+            return ", ".join(
+                f"{name!r}: _loads({source.format(name=name)})" if name in json_fields
+                else f"{name!r}: {source.format(name=name)}"
+                for name in self.fields
+            )
+
+        source = (
+            "def to_dict(row):\n"
+            "    d = row.__dict__\n"
+            "    if _fields <= d.keys():\n"
+            f"        return {{{items('d[{name!r}]')}}}\n"
+            f"    return {{{items('row.{name}')}}}\n"
+        )
+        namespace: Dict[str, Any] = {"_loads": loads, "_fields": frozenset(self.fields)}
+        exec(compile(source, f"<serializer {model.__name__}>", "exec"), namespace)
+        self.to_dict: Callable[[SQLModel], dict] = namespace["to_dict"]
+
+    def many(self, rows: Iterable[SQLModel]) -> List[dict]:
+        to_dict = self.to_dict
+        return [to_dict(row) for row in rows]
+
+    def response(self, rows: Iterable[SQLModel], **kwargs) -> JSONBytesResponse:
+        return JSONBytesResponse(self.many(rows), **kwargs)
+
+
+job_serializer = ModelSerializer(Job, json_fields=["requiredVisa"])
+employer_serializer = ModelSerializer(Employer)
+application_serializer = ModelSerializer(Application)
+conversation_serializer = ModelSerializer(Conversation, json_fields=["participants"])
+message_serializer = ModelSerializer(Message)
@@ -0,0 +1,136 @@
+"""
+Per-request SQL instrumentation.
+
+Cursor execute events on every engine are attributed to the current HTTP
+request via a ContextVar (SQLAlchemy copies it into the greenlets that run
+async queries). For each request we keep the query count, total DB time and
+how often each statement *shape* ran (whitespace and IN-lists collapsed).
+
+``SQLMetricsMiddleware`` reports the numbers in a ``Server-Timing`` header::
+
+    Server-Timing: db;dur=4.2;desc="7 queries", app;dur=12.9
+
+and prints a log line when a request is slow, runs many queries, or repeats
+one shape ``SQL_N_PLUS_ONE_THRESHOLD`` times or more (the N+1 signature: a
+query inside a loop over a previous query's rows). ``SQL_METRICS_LOG=all``
+logs every request, ``off`` disables the log lines.
+"""
+import os
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+SLOW_REQUEST_MS = float(os.getenv("SQL_SLOW_REQUEST_MS", "500"))
+MAX_QUERIES = int(os.getenv("SQL_MAX_QUERIES", "30"))
+LOG_MODE = os.getenv("SQL_METRICS_LOG", "problems")  # all | problems | off
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (?, ?, ?) / IN (%s, %s) -> IN (?...)
+_IN_LIST = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))+\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class RequestSQLStats:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times (likely N+1)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[RequestSQLStats]] = ContextVar("sql_request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestSQLStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("sql_metrics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get("sql_metrics_started")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+def instrument(engines: List[Engine]):
+    """Attach the collector to sync engines (use ``AsyncEngine.sync_engine``)"""
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _log(method: str, path: str, status: int, stats: RequestSQLStats, total_ms: float):
+    repeated = stats.repeated()
+    problem = repeated or stats.count > MAX_QUERIES or total_ms > SLOW_REQUEST_MS
+    if LOG_MODE == "off" or (LOG_MODE != "all" and not problem):
+        return
+    print(
+        f"[sql] {method} {path} {status} queries={stats.count} "
+        f"db={stats.seconds * 1000:.1f}ms total={total_ms:.1f}ms"
+    )
+    for shape, n in repeated:
+        print(f"[sql]   possible N+1: {n}x {shape[:200]}")
+
+
+class SQLMetricsMiddleware:
+    """ASGI middleware adding Server-Timing (db / app) to every HTTP response"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status: Dict[str, int] = {}
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.1f}"
+                )
+                message.setdefault("headers", []).append((b"server-timing", timing.encode()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            _log(
+                scope["method"],
+                scope["path"],
+                status.get("code", 500),
+                stats,
+                (time.perf_counter() - started) * 1000,
+            )
@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 import os
-import httpx
-from langdetect import detect
+
+# httpx / langdetect 는 부팅 시간 단축을 위해 첫 사용 시 import 합니다
+
+
+def detect_language(text: str) -> str:
+    """언어 감지 (실패 시 'unknown')"""
+    from langdetect import detect
+    try:
+        return detect(text)
+    except Exception:
+        return "unknown"
+
 
 class TranslationProvider(ABC):
     """번역 제공자 인터페이스"""
@@ -39,10 +49,7 @@ class GeminiTranslationProvider(TranslationProvider):
     ) -> Tuple[str, str]:
         # 언어 감지
         if not source_lang:
-            try:
-                source_lang = detect(text)
-            except:
-                source_lang = "unknown"
+            source_lang = detect_language(text)
         
         # 같은 언어면 번역 불필요
         if source_lang == target_lang:
@@ -56,6 +63,8 @@ Text: {text}
 
 Translation:"""
 
+        import httpx
+
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 f"{self.base_url}/models/{self.model}:generateContent?key={self.api_key}",
@@ -89,10 +98,7 @@ class MockTranslationProvider(TranslationProvider):
     ) -> Tuple[str, str]:
         # 언어 감지
         if not source_lang:
-            try:
-                source_lang = detect(text)
-            except:
-                source_lang = "unknown"
+            source_lang = detect_language(text)
         
         # Mock 번역 (실제로는 그대로 반환하되 [번역됨] 표시)
         translated = f"[번역됨: {source_lang}→{target_lang}] {text}"
@@ -123,7 +129,8 @@ class TranslationService:
     ) -> Tuple[str, str]:
         """텍스트를 번역합니다"""
         if not self._provider:
-            raise Exception("Translation provider not initialized")
+            # 부팅 시 초기화하지 않았으면 첫 사용 시 환경 변수로 초기화
+            initialize_translation_service()
         
         return await self._provider.translate(text, source_lang, target_lang)
 
@@ -0,0 +1,93 @@
+"""
+Write-behind view counter for job postings.
+
+``get_job`` only bumps an in-memory counter. A background task started in the
+app lifespan flushes the accumulated increments every ``VIEW_FLUSH_SECONDS``
+with a single ``UPDATE jobs SET views = views + CASE id ... END`` statement, so
+hot postings never serialize on per-view row updates.
+
+Loss is bounded: at most one flush interval, or ``VIEW_FLUSH_MAX_PENDING``
+views (reaching it triggers an early flush), can be lost on a hard crash. The
+lifespan shutdown hook runs a final flush.
+"""
+import asyncio
+import os
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import case, update
+from sqlmodel import Session
+
+from app.db import engine
+from app.models import Job
+
+FLUSH_SECONDS = float(os.getenv("VIEW_FLUSH_SECONDS", "5"))
+MAX_PENDING = int(os.getenv("VIEW_FLUSH_MAX_PENDING", "10000"))
+
+
+class ViewCounter:
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self.flushed_views = 0
+        self.flushes = 0
+
+    def bump(self, job_id: str, count: int = 1):
+        with self._lock:
+            self._pending[job_id] = self._pending.get(job_id, 0) + count
+            self._total += count
+            full = self._total >= MAX_PENDING
+        if full and self._wakeup is not None:
+            self._wakeup.set()
+
+    def pending(self, job_id: str) -> int:
+        return self._pending.get(job_id, 0)
+
+    def flush(self) -> int:
+        """Apply all pending increments in one UPDATE; returns views written"""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._total = 0
+        if not batch:
+            return 0
+
+        statement = (
+            update(Job)
+            .where(Job.id.in_(list(batch)))
+            .values(views=Job.views + case(batch, value=Job.id, else_=0))
+        )
+        try:
+            with Session(engine) as session:
+                session.exec(statement)
+                session.commit()
+        except Exception:
+            # 실패한 배치는 다음 flush 때 다시 시도
+            with self._lock:
+                for job_id, count in batch.items():
+                    self._pending[job_id] = self._pending.get(job_id, 0) + count
+                    self._total += count
+            raise
+
+        written = sum(batch.values())
+        self.flushed_views += written
+        self.flushes += 1
+        return written
+
+    async def run(self):
+        """Periodic flusher (started from the app lifespan)"""
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"View counter flush failed: {e}")
+
+
+view_counter = ViewCounter()
@@ -1,48 +1,401 @@
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, List
-import json
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Dict, List, Optional, Set
+from datetime import datetime
 import asyncio
+import os
+import time
+import uuid
+
+from app.db import async_engine
+from app.models import ConversationParticipant
+from app.routers.auth import decode_access_token
+from app.services.backplane import Backplane, create_backplane
+from app.services.chat_persistence import chat_writer
+from app.services.serializers import dumps
+
+# 소켓별 송신 큐 크기와 느린 소비자 처리 방식
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "64"))
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")  # drop_oldest | drop_newest | disconnect
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))  # 한 프레임 전송이 이보다 오래 걸리면 끊음
+
+# heartbeat: 이 시간 동안 아무 프레임도 받지 못하면 {"type": "ping"} 전송, WS_IDLE_TIMEOUT 이 지나면 끊음
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "20"))  # 0 = heartbeat / reaper 끔
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "60"))
+WS_REAP_INTERVAL = float(os.getenv("WS_REAP_INTERVAL", "5"))  # reaper 가 연결을 훑는 주기
+
+# 1013 Try Again Later: 느린 소비자 / 전송 타임아웃으로 서버가 끊은 경우
+CLOSE_SLOW_CONSUMER = 1013
+# 4408 (애플리케이션 정의, HTTP 408 에 대응): heartbeat 응답 없음 (half-open 연결)
+CLOSE_IDLE_TIMEOUT = 4408
+
+PING_FRAME = dumps({"type": "ping"}).decode()
+PONG_FRAME = dumps({"type": "pong"}).decode()
+
+
+class Connection:
+    """One socket with a bounded outbound queue drained by its own writer task
+
+    Fan-out only enqueues frames (never awaits the socket), so a slow client
+    delays nobody but itself. When its queue is full the slow-consumer policy
+    applies: drop the oldest queued frame, drop the new frame, or disconnect.
+    """
+
+    def __init__(self, websocket: WebSocket, manager: "ConnectionManager", user_id: Optional[str] = None):
+        self.websocket = websocket
+        self.manager = manager
+        # /ws/users/{user_id} 로 연결한 멀티플렉스 소켓이면 사용자 ID
+        self.user_id = user_id
+        self.conversations: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self.connected_at = time.time()
+        # 마지막으로 클라이언트 프레임을 받은 / ping 을 보낸 시각 (monotonic)
+        self.last_seen = time.monotonic()
+        self.last_ping = 0.0
+        self.sent = 0
+        self.dropped = 0
+        self.closed = False
+        self.timed_out = False
+        self.writer = asyncio.create_task(self._write())
+
+    def offer(self, frame: str) -> bool:
+        """Queue a frame without waiting; False means the socket should be disconnected"""
+        if self.closed:
+            return True
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if WS_SLOW_CONSUMER_POLICY == "disconnect":
+            return False
+        self.dropped += 1
+        self.manager.dropped_frames += 1
+        if WS_SLOW_CONSUMER_POLICY == "drop_oldest":
+            self.queue.get_nowait()
+            self.queue.put_nowait(frame)
+        return True
+
+    def reply(self, frame: dict):
+        """Send a frame to this socket only (ack, error, control replies)"""
+        self.offer(dumps(frame).decode())
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def _send_timed_out(self):
+        self.timed_out = True
+        self.writer.cancel()
+
+    async def _write(self):
+        # asyncio.wait_for 는 전송마다 태스크를 만들기 때문에 타이머 핸들로 타임아웃 처리
+        loop = asyncio.get_running_loop()
+        code = None
+        try:
+            while True:
+                frame = await self.queue.get()
+                timer = loop.call_later(WS_SEND_TIMEOUT, self._send_timed_out)
+                try:
+                    await self.websocket.send_text(frame)
+                finally:
+                    timer.cancel()
+                self.sent += 1
+        except asyncio.CancelledError:
+            if not self.timed_out:
+                return
+            code = CLOSE_SLOW_CONSUMER
+            self.manager.slow_disconnects += 1
+        except Exception:
+            # 이미 끊긴 소켓 (클라이언트 종료, 네트워크 오류)
+            pass
+        await self.manager.disconnect(self, code)
+
+    async def close(self, code: Optional[int] = None):
+        if self.closed:
+            return
+        self.closed = True
+        if self.writer is not asyncio.current_task():
+            self.writer.cancel()
+            await asyncio.gather(self.writer, return_exceptions=True)
+        if code is not None:
+            try:
+                await self.websocket.close(code)
+            except Exception:
+                pass
 
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+    """Sockets of this worker, grouped by conversation
+
+    Frames are published to the backplane once per conversation; the
+    backplane hands them back to every worker subscribed to that
+    conversation, and each worker delivers to its own sockets only.
+    """
+
+    def __init__(self, backplane: Optional[Backplane] = None):
+        self.active_connections: Dict[str, Set[Connection]] = {}
+        self.backplane = backplane or create_backplane()
+        self.dropped_frames = 0
+        self.slow_disconnects = 0
+        self.pings_sent = 0
+        self.idle_disconnects = 0
+        self._reaper: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self.backplane.start(self.send_message)
+        if WS_PING_INTERVAL > 0:
+            self._reaper = asyncio.create_task(self._reap_forever())
+
+    async def close(self):
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+        for connection in self.connections():
+            await self.disconnect(connection, 1001)  # 1001 Going Away: 서버 종료
+        await self.backplane.close()
+
+    def connections(self) -> Set[Connection]:
+        return {c for members in self.active_connections.values() for c in members}
+
+    async def reap(self) -> int:
+        """Ping quiet sockets and close the ones silent past WS_IDLE_TIMEOUT; returns sockets closed"""
+        now = time.monotonic()
+        idle = []
+        for connection in self.connections():
+            quiet = now - connection.last_seen
+            if quiet >= WS_IDLE_TIMEOUT:
+                idle.append(connection)
+            elif quiet >= WS_PING_INTERVAL and now - connection.last_ping >= WS_PING_INTERVAL:
+                connection.last_ping = now
+                self.pings_sent += 1
+                if not connection.offer(PING_FRAME):
+                    idle.append(connection)
+        for connection in idle:
+            self.idle_disconnects += 1
+            await self.disconnect(connection, CLOSE_IDLE_TIMEOUT)
+        return len(idle)
+
+    async def _reap_forever(self):
+        while True:
+            await asyncio.sleep(WS_REAP_INTERVAL)
+            try:
+                await self.reap()
+            except Exception as e:
+                print(f"[ws] reaper failed: {e}")
 
-    async def connect(self, websocket: WebSocket, conversation_id: str):
+    async def connect(
+        self, websocket: WebSocket, conversation_ids: List[str], user_id: Optional[str] = None
+    ) -> Connection:
         await websocket.accept()
+        connection = Connection(websocket, self, user_id)
+        for conversation_id in conversation_ids:
+            await self.join(connection, conversation_id)
+        return connection
+
+    async def join(self, connection: Connection, conversation_id: str):
         if conversation_id not in self.active_connections:
-            self.active_connections[conversation_id] = []
-        self.active_connections[conversation_id].append(websocket)
+            self.active_connections[conversation_id] = set()
+            await self.backplane.subscribe(conversation_id)
+        self.active_connections[conversation_id].add(connection)
+        connection.conversations.add(conversation_id)
+
+    async def leave(self, connection: Connection, conversation_id: str):
+        connection.conversations.discard(conversation_id)
+        connections = self.active_connections.get(conversation_id)
+        if connections is None:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self.active_connections[conversation_id]
+            await self.backplane.unsubscribe(conversation_id)
 
-    def disconnect(self, websocket: WebSocket, conversation_id: str):
-        if conversation_id in self.active_connections:
-            self.active_connections[conversation_id].remove(websocket)
-            if not self.active_connections[conversation_id]:
-                del self.active_connections[conversation_id]
+    async def disconnect(self, connection: Connection, code: Optional[int] = None):
+        """Remove the socket everywhere and stop its writer (idempotent)"""
+        for conversation_id in list(connection.conversations):
+            await self.leave(connection, conversation_id)
+        await connection.close(code)
 
     async def send_message(self, message: dict, conversation_id: str):
-        if conversation_id in self.active_connections:
-            for connection in self.active_connections[conversation_id]:
-                try:
-                    await connection.send_json(message)
-                except:
-                    pass
+        """Deliver to this worker's sockets in the conversation (enqueue only)"""
+        connections = self.active_connections.get(conversation_id)
+        if not connections:
+            return
+        frame = dumps(message).decode()
+        slow = [connection for connection in connections if not connection.offer(frame)]
+        for connection in slow:
+            self.slow_disconnects += 1
+            await self.disconnect(connection, CLOSE_SLOW_CONSUMER)
 
     async def broadcast(self, message: dict, conversation_id: str):
-        await self.send_message(message, conversation_id)
+        """Publish once; every worker with sockets in the conversation delivers it
+
+        Frames always carry ``conversationId`` so multiplexed sockets can route them.
+        """
+        if isinstance(message, dict) and "conversationId" not in message:
+            message = {**message, "conversationId": conversation_id}
+        await self.backplane.publish(conversation_id, message)
+
+    def stats(self) -> dict:
+        connections = self.connections()
+        depths = [c.queue.qsize() for c in connections]
+        now, now_monotonic = time.time(), time.monotonic()
+        ages = [now - c.connected_at for c in connections]
+        return {
+            "pid": os.getpid(),
+            "conversations": len(self.active_connections),
+            "connections": len(connections),
+            "userConnections": sum(1 for c in connections if c.user_id is not None),
+            "subscriptions": sum(len(members) for members in self.active_connections.values()),
+            "avgConnectionAgeSeconds": round(sum(ages) / len(ages), 1) if ages else 0.0,
+            "oldestConnectionAgeSeconds": round(max(ages, default=0.0), 1),
+            "maxIdleSeconds": round(max((now_monotonic - c.last_seen for c in connections), default=0.0), 1),
+            "pingInterval": WS_PING_INTERVAL,
+            "idleTimeout": WS_IDLE_TIMEOUT,
+            "pingsSent": self.pings_sent,
+            "idleDisconnects": self.idle_disconnects,
+            "queuedFrames": sum(depths),
+            "maxQueueDepth": max(depths, default=0),
+            "queueSize": WS_SEND_QUEUE_SIZE,
+            "slowConsumerPolicy": WS_SLOW_CONSUMER_POLICY,
+            "droppedFrames": self.dropped_frames,
+            "slowConsumerDisconnects": self.slow_disconnects,
+            **self.backplane.stats(),
+        }
 
 
 manager = ConnectionManager()
 
 
+def chat_row(data: dict, conversation_id: str) -> Optional[dict]:
+    """messages row for a chat frame ({"senderId", "text"}); None for other frames (typing 등)"""
+    text, sender_id = data.get("text"), data.get("senderId")
+    if not isinstance(text, str) or not isinstance(sender_id, str) or not sender_id:
+        return None
+    translated = data.get("translatedText")
+    return {
+        "id": f"msg-{uuid.uuid4().hex[:12]}",
+        "conversationId": conversation_id,
+        "senderId": sender_id,
+        "text": text,
+        "translatedText": translated if isinstance(translated, str) else None,
+        "timestamp": datetime.utcnow().isoformat(),
+        "read": False,
+    }
+
+
+async def user_conversation_ids(user_id: str, conversation_id: Optional[str] = None) -> List[str]:
+    """Conversations the user takes part in (primary DB)
+
+    conversation_participants is kept in sync with conversations.participants
+    by DB triggers (app/services/child_tables.py).
+    """
+    # 방금 만든 대화방도 보이도록 복제본이 아닌 primary 에서 조회
+    statement = select(ConversationParticipant.conversationId).where(ConversationParticipant.userId == user_id)
+    if conversation_id is not None:
+        statement = statement.where(ConversationParticipant.conversationId == conversation_id)
+    async with AsyncSession(async_engine) as session:
+        return list((await session.exec(statement)).all())
+
+
+def token_user(websocket: WebSocket) -> Optional[str]:
+    """User id (``sub``) of the access token sent with the handshake"""
+    token = websocket.query_params.get("token")
+    if not token:
+        scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    claims = decode_access_token(token) if token else None
+    return claims.get("sub") if claims else None
+
+
+async def relay(connection: Connection, data, conversation_id: str):
+    """Broadcast a client frame; chat frames are also queued for storage"""
+    row = chat_row(data, conversation_id) if isinstance(data, dict) else None
+    if row is not None:
+        data = {**data, "id": row["id"], "conversationId": conversation_id, "timestamp": row["timestamp"]}
+    # Broadcast message to all connections in this conversation (every worker)
+    await manager.broadcast(data, conversation_id)
+    if row is not None:
+        await chat_writer.submit(row, data.get("clientId"), connection.reply)
+
+
+def heartbeat(connection: Connection, data) -> bool:
+    """Handle ping/pong frames (never broadcast); True if ``data`` was one"""
+    if not isinstance(data, dict) or data.get("type") not in ("ping", "pong"):
+        return False
+    if data["type"] == "ping":
+        connection.offer(PONG_FRAME)
+    return True
+
+
 async def websocket_endpoint(websocket: WebSocket, conversation_id: str):
-    """WebSocket endpoint for real-time chat"""
-    await manager.connect(websocket, conversation_id)
+    """WebSocket endpoint for real-time chat
+
+    Chat frames get an id and timestamp, are broadcast immediately and stored
+    by the batched writer, which acks the id back to this socket once committed.
+    Any frame counts as a heartbeat; reply {"type": "pong"} to server pings.
+    """
+    connection = await manager.connect(websocket, [conversation_id])
     try:
         while True:
             data = await websocket.receive_json()
-            # Broadcast message to all connections in this conversation
-            await manager.broadcast(data, conversation_id)
+            connection.touch()
+            if not heartbeat(connection, data):
+                await relay(connection, data, conversation_id)
     except WebSocketDisconnect:
-        manager.disconnect(websocket, conversation_id)
+        pass
+    finally:
+        await manager.disconnect(connection)
+
+
+async def user_websocket_endpoint(websocket: WebSocket, user_id: str):
+    """One socket per user, subscribed to all of the user's conversations
 
+    Every frame carries ``conversationId`` in both directions. Control frames:
+    ``{"type": "subscribe" | "unsubscribe", "conversationId": ...}`` (e.g. after
+    a new conversation is created), answered with ``subscribed`` /
+    ``unsubscribed`` or ``error``. Chat frames are sent as ``user_id``.
+
+    The client must present the access token from sign-in for ``user_id``
+    (``?token=...`` or ``Authorization: Bearer ...``); otherwise the handshake
+    is rejected (403).
+    """
+    if token_user(websocket) != user_id:
+        await websocket.close(code=1008)
+        return
+    conversation_ids = await user_conversation_ids(user_id)
+    connection = await manager.connect(websocket, conversation_ids, user_id)
+    connection.reply({"type": "subscribed", "conversationIds": sorted(conversation_ids)})
+    try:
+        while True:
+            data = await websocket.receive_json()
+            connection.touch()
+            if heartbeat(connection, data):
+                continue
+            conversation_id = data.get("conversationId") if isinstance(data, dict) else None
+            if not isinstance(conversation_id, str):
+                connection.reply({"type": "error", "detail": "conversationId is required"})
+                continue
+
+            kind = data.get("type")
+            if kind == "subscribe":
+                if not (conversation_id in connection.conversations
+                        or await user_conversation_ids(user_id, conversation_id)):
+                    connection.reply({"type": "error", "conversationId": conversation_id,
+                                      "detail": "Not a participant of this conversation"})
+                    continue
+                await manager.join(connection, conversation_id)
+                connection.reply({"type": "subscribed", "conversationIds": [conversation_id]})
+            elif kind == "unsubscribe":
+                await manager.leave(connection, conversation_id)
+                connection.reply({"type": "unsubscribed", "conversationIds": [conversation_id]})
+            elif conversation_id not in connection.conversations:
+                connection.reply({"type": "error", "conversationId": conversation_id,
+                                  "detail": "Not subscribed to this conversation"})
+            else:
+                await relay(connection, {**data, "senderId": user_id}, conversation_id)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await manager.disconnect(connection)
@@ -0,0 +1,171 @@
+"""
+동기 Session vs AsyncSession 처리량 벤치마크
+async def 라우트 안에서 동기 Session 을 쓰던 이전 방식과 app.db 의 AsyncSession
+(aiosqlite / aiomysql) 방식을 같은 FastAPI 앱에서 동시 요청으로 비교합니다.
+
+    python bench_async_db.py [--requests 2000] [--concurrency 50] [--db-latency-ms 2]
+
+각 요청은 대화방 메시지 목록 조회(최근 50건)를 실행합니다. 동시에 1ms 타이머를 돌려
+DB 호출이 이벤트 루프를 막는 시간(WebSocket, 다른 요청이 기다리는 시간)을
+측정합니다. --db-latency-ms 는 MySQL 네트워크 왕복 시간을 흉내 내기 위해 쿼리마다
+DB 커넥션 안에서 그만큼 대기합니다 (0 = 로컬 SQLite 그대로).
+임시 SQLite 파일(app.db 와 같은 PRAGMA)을 사용합니다.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import warnings
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import POOL_MAX_OVERFLOW, POOL_SIZE, apply_sqlite_pragmas
+from app.models import Conversation, Message
+
+CONVERSATIONS = [f"bench-conv-{i}" for i in range(20)]
+
+# SQLModel 0.0.14 은 session.execute() 에 DeprecationWarning 을 냄 (text() 실행용)
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+def _on_connect(latency_ms: float):
+    def listener(dbapi_connection, connection_record=None):
+        apply_sqlite_pragmas(dbapi_connection)
+        # 쿼리마다 호출해서 DB 왕복 시간을 흉내 냄 (커넥션 스레드 안에서 대기)
+        dbapi_connection.create_function("bench_latency", 0, lambda: time.sleep(latency_ms / 1000) or 0)
+    return listener
+
+
+def _setup(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine, tables=[Conversation.__table__, Message.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Conversation.__table__), [{"id": c, "participants": "[]"} for c in CONVERSATIONS])
+        conn.execute(insert(Message.__table__), [
+            {"id": f"seed-{i}", "conversationId": CONVERSATIONS[i % len(CONVERSATIONS)],
+             "senderId": "bench", "text": "seed message", "timestamp": f"{i:08d}", "read": False}
+            for i in range(20000)
+        ])
+    engine.dispose()
+
+
+def _statement(conversation_id: str):
+    return (
+        select(Message)
+        .where(Message.conversationId == conversation_id)
+        .order_by(Message.timestamp.desc())
+        .limit(50)
+    )
+
+
+def make_app(path: str, latency_ms: float):
+    # app.db 와 같은 풀 크기 (DB_POOL_SIZE / DB_MAX_OVERFLOW)
+    pool = {"pool_size": POOL_SIZE, "max_overflow": POOL_MAX_OVERFLOW}
+    sync_engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}, poolclass=QueuePool, **pool
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, **pool)
+    for engine in (sync_engine, async_engine.sync_engine):
+        event.listen(engine, "connect", _on_connect(latency_ms))
+    latency = text("SELECT bench_latency()")
+
+    app = FastAPI()
+
+    @app.get("/sync/{conversation_id}")
+    async def list_sync(conversation_id: str):
+        # 이전 방식: async def 안에서 동기 Session (이벤트 루프를 막음)
+        with Session(sync_engine) as session:
+            session.execute(latency)
+            return len(session.exec(_statement(conversation_id)).all())
+
+    @app.get("/async/{conversation_id}")
+    async def list_async(conversation_id: str):
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            await session.execute(latency)
+            return len((await session.exec(_statement(conversation_id))).all())
+
+    async def dispose():
+        sync_engine.dispose()
+        await async_engine.dispose()
+
+    return app, dispose
+
+
+def _pct(values: List[float], q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * q))] * 1000 if values else 0.0
+
+
+async def load(client: httpx.AsyncClient, prefix: str, requests: int, concurrency: int) -> dict:
+    latencies: List[float] = []
+    stalls: List[float] = []
+    remaining = iter(range(requests))
+    done = asyncio.Event()
+
+    async def worker():
+        for i in remaining:
+            started = time.perf_counter()
+            response = await client.get(f"/{prefix}/{CONVERSATIONS[i % len(CONVERSATIONS)]}")
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    async def ticker():
+        # 1ms 타이머가 늦게 깨어난 만큼 = 이벤트 루프가 막혀 있던 시간
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(max(0.0, time.perf_counter() - started - 0.001))
+
+    tick_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick_task
+    return {
+        "rps": requests / elapsed,
+        "p50": _pct(latencies, 0.5),
+        "p99": _pct(latencies, 0.99),
+        "stall_p99": _pct(stalls, 0.99),
+        "stall_max": max(stalls) * 1000 if stalls else 0.0,
+    }
+
+
+async def main(args):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        _setup(path)
+        app, dispose = make_app(path, args.db_latency_ms)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{args.requests} requests, concurrency {args.concurrency}, "
+                  f"simulated DB latency {args.db_latency_ms}ms, pool {POOL_SIZE}+{POOL_MAX_OVERFLOW}\n")
+            print(f"{'':<16}{'req/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'stall p99':>11}{'stall max':>11}")
+            # 워밍업 (커넥션 풀 채우기)
+            await load(client, "sync", args.concurrency, args.concurrency)
+            await load(client, "async", args.concurrency, args.concurrency)
+            for label, prefix in (("sync Session", "sync"), ("AsyncSession", "async")):
+                r = await load(client, prefix, args.requests, args.concurrency)
+                print(f"{label:<16}{r['rps']:>8.0f}{r['p50']:>9.1f}{r['p99']:>9.1f}"
+                      f"{r['stall_p99']:>11.1f}{r['stall_max']:>11.1f}")
+        await dispose()
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
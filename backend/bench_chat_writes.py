@@ -0,0 +1,136 @@
+"""
+WebSocket 채팅 메시지 저장 벤치마크
+메시지마다 INSERT + updatedAt UPDATE + COMMIT 하는 방식(POST /messages 와 같은 패턴)과
+app.services.chat_persistence 의 배치 저장(multi-row INSERT, 배치당 1 COMMIT)을 비교합니다.
+
+    python bench_chat_writes.py [--messages 5000] [--senders 50]
+
+초당 저장 메시지 수, ack 지연(p50/p99), 평균 배치 크기를 출력하고, 배치 안에 잘못된 행
+(중복 id)이 있을 때 그 행만 error 로 응답하고 나머지는 저장되는지 확인합니다.
+임시 SQLite 파일(app.db 와 같은 PRAGMA)을 사용합니다. 실패 시 exit 1.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import event, func, insert, select, update
+from sqlmodel import SQLModel, Session, create_engine
+
+import app.services.chat_persistence as chat_persistence
+from app.db import apply_sqlite_pragmas
+from app.models import Conversation, Message
+
+CONVERSATIONS = [f"bench-conv-{i}" for i in range(20)]
+
+
+def make_row(i: int) -> dict:
+    return {
+        "id": f"msg-{uuid.uuid4().hex[:12]}",
+        "conversationId": CONVERSATIONS[i % len(CONVERSATIONS)],
+        "senderId": f"user-{i % 50}",
+        "text": f"안녕하세요 {i}",
+        "translatedText": None,
+        "timestamp": datetime.utcnow().isoformat(),
+        "read": False,
+    }
+
+
+def per_message(engine, messages: int) -> float:
+    """메시지마다 별도 트랜잭션"""
+    started = time.perf_counter()
+    for i in range(messages):
+        row = make_row(i)
+        with Session(engine) as session:
+            session.exec(insert(Message).values(row))
+            session.exec(
+                update(Conversation).where(Conversation.id == row["conversationId"]).values(updatedAt=row["timestamp"])
+            )
+            session.commit()
+    return time.perf_counter() - started
+
+
+async def batched(messages: int, senders: int):
+    writer = chat_persistence.ChatWriter()
+    runner = asyncio.create_task(writer.run())
+    latencies = []
+
+    async def sender(index: int):
+        for i in range(index, messages, senders):
+            sent_at = time.perf_counter()
+
+            def reply(frame, sent_at=sent_at):
+                latencies.append(time.perf_counter() - sent_at)
+
+            await writer.submit(make_row(i), f"c{i}", reply)
+            # 실제 클라이언트처럼 ack 를 기다리지 않고 다음 메시지를 보냄 (짧은 간격)
+            await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(sender(s) for s in range(senders)))
+    while len(latencies) < messages:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    runner.cancel()
+    await asyncio.gather(runner, return_exceptions=True)
+    latencies.sort()
+    return elapsed, latencies, writer.stats()
+
+
+async def bad_row_isolation() -> bool:
+    writer = chat_persistence.ChatWriter()
+    replies = []
+    rows = [make_row(i) for i in range(5)]
+    rows[2]["id"] = rows[1]["id"]  # 중복 PK
+    for row in rows:
+        await writer.submit(row, row["id"], replies.append)
+    await writer.flush()
+    kinds = [frame["type"] for frame in replies]
+    return kinds.count("ack") == 4 and kinds.count("error") == 1
+
+
+def main(args) -> bool:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    SQLModel.metadata.create_all(engine, tables=[Conversation.__table__, Message.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Conversation.__table__), [{"id": c, "participants": "[]"} for c in CONVERSATIONS])
+    chat_persistence.engine = engine
+
+    try:
+        single = per_message(engine, args.messages)
+        print(f"{'per-message commit':<20}{args.messages / single:>10.0f} msg/s")
+
+        loop = asyncio.new_event_loop()
+        elapsed, latencies, stats = loop.run_until_complete(batched(args.messages, args.senders))
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(f"{'batched write-behind':<20}{args.messages / elapsed:>10.0f} msg/s  "
+              f"ack p50={p50:.1f}ms p99={p99:.1f}ms  batches={stats['batches']} avgBatch={stats['avgBatch']}")
+
+        with Session(engine) as session:
+            stored = session.execute(select(func.count()).select_from(Message)).scalar_one()
+        ok = stored == args.messages * 2
+        isolated = loop.run_until_complete(bad_row_isolation())
+        loop.close()
+        print(f"\nstored rows {stored} (expected {args.messages * 2})  {'ok' if ok else 'FAIL'}")
+        print(f"bad row isolated  {'ok' if isolated else 'FAIL'}")
+        return ok and isolated
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--senders", type=int, default=50)
+    sys.exit(0 if main(parser.parse_args()) else 1)
@@ -0,0 +1,158 @@
+"""
+목록 API 응답 직렬화 벤치마크
+기존 경로(model.dict() + json.loads -> response_model=List[dict] 검증/직렬화 ->
+JSONResponse)와 app.services.serializers 의 경로(사전 컴파일된 serializer ->
+orjson)를 같은 행으로 비교합니다. DB 조회는 포함하지 않습니다.
+
+    python bench_serialization.py [--rows 500] [--seconds 2]
+
+/jobs, /applications, /conversations/{user_id}, 메시지 목록의 응답 형태별로
+초당 직렬화 행 수와 두 경로의 출력이 같은지 출력합니다.
+"""
+import argparse
+import asyncio
+import json
+import time
+import warnings
+from typing import Any, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models import Application, Conversation, Employer, Job, Message
+from app.services.hydration import serialize_job
+from app.services.serializers import (
+    ORJSON_AVAILABLE,
+    JSONBytesResponse,
+    application_serializer,
+    conversation_serializer,
+    message_serializer,
+)
+
+LIST_FIELD = create_response_field(name="Response_bench_list", type_=List[dict])
+DICT_FIELD = create_response_field(name="Response_bench_dict", type_=dict)
+LOOP = asyncio.new_event_loop()
+
+# 기존 경로의 model.dict() 는 SQLModel 0.0.14 에서 DeprecationWarning 을 냄
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+def make_rows(n: int):
+    employers = [
+        Employer(
+            id=f"emp-{i}", businessNo=f"prof-{i}", shopName=f"카페 {i}", industry="서빙",
+            address="서울특별시 종로구 1", openHours="09:00-18:00", contact="010-0000-0000",
+            minLanguageLevel="Lv.1 기초", baseWage=10030, schedule="월,화,수", lat=37.57, lng=126.98,
+        )
+        for i in range(max(n // 10, 1))
+    ]
+    jobs = [
+        Job(
+            id=f"job-{i}", employerId=employers[i % len(employers)].id, title=f"바리스타 모집 {i}",
+            description="커피 제조 및 매장 관리 " * 5, category="서빙", wage=10030, workDays="월,화,수",
+            workHours="09:00-18:00", deadline="2030-01-01", positions=2, requiredLanguage="Lv.2 초급",
+            requiredVisa='["E-9", "H-2", "F-4"]', benefits="식사 제공", employerMessage="환영합니다",
+            location="서울", lat=37.57, lng=126.98, geohash="wydm9q",
+        )
+        for i in range(n)
+    ]
+    applications = [
+        Application(applicationId=f"app-{i}", seekerId=f"seeker-{i % 50}", jobId=f"job-{i}", status="applied")
+        for i in range(n)
+    ]
+    messages = [
+        Message(id=f"msg-{i}", conversationId=f"conv-{i % 50}", senderId=f"user-{i % 2}",
+                text="안녕하세요, 내일 몇 시까지 출근하면 될까요?", translatedText=None)
+        for i in range(n)
+    ]
+    conversations = [
+        Conversation(id=f"conv-{i}", participants=json.dumps([f"user-{i}", f"user-{i + 1}"]))
+        for i in range(n)
+    ]
+    return {e.id: e for e in employers}, jobs, applications, messages, conversations
+
+
+def legacy_response(content: Any, field) -> bytes:
+    """이전 라우터 반환값이 FastAPI 를 거쳐 응답 body 가 되는 과정"""
+    value = LOOP.run_until_complete(serialize_response(field=field, response_content=content))
+    return JSONResponse(value).body
+
+
+def cases(n: int):
+    employers, jobs, applications, messages, conversations = make_rows(n)
+    last = {m.conversationId: m for m in messages}
+
+    def jobs_legacy():
+        rows = []
+        for job in jobs:
+            employer = employers[job.employerId]
+            job_dict = job.dict()
+            job_dict["employer"] = employer.dict()
+            job_dict["requiredVisa"] = json.loads(job.requiredVisa)
+            rows.append(job_dict)
+        return legacy_response(rows, LIST_FIELD)
+
+    def jobs_fast():
+        return JSONBytesResponse([serialize_job(job, employers[job.employerId]) for job in jobs]).body
+
+    def conversations_legacy():
+        rows = []
+        for conv in conversations:
+            conv_dict = conv.dict()
+            conv_dict["participants"] = json.loads(conv.participants)
+            conv_dict["lastMessage"] = last[conv.id].dict() if conv.id in last else None
+            rows.append(conv_dict)
+        return legacy_response(rows, LIST_FIELD)
+
+    def conversations_fast():
+        rows = []
+        for conv in conversations:
+            conv_dict = conversation_serializer.to_dict(conv)
+            conv_dict["lastMessage"] = message_serializer.to_dict(last[conv.id]) if conv.id in last else None
+            rows.append(conv_dict)
+        return JSONBytesResponse(rows).body
+
+    return [
+        ("/jobs", jobs_legacy, jobs_fast),
+        (
+            "/applications",
+            lambda: legacy_response([a.dict() for a in applications], LIST_FIELD),
+            lambda: application_serializer.response(applications).body,
+        ),
+        ("/conversations/{user_id}", conversations_legacy, conversations_fast),
+        (
+            "messages",
+            lambda: legacy_response({"messages": [m.dict() for m in messages], "nextCursor": None}, DICT_FIELD),
+            lambda: JSONBytesResponse({"messages": message_serializer.many(messages), "nextCursor": None}).body,
+        ),
+    ]
+
+
+def rows_per_second(fn: Callable[[], bytes], rows: int, seconds: float) -> float:
+    fn()  # warm-up
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        fn()
+        count += 1
+    return count * rows / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=2)
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if ORJSON_AVAILABLE else 'no (json fallback)'}, {args.rows} rows per response\n")
+    print(f"{'endpoint':<28}{'before rows/s':>15}{'after rows/s':>15}{'speedup':>10}  same output")
+    for name, legacy, fast in cases(args.rows):
+        same = json.loads(legacy()) == json.loads(fast())
+        before = rows_per_second(legacy, args.rows, args.seconds)
+        after = rows_per_second(fast, args.rows, args.seconds)
+        print(f"{name:<28}{before:>15,.0f}{after:>15,.0f}{after / before:>9.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+SQLite 동시 읽기/쓰기 벤치마크
+기본 설정(rollback journal)과 app.db 의 운영 PRAGMA(WAL 등)를 비교합니다.
+
+    python bench_sqlite.py [--seconds 5] [--writers 4] [--readers 8]
+
+메시지 전송(1건 INSERT + COMMIT)과 대화방 메시지 조회(최근 50건)를 동시에 실행하고
+초당 처리량과 'database is locked' 오류 수를 출력합니다.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+from sqlalchemy import event, exc, insert, select
+from sqlmodel import SQLModel, create_engine
+
+from app.db import SQLITE_PRAGMAS, apply_sqlite_pragmas
+from app.models import Conversation, Message
+
+CONVERSATIONS = [f"bench-conv-{i}" for i in range(20)]
+
+
+def _make_engine(path: str, tuned: bool):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 5})
+    if tuned:
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+    else:
+        # 이전 실행에서 WAL 로 바뀐 파일이라도 기본 journal 로 되돌림
+        event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA journal_mode=DELETE"))
+    return engine
+
+
+def _setup(engine):
+    SQLModel.metadata.create_all(engine, tables=[Conversation.__table__, Message.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(Conversation.__table__), [{"id": c, "participants": "[]"} for c in CONVERSATIONS])
+        conn.execute(insert(Message.__table__), [
+            {"id": f"seed-{i}", "conversationId": CONVERSATIONS[i % len(CONVERSATIONS)],
+             "senderId": "bench", "text": "seed message", "timestamp": f"{i:08d}", "read": False}
+            for i in range(20000)
+        ])
+
+
+def run(tuned: bool, seconds: float, writers: int, readers: int) -> dict:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = _make_engine(path, tuned)
+    _setup(engine)
+
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def count(key):
+        with lock:
+            counts[key] += 1
+
+    def writer(n):
+        i = 0
+        while time.perf_counter() < stop:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(Message.__table__).values(
+                        id=f"msg-{uuid.uuid4().hex[:12]}",
+                        conversationId=CONVERSATIONS[(n + i) % len(CONVERSATIONS)],
+                        senderId=f"writer-{n}",
+                        text="hello",
+                        timestamp=str(time.time()),
+                        read=False,
+                    ))
+                count("writes")
+            except exc.OperationalError:
+                count("locked")
+            i += 1
+
+    def reader(n):
+        i = 0
+        while time.perf_counter() < stop:
+            statement = (
+                select(Message.__table__)
+                .where(Message.__table__.c.conversationId == CONVERSATIONS[(n + i) % len(CONVERSATIONS)])
+                .order_by(Message.__table__.c.timestamp.desc())
+                .limit(50)
+            )
+            try:
+                with engine.connect() as conn:
+                    conn.execute(statement).all()
+                count("reads")
+            except exc.OperationalError:
+                count("locked")
+            i += 1
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return {key: value / seconds if key != "locked" else value for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"PRAGMA: {SQLITE_PRAGMAS}")
+    print(f"{args.writers} writers / {args.readers} readers, {args.seconds:g}s each\n")
+    print(f"{'mode':<10}{'writes/s':>12}{'reads/s':>12}{'locked':>10}")
+    for name, tuned in (("default", False), ("tuned", True)):
+        result = run(tuned, args.seconds, args.writers, args.readers)
+        print(f"{name:<10}{result['writes']:>12.0f}{result['reads']:>12.0f}{result['locked']:>10}")
+
+
+if __name__ == "__main__":
+    main()
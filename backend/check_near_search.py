@@ -0,0 +1,121 @@
+"""
+반경 검색 점검 스크립트
+검색 지점을 중심으로 반경 바로 안(r × 0.998)과 바로 밖(r × 1.002)에 공고를 방위각마다
+배치하고, 여러 위도·반경에서 GET /jobs?near=...&radiusKm=... 를 페이지 단위로 호출해서
+
+- 반경 안의 공고가 모두 반환되는지,
+- 반경 밖의 공고가 하나도 반환되지 않는지 (distanceKm <= radiusKm),
+- 거리순으로 정렬되어 있는지
+
+확인합니다. 임시 SQLite DB 를 사용합니다. 실패 시 exit 1.
+
+    python check_near_search.py
+"""
+import math
+import os
+import sys
+import tempfile
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{DB_PATH}")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.db import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Employer, Job  # noqa: E402
+from app.services.geo import EARTH_RADIUS_KM, geohash_for  # noqa: E402
+
+# (검색 위도, 경도, 반경 km)
+CASES = [
+    (0.0, 100.0, 50),
+    (37.5, 127.0, 200),
+    (37.5, 127.0, 10),
+    (60.0, 25.0, 199),
+    (-33.9, 151.2, 120),
+]
+BEARINGS = range(0, 360, 10)
+INSIDE, OUTSIDE = 0.998, 1.002
+PAGE = 25
+
+
+def destination(lat: float, lng: float, bearing_deg: float, distance_km: float):
+    """Point ``distance_km`` away from (lat, lng) along a great circle"""
+    d = distance_km / EARTH_RADIUS_KM
+    p1, l1, b = math.radians(lat), math.radians(lng), math.radians(bearing_deg)
+    p2 = math.asin(math.sin(p1) * math.cos(d) + math.cos(p1) * math.sin(d) * math.cos(b))
+    l2 = l1 + math.atan2(math.sin(b) * math.sin(d) * math.cos(p1), math.cos(d) - math.sin(p1) * math.sin(p2))
+    return math.degrees(p2), (math.degrees(l2) + 540) % 360 - 180
+
+
+def seed() -> dict:
+    """Insert boundary jobs; returns case index -> ids expected inside the radius"""
+    expected = {}
+    rows = []
+    for i, (lat, lng, radius) in enumerate(CASES):
+        expected[i] = set()
+        for bearing in BEARINGS:
+            for label, factor in (("in", INSIDE), ("out", OUTSIDE)):
+                job_lat, job_lng = destination(lat, lng, bearing, radius * factor)
+                job_id = f"near-{i}-{bearing}-{label}"
+                if label == "in":
+                    expected[i].add(job_id)
+                rows.append({
+                    "id": job_id, "employerId": "near-employer", "title": job_id, "description": "",
+                    "category": "서빙", "wage": 10000, "workDays": "", "workHours": "", "deadline": "2030-01-01",
+                    "positions": 1, "requiredLanguage": "Lv.1 기초", "lat": job_lat, "lng": job_lng,
+                    "geohash": geohash_for(job_lat, job_lng),
+                })
+    with Session(engine) as session:
+        session.execute(insert(Employer.__table__).values(
+            id="near-employer", businessNo="", shopName="점검", industry="기타", address="", openHours="",
+            contact="", minLanguageLevel="Lv.1 기초", baseWage=10000, schedule="",
+        ))
+        session.execute(insert(Job.__table__), rows)
+        session.commit()
+    return expected
+
+
+def search(client, lat: float, lng: float, radius: float) -> list:
+    found = []
+    while True:
+        page = client.get("/jobs", params={
+            "near": f"{lat},{lng}", "radiusKm": radius, "limit": PAGE, "offset": len(found),
+        }).json()
+        found.extend(page)
+        if len(page) < PAGE:
+            return found
+
+
+def main() -> bool:
+    ok = True
+    with TestClient(app) as client:
+        expected = seed()
+        for i, (lat, lng, radius) in enumerate(CASES):
+            found = [job for job in search(client, lat, lng, radius) if job["id"].startswith(f"near-{i}-")]
+            ids = {job["id"] for job in found}
+            distances = [job["distanceKm"] for job in found]
+            missing = expected[i] - ids
+            outside = ids - expected[i]
+            ordered = distances == sorted(distances)
+            passed = not missing and not outside and ordered and max(distances, default=0) <= radius
+            ok = ok and passed
+            print(f"{'ok' if passed else 'FAIL':<6}near={lat},{lng} radiusKm={radius:<5} returned={len(ids):<4}"
+                  f"missing={len(missing)} outside={len(outside)} ordered={ordered} "
+                  f"maxDistanceKm={max(distances, default=0):.3f}")
+    return ok
+
+
+if __name__ == "__main__":
+    try:
+        passed = main()
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(DB_PATH + suffix):
+                os.remove(DB_PATH + suffix)
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,208 @@
+"""
+쿼리 플랜 점검 스크립트
+각 라우터의 엔드포인트를 임시 SQLite DB 에 대해 실제로 호출하고, 실행된 모든 SQL 에
+EXPLAIN QUERY PLAN 을 돌려 인덱스 없이 테이블 전체를 읽는 쿼리(SCAN <table>)를 찾습니다.
+
+    python check_query_plans.py [-v]
+
+WHERE 절이 있는데 full table scan 이 나오면 실패(exit 1)합니다.
+WHERE 절이 없는 쿼리(국적 목록, 추천 행렬 재구성 등)는 전체 조회가 의도된 것이므로 제외합니다.
+
+다른 인덱스의 앞부분 컬럼과 같은 인덱스(중복)도 실패로 처리하고, 어떤 플랜에도 나오지
+않은 인덱스는 목록으로 출력합니다 (호출하지 않은 쿼리가 쓸 수 있으므로 실패는 아님).
+"""
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from collections import OrderedDict
+
+_fd, DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{DB_PATH}")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.db import async_engine, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Conversation  # noqa: E402
+
+_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+# (endpoint label, statement) -> parameters
+captured: "OrderedDict[tuple, tuple]" = OrderedDict()
+current = {"label": None}
+
+
+def _capture(conn, cursor, statement, parameters, context, executemany):
+    if current["label"] is None or executemany:
+        return
+    if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+        return
+    captured.setdefault((current["label"], statement), tuple(parameters or ()))
+
+
+for _engine in (engine, async_engine.sync_engine):
+    _engine.echo = False
+    event.listen(_engine, "before_cursor_execute", _capture)
+
+
+def call(client, method, url, label=None, **kwargs):
+    current["label"] = label or f"{method.upper()} {url}"
+    try:
+        response = getattr(client, method)(url, **kwargs)
+    finally:
+        current["label"] = None
+    if response.status_code >= 500:
+        raise RuntimeError(f"{method.upper()} {url} -> {response.status_code}: {response.text}")
+    return response
+
+
+def exercise(client):
+    """Hit every router once with realistic data"""
+    terms = {"tos_required": True, "privacy_required": True, "sms_optional": False, "marketing_optional": False}
+    seeker = call(client, "post", "/auth/signup", json={
+        "role": "job_seeker", "name": "구직자", "phone": "010-1111-2222", "password": "pw",
+        "birthdate": "2000-01-01", "gender": "male", "nationality_code": "KR", "terms": terms,
+    }).json()["id"]
+    call(client, "post", "/auth/signin/new", json={"identifier": "010-1111-2222", "password": "pw", "role": "job_seeker"})
+    employer = call(client, "post", "/auth/signup/employer", json={
+        "name": "사장", "email": "boss@example.com", "password": "pw", "business_type": "business",
+        "company_name": "카페", "address": "서울특별시 종로구 1", "address_detail": None,
+    }).json()["id"]
+    call(client, "post", "/auth/signin/new", json={"identifier": "boss@example.com", "password": "pw", "role": "employer"})
+    call(client, "post", "/auth/signin", json={"email": "nobody@example.com", "password": "pw"})
+    call(client, "get", f"/auth/signup-user/{seeker}", "GET /auth/signup-user/{user_id}")
+    call(client, "get", "/meta/nationalities")
+
+    profile = call(client, "get", f"/employer/profile/{employer}", "GET /employer/profile/{user_id}").json()["id"]
+    call(client, "post", "/job-seeker/profile", json={
+        "user_id": seeker, "preferred_regions": ["서울"], "preferred_jobs": ["serving"],
+        "work_schedule": {"available_dates": [], "start_time": "09:00", "end_time": "18:00", "days_of_week": ["MON"]},
+    })
+    call(client, "get", f"/job-seeker/profile/{seeker}", "GET /job-seeker/profile/{user_id}")
+
+    job_ids = []
+    for i in range(3):
+        job_ids.append(call(client, "post", "/jobs", json={
+            "employer_profile_id": profile, "title": f"바리스타 {i}", "description": "커피", "category": "서빙",
+            "wage": 10000, "work_days": "월,화", "work_hours": "09:00-18:00", "deadline": "2030-01-01",
+            "positions": 1, "required_language": "Lv.1 기초", "required_visa": ["E-9"], "benefits": "",
+            "employer_message": "", "lat": 37.57, "lng": 126.98,
+        }).json()["id"])
+    job = job_ids[0]
+    response = call(client, "get", "/jobs?limit=2", "GET /jobs")
+    call(client, "get", f"/jobs?limit=2&cursor={response.headers['X-Next-Cursor']}", "GET /jobs?cursor")
+    call(client, "get", "/jobs?location=서울&industry=서빙&languageLevel=Lv.2&visaType=E-9", "GET /jobs?filters")
+    call(client, "get", "/jobs?query=바리스타", "GET /jobs?query")
+    call(client, "get", "/jobs?near=37.57,126.98&radiusKm=5", "GET /jobs?near")
+    call(client, "get", f"/jobs/{job}", "GET /jobs/{job_id}")
+    call(client, "put", f"/jobs/{job}", "PUT /jobs/{job_id}", json={"title": "바리스타", "required_visa": ["E-9", "H-2"]})
+    call(client, "patch", f"/jobs/{job}/status", "PATCH /jobs/{job_id}/status", json={"status": "active"})
+    call(client, "get", f"/job-seeker/{seeker}/recommendations", "GET /job-seeker/{user_id}/recommendations")
+
+    application = call(client, "post", "/applications", json={"seekerId": seeker, "jobId": job}).json()["applicationId"]
+    call(client, "get", f"/applications?seekerId={seeker}", "GET /applications?seekerId")
+    call(client, "get", f"/applications?jobId={job}", "GET /applications?jobId")
+    call(client, "patch", f"/applications/{application}", "PATCH /applications/{application_id}", json={"status": "hired"})
+
+    message = call(client, "post", "/messages", json={"conversationId": "conv-1", "senderId": seeker, "text": "안녕하세요"}).json()["id"]
+    call(client, "get", "/conversations/conv-1/messages", "GET /conversations/{conversation_id}/messages")
+    call(client, "post", "/messages/read", json={"messageId": message})
+    call(client, "post", "/translate", json={"text": "hi", "targetLang": "ko", "messageId": message})
+    # 대화방 생성 API 는 없으므로 직접 추가 (conversation_participants 는 트리거가 채움)
+    with Session(engine) as session:
+        session.add(Conversation(id="conv-1", participants=json.dumps([seeker, employer])))
+        session.commit()
+    call(client, "get", f"/conversations/{seeker}", "GET /conversations/{user_id}")
+
+    call(client, "get", f"/learning/summary?seekerId={seeker}", "GET /learning/summary")
+    call(client, "post", "/leveltest", json={"seekerId": seeker, "answers": {}})
+    call(client, "get", "/jobseekers/unknown", "GET /jobseekers/{seeker_id}")
+    call(client, "get", "/employers/unknown", "GET /employers/{employer_id}")
+    call(client, "delete", f"/jobs/{job_ids[-1]}", "DELETE /jobs/{job_id}")
+
+
+def explain(conn, statement, parameters):
+    try:
+        return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    except sqlite3.Error as e:
+        return [f"(explain failed: {e})"]
+
+
+def redundant_indexes(conn, tables):
+    """Non-unique indexes whose columns are a leading prefix of another index on the same table"""
+    redundant = []
+    for table in sorted(tables):
+        indexes = {
+            row[1]: (bool(row[2]), [col[2] for col in conn.execute(f"PRAGMA index_info('{row[1]}')")])
+            for row in conn.execute(f"PRAGMA index_list('{table}')")
+        }
+        for name, (unique, columns) in indexes.items():
+            if unique:
+                continue
+            for other, (_, other_columns) in indexes.items():
+                if other != name and other_columns[:len(columns)] == columns and len(other_columns) >= len(columns):
+                    redundant.append(f"{table}.{name} {columns} (covered by {other} {other_columns})")
+                    break
+    return redundant
+
+
+def main():
+    verbose = "-v" in sys.argv
+    with TestClient(app) as client:
+        exercise(client)
+
+    conn = sqlite3.connect(DB_PATH)
+    # 서브쿼리 결과(SCAN anon_1 등)는 제외하고 실제 테이블만 검사
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    failures = 0
+    plans = []
+    for (label, statement), parameters in captured.items():
+        plan = explain(conn, statement, parameters)
+        plans.extend(plan)
+        scans = [
+            line for line in plan
+            if _FULL_SCAN.match(line) and _FULL_SCAN.match(line).group(1) in tables
+        ]
+        flagged = scans and " WHERE " in f" {statement} ".replace("\n", " ")
+        if flagged:
+            failures += 1
+        if flagged or verbose:
+            print(f"{'FULL SCAN' if flagged else 'ok':<10}{label}")
+            print(f"          {' '.join(statement.split())}")
+            for line in plan:
+                print(f"            {line}")
+
+    redundant = redundant_indexes(conn, tables)
+    used = set(re.findall(r"USING (?:COVERING )?INDEX (\w+)", "\n".join(plans)))
+    unused = [
+        f"{row[1]}.{row[0]}"
+        for row in conn.execute(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY tbl_name, name"
+        )
+        if row[0] not in used
+    ]
+    conn.close()
+    for line in redundant:
+        print(f"REDUNDANT {line}")
+    if unused:
+        print(f"\nindexes not used by any plan above ({len(unused)}):")
+        for name in unused:
+            print(f"          {name}")
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
+
+    print(f"\n{len(captured)} statements checked, {failures} full table scans, {len(redundant)} redundant indexes")
+    sys.exit(1 if failures or redundant else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+WebSocket 백플레인 점검 스크립트
+워커 두 개(ConnectionManager 두 개)를 한 프로세스에 띄워, 한 워커에서 broadcast 한
+메시지가 같은 대화방의 다른 워커 소켓에만 한 번씩 전달되는지 확인합니다.
+
+    python check_ws_backplane.py                      # 내장 Redis 프로토콜 stand-in 사용
+    python check_ws_backplane.py redis://localhost:6379/0   # 실제 Redis 사용
+
+stand-in 은 PUBLISH / SUBSCRIBE / UNSUBSCRIBE 만 구현한 최소 RESP 서버입니다.
+실패 시 exit 1.
+"""
+import asyncio
+import sys
+from typing import Dict, List, Optional, Set
+
+from app.services.backplane import InMemoryBackplane, RedisBackplane
+from app.services.serializers import loads
+from app.ws import ConnectionManager
+
+
+class RespStandIn:
+    """Minimal Redis pub/sub server (RESP2) for local checks"""
+
+    def __init__(self):
+        self.channels: Dict[bytes, Set[asyncio.StreamWriter]] = {}
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    def _encode(value) -> bytes:
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, list):
+            return b"*%d\r\n" % len(value) + b"".join(RespStandIn._encode(v) for v in value)
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        count = int(line[1:])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        subscribed: Set[bytes] = set()
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                name = command[0].upper()
+                if name == b"SUBSCRIBE":
+                    for channel in command[1:]:
+                        subscribed.add(channel)
+                        self.channels.setdefault(channel, set()).add(writer)
+                        writer.write(self._encode([b"subscribe", channel, len(subscribed)]))
+                elif name == b"UNSUBSCRIBE":
+                    for channel in command[1:] or list(subscribed):
+                        subscribed.discard(channel)
+                        self.channels.get(channel, set()).discard(writer)
+                        writer.write(self._encode([b"unsubscribe", channel, len(subscribed)]))
+                elif name == b"PUBLISH":
+                    receivers = self.channels.get(command[1], set())
+                    for receiver in receivers:
+                        receiver.write(self._encode([b"message", command[1], command[2]]))
+                    writer.write(self._encode(len(receivers)))
+                elif name == b"PING":
+                    writer.write(b"+PONG\r\n")
+                else:
+                    # CLIENT SETINFO, SELECT 등
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError, asyncio.IncompleteReadError):
+            # 클라이언트 종료 / 스크립트 종료
+            pass
+        finally:
+            for channel in subscribed:
+                self.channels.get(channel, set()).discard(writer)
+            writer.close()
+
+
+class FakeSocket:
+    def __init__(self, name: str):
+        self.name = name
+        self.received: List[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        self.received.append(loads(frame))
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def settle(seconds: float = 0.2):
+    await asyncio.sleep(seconds)
+
+
+async def scenario(make_backplane, label: str, shared: bool) -> bool:
+    """shared=False 이면 워커 간 전달은 확인하지 않음 (InMemory)"""
+    worker_a = ConnectionManager(make_backplane())
+    worker_b = ConnectionManager(make_backplane()) if shared else worker_a
+    await worker_a.start()
+    if worker_b is not worker_a:
+        await worker_b.start()
+
+    a1, b1, b2 = FakeSocket("a1"), FakeSocket("b1"), FakeSocket("b2")
+    await worker_a.connect(a1, ["conv-1"])
+    b1_connection = await worker_b.connect(b1, ["conv-1"])
+    await worker_b.connect(b2, ["conv-2"])
+    await settle()
+
+    await worker_a.broadcast({"text": "hello conv-1"}, "conv-1")
+    await worker_a.broadcast({"text": "hello conv-2"}, "conv-2")
+    await settle()
+    await worker_b.disconnect(b1_connection)
+    await settle()
+    await worker_a.broadcast({"text": "after leave"}, "conv-1")
+    await settle()
+
+    expected = {
+        "a1": ["hello conv-1", "after leave"],
+        "b1": ["hello conv-1"],
+        "b2": ["hello conv-2"],
+    }
+    ok = True
+    for socket in (a1, b1, b2):
+        got = [m["text"] for m in socket.received]
+        passed = got == expected[socket.name]
+        ok &= passed
+        print(f"{label:<10}{socket.name:<4}{'ok' if passed else 'FAIL':<6}{got}")
+    print(f"{label:<10}published={worker_a.backplane.published} received(a)={worker_a.backplane.received}"
+          f" received(b)={worker_b.backplane.received}")
+
+    await worker_a.close()
+    if worker_b is not worker_a:
+        await worker_b.close()
+    return ok
+
+
+async def main() -> bool:
+    url = sys.argv[1] if len(sys.argv) > 1 else None
+    stand_in = None
+    if url is None:
+        stand_in = RespStandIn()
+        url = await stand_in.start()
+        print(f"Redis stand-in at {url}\n")
+
+    ok = await scenario(InMemoryBackplane, "memory", shared=False)
+    ok &= await scenario(lambda: RedisBackplane(url), "redis", shared=True)
+
+    if stand_in is not None:
+        await stand_in.close()
+    print("\nOK" if ok else "\nFAILED")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
@@ -0,0 +1,159 @@
+"""
+WebSocket 전송 점검 스크립트
+대화방에 빠른 소켓 여러 개와 느린 소켓 하나를 두고 메시지를 연속 broadcast 해서
+느린 소켓이 다른 소켓의 전달을 지연시키지 않는지, 느린 소비자 정책(drop_oldest /
+drop_newest / disconnect)과 전송 타임아웃이 동작하는지 확인합니다.
+heartbeat: ping 에 응답하지 않는 (half-open) 소켓이 reaper 에 의해 정리되는지도 확인합니다.
+
+    python check_ws_delivery.py [--fast 20] [--frames 200]
+
+비교용으로 이전 방식(소켓마다 순서대로 await send)의 전달 시간도 출력합니다.
+실패 시 exit 1.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+import app.ws as ws
+from app.services.backplane import InMemoryBackplane
+from app.services.serializers import dumps
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0, hang: bool = False):
+        self.delay = delay
+        self.hang = hang
+        self.received: List[str] = []
+        self.closed_with: Optional[int] = None
+        self.on_frame = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        if self.hang:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(frame)
+        if self.on_frame is not None:
+            self.on_frame(frame)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def wait_for(predicate, timeout: float = 10.0) -> float:
+    started = time.perf_counter()
+    while not predicate():
+        if time.perf_counter() - started > timeout:
+            break
+        await asyncio.sleep(0.001)
+    return time.perf_counter() - started
+
+
+async def sequential_baseline(fast: int, frames: int, slow_delay: float) -> float:
+    """이전 ConnectionManager.send_message: 소켓마다 순서대로 await"""
+    sockets = [FakeSocket() for _ in range(fast)] + [FakeSocket(delay=slow_delay)]
+    started = time.perf_counter()
+    for i in range(frames):
+        frame = dumps({"seq": i}).decode()
+        for socket in sockets:
+            await socket.send_text(frame)
+    return time.perf_counter() - started
+
+
+async def run_policy(policy: str, fast: int, frames: int, slow_delay: float) -> bool:
+    ws.WS_SLOW_CONSUMER_POLICY = policy
+    manager = ws.ConnectionManager(InMemoryBackplane())
+    await manager.start()
+    fast_sockets = [FakeSocket() for _ in range(fast)]
+    slow = FakeSocket(delay=slow_delay)
+    for socket in fast_sockets + [slow]:
+        await manager.connect(socket, ["conv-1"])
+
+    started = time.perf_counter()
+    for i in range(frames):
+        await manager.broadcast({"seq": i}, "conv-1")
+        await asyncio.sleep(0)  # 수신 루프처럼 broadcast 사이에 다른 태스크 실행
+    fast_done = await wait_for(lambda: all(len(s.received) == frames for s in fast_sockets))
+    stats = manager.stats()
+
+    ok = all(len(s.received) == frames for s in fast_sockets)
+    if policy == "disconnect":
+        ok &= slow.closed_with == ws.CLOSE_SLOW_CONSUMER and stats["connections"] == fast
+    else:
+        ok &= stats["droppedFrames"] > 0 and stats["connections"] == fast + 1
+    print(
+        f"{policy:<13}{fast_done * 1000:>10.1f}ms  slow received={len(slow.received):<4}"
+        f"dropped={stats['droppedFrames']:<5}maxDepth={stats['maxQueueDepth']:<4}"
+        f"slowDisconnects={stats['slowConsumerDisconnects']}  {'ok' if ok else 'FAIL'}"
+    )
+    await manager.close()
+    return ok
+
+
+async def run_timeout() -> bool:
+    ws.WS_SEND_TIMEOUT = 0.2
+    manager = ws.ConnectionManager(InMemoryBackplane())
+    await manager.start()
+    hung = FakeSocket(hang=True)
+    await manager.connect(hung, ["conv-1"])
+    await manager.broadcast({"seq": 0}, "conv-1")
+    waited = await wait_for(lambda: manager.stats()["connections"] == 0, timeout=2)
+    ok = hung.closed_with == ws.CLOSE_SLOW_CONSUMER and manager.stats()["connections"] == 0
+    print(f"{'send timeout':<13}{waited * 1000:>10.1f}ms  hung socket closed={hung.closed_with}  {'ok' if ok else 'FAIL'}")
+    await manager.close()
+    return ok
+
+
+async def run_heartbeat(abandoned: int = 50) -> bool:
+    """ping 에 응답하는 소켓은 유지되고, 응답 없는 (half-open) 소켓은 4408 로 정리되는지"""
+    ws.WS_PING_INTERVAL, ws.WS_IDLE_TIMEOUT, ws.WS_REAP_INTERVAL = 0.1, 0.3, 0.02
+    manager = ws.ConnectionManager(InMemoryBackplane())
+    await manager.start()
+    alive = FakeSocket()
+    alive_connection = await manager.connect(alive, ["conv-1"])
+    # 클라이언트가 ping 을 받으면 pong 을 보내는 것과 같은 효과
+    alive.on_frame = lambda frame: frame == ws.PING_FRAME and alive_connection.touch()
+    silent = [FakeSocket() for _ in range(abandoned)]
+    for i, socket in enumerate(silent):
+        await manager.connect(socket, [f"conv-{i % 5}"])
+
+    waited = await wait_for(lambda: manager.stats()["connections"] == 1, timeout=2)
+    await asyncio.sleep(0.3)  # 응답하는 소켓이 계속 유지되는지 확인
+    stats = manager.stats()
+    pings = alive.received.count(ws.PING_FRAME)
+    ok = (
+        stats["connections"] == 1 and stats["conversations"] == 1
+        and stats["idleDisconnects"] == abandoned and pings >= 2
+        and all(s.closed_with == ws.CLOSE_IDLE_TIMEOUT for s in silent)
+    )
+    print(f"{'heartbeat':<13}{waited * 1000:>10.1f}ms  reaped={stats['idleDisconnects']} kept={stats['connections']} "
+          f"pings(alive)={pings} maxIdle={stats['maxIdleSeconds']}s  {'ok' if ok else 'FAIL'}")
+    await manager.close()
+    return ok
+
+
+async def main(args) -> bool:
+    slow_delay = 0.01
+    print(f"{args.fast} fast sockets + 1 slow socket ({slow_delay * 1000:.0f}ms per send), "
+          f"{args.frames} frames, queue {ws.WS_SEND_QUEUE_SIZE}\n")
+    baseline = await sequential_baseline(args.fast, args.frames, slow_delay)
+    print(f"{'sequential':<13}{baseline * 1000:>10.1f}ms  (previous behaviour: all sockets wait for the slow one)")
+    ok = True
+    for policy in ("drop_oldest", "drop_newest", "disconnect"):
+        ok &= await run_policy(policy, args.fast, args.frames, slow_delay)
+    ok &= await run_timeout()
+    ok &= await run_heartbeat()
+    print("\nOK" if ok else "\nFAILED")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fast", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=200)
+    sys.exit(0 if asyncio.run(main(parser.parse_args())) else 1)
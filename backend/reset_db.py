@@ -24,7 +24,9 @@ def reset_database():
         tables = [
             "nationalities", "signup_users", "job_seeker_profiles",
             "jobseekers", "employers", "jobs", "applications",
-            "conversations", "messages", "learning_progress", "users"
+            "conversations", "messages", "learning_progress", "users",
+            "job_visas", "employer_visas", "conversation_participants",
+            "job_seeker_preferences", "jobs_fts", "app_meta"
         ]
         for table in tables:
             try:
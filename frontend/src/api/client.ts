@@ -17,6 +17,11 @@ apiClient.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    // 마지막 쓰기 시각을 돌려보내서 복제 지연 중에도 방금 쓴 내용을 읽도록 함
+    const lastWrite = sessionStorage.getItem('lastWrite');
+    if (lastWrite) {
+      config.headers['X-Last-Write'] = lastWrite;
+    }
     return config;
   },
   (error) => {
@@ -26,7 +31,13 @@ apiClient.interceptors.request.use(
 
 // Response interceptor for error handling
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    const lastWrite = response.headers['x-last-write'];
+    if (lastWrite) {
+      sessionStorage.setItem('lastWrite', lastWrite);
+    }
+    return response;
+  },
   (error) => {
     if (error.response?.status === 401) {
       localStorage.removeItem('token');
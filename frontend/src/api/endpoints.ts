@@ -32,6 +32,7 @@ export const jobsAPI = {
     visaType?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   }) => apiClient.get<Job[]>('/jobs', { params }),
   get: (id: string) => apiClient.get<Job>(`/jobs/${id}`),
 };
@@ -34,9 +34,8 @@ CREATE TABLE IF NOT EXISTS signup_users (
     terms_sms_optional BOOLEAN DEFAULT FALSE COMMENT '선택 약관 동의 (SMS)',
     terms_marketing_optional BOOLEAN DEFAULT FALSE COMMENT '선택 약관 동의 (마케팅)',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
-    INDEX idx_role (role),
-    INDEX idx_email (email),
-    INDEX idx_phone (phone),
+    INDEX idx_role_phone (role, phone),
+    INDEX idx_role_email (role, email),
     FOREIGN KEY (nationality_code) REFERENCES nationalities(code) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='회원 기본 정보';
 
@@ -64,6 +63,18 @@ CREATE TABLE IF NOT EXISTS job_seeker_profiles (
     FOREIGN KEY (user_id) REFERENCES signup_users(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='구직자 상세 프로필';
 
+-- =============================================
+-- 3-1. 구직자 희망 조건 테이블 (preferred_regions / preferred_jobs / work_days_of_week 정규화)
+-- =============================================
+CREATE TABLE IF NOT EXISTS job_seeker_preferences (
+    profileId VARCHAR(50) NOT NULL COMMENT 'job_seeker_profiles.id 참조',
+    kind VARCHAR(20) NOT NULL COMMENT 'region | job | day',
+    value VARCHAR(100) NOT NULL COMMENT '희망 지역 / 직종 / 요일 값',
+    PRIMARY KEY (profileId, kind, value),
+    INDEX idx_kind_value_profileId (kind, value, profileId),
+    FOREIGN KEY (profileId) REFERENCES job_seeker_profiles(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='구직자 희망 조건';
+
 -- =============================================
 -- 4. 고용주 프로필 테이블
 -- =============================================
@@ -91,6 +102,8 @@ CREATE TABLE IF NOT EXISTS employers (
     industry VARCHAR(100) NOT NULL COMMENT '업종',
     address VARCHAR(500) NOT NULL COMMENT '주소',
     location TEXT NULL COMMENT '위치 정보 (JSON GeoPoint)',
+    lat DOUBLE NULL COMMENT '위도',
+    lng DOUBLE NULL COMMENT '경도',
     openHours VARCHAR(100) NOT NULL COMMENT '운영시간',
     contact VARCHAR(100) NOT NULL COMMENT '연락처',
     media TEXT NULL COMMENT '미디어 URL (JSON 배열)',
@@ -99,10 +112,22 @@ CREATE TABLE IF NOT EXISTS employers (
     baseWage INT NOT NULL COMMENT '기본 급여',
     schedule VARCHAR(200) NOT NULL COMMENT '일정',
     rating DECIMAL(3,2) NULL COMMENT '평점 (1.00-5.00)',
+    INDEX idx_businessNo (businessNo),
     INDEX idx_industry (industry),
-    INDEX idx_shopName (shopName)
+    FULLTEXT INDEX ft_employers_shopName (shopName) WITH PARSER ngram
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='고용주 정보 (레거시)';
 
+-- =============================================
+-- 5-1. 고용주 필요 비자 테이블 (employers.needVisa 정규화)
+-- =============================================
+CREATE TABLE IF NOT EXISTS employer_visas (
+    employerId VARCHAR(50) NOT NULL COMMENT 'employers.id 참조',
+    visaType VARCHAR(50) NOT NULL COMMENT '비자 유형 (예: E-9)',
+    PRIMARY KEY (employerId, visaType),
+    INDEX idx_visaType_employerId (visaType, employerId),
+    FOREIGN KEY (employerId) REFERENCES employers(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='고용주 필요 비자';
+
 -- =============================================
 -- 6. 공고 테이블
 -- =============================================
@@ -125,15 +150,37 @@ CREATE TABLE IF NOT EXISTS jobs (
     status VARCHAR(20) DEFAULT 'active' COMMENT '공고 상태: active, paused, closed',
     views INT DEFAULT 0 COMMENT '조회수',
     applications INT DEFAULT 0 COMMENT '지원자 수',
-    postedAt VARCHAR(50) NULL COMMENT '등록일시 (ISO8601)',
+    appliedCount INT DEFAULT 0 COMMENT '지원자 수 (applied)',
+    hiredCount INT DEFAULT 0 COMMENT '지원자 수 (hired)',
+    rejectedCount INT DEFAULT 0 COMMENT '지원자 수 (rejected)',
+    postedAt VARCHAR(50) NOT NULL COMMENT '등록일시 (ISO8601, keyset 페이지네이션 키)',
     location VARCHAR(200) NULL COMMENT '근무지 (간단 주소)',
+    lat DOUBLE NULL COMMENT '근무지 위도',
+    lng DOUBLE NULL COMMENT '근무지 경도',
+    geohash VARCHAR(12) NULL COMMENT '근무지 geohash (precision 6, 반경 검색용)',
     INDEX idx_employer (employerId),
     INDEX idx_category (category),
     INDEX idx_deadline (deadline),
     INDEX idx_status (status),
+    INDEX idx_location (location),
+    INDEX idx_requiredLanguage (requiredLanguage),
+    INDEX idx_postedAt_id (postedAt, id),
+    INDEX idx_geohash (geohash),
+    FULLTEXT INDEX ft_jobs_search (title, description, category) WITH PARSER ngram,
     FOREIGN KEY (employerId) REFERENCES employers(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='채용 공고';
 
+-- =============================================
+-- 6-1. 공고 요구 비자 테이블 (jobs.requiredVisa 정규화, 비자 필터용)
+-- =============================================
+CREATE TABLE IF NOT EXISTS job_visas (
+    jobId VARCHAR(50) NOT NULL COMMENT 'jobs.id 참조',
+    visaType VARCHAR(50) NOT NULL COMMENT '비자 유형 (예: E-9)',
+    PRIMARY KEY (jobId, visaType),
+    INDEX idx_visaType_jobId (visaType, jobId),
+    FOREIGN KEY (jobId) REFERENCES jobs(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='공고 요구 비자';
+
 -- =============================================
 -- 7. 구직자 테이블 (레거시)
 -- =============================================
@@ -163,8 +210,8 @@ CREATE TABLE IF NOT EXISTS applications (
     appliedAt VARCHAR(50) NOT NULL COMMENT '지원일시 (ISO8601)',
     updatedAt VARCHAR(50) NOT NULL COMMENT '수정일시 (ISO8601)',
     hiredAt VARCHAR(50) NULL COMMENT '채용일시 (ISO8601)',
-    INDEX idx_seeker (seekerId),
-    INDEX idx_job (jobId),
+    INDEX idx_seekerId_jobId (seekerId, jobId),
+    INDEX idx_jobId_status (jobId, status),
     INDEX idx_status (status),
     FOREIGN KEY (seekerId) REFERENCES jobseekers(id) ON DELETE CASCADE,
     FOREIGN KEY (jobId) REFERENCES jobs(id) ON DELETE CASCADE
@@ -180,6 +227,43 @@ CREATE TABLE IF NOT EXISTS conversations (
     INDEX idx_updatedAt (updatedAt)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='대화방';
 
+-- =============================================
+-- 9-1. 대화 참여자 테이블 (conversations.participants 정규화, 사용자별 대화 목록용)
+-- =============================================
+CREATE TABLE IF NOT EXISTS conversation_participants (
+    conversationId VARCHAR(50) NOT NULL COMMENT 'conversations.id 참조',
+    userId VARCHAR(50) NOT NULL COMMENT '참여자 ID',
+    PRIMARY KEY (conversationId, userId),
+    INDEX idx_userId_conversationId (userId, conversationId),
+    FOREIGN KEY (conversationId) REFERENCES conversations(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='대화 참여자';
+
+-- conversations 는 앱 밖에서 생성되므로 participants 변경은 트리거로 conversation_participants 에 반영
+-- (앱 부팅 시 app/services/child_tables.py ensure_participant_triggers 도 같은 트리거를 생성)
+DROP TRIGGER IF EXISTS trg_conversations_participants_insert;
+DROP TRIGGER IF EXISTS trg_conversations_participants_update;
+
+DELIMITER //
+CREATE TRIGGER trg_conversations_participants_insert AFTER INSERT ON conversations FOR EACH ROW
+INSERT IGNORE INTO conversation_participants (conversationId, userId)
+SELECT NEW.id, jt.userId FROM JSON_TABLE(
+    IF(JSON_VALID(NEW.participants), NEW.participants, '[]'),
+    '$[*]' COLUMNS (userId VARCHAR(50) PATH '$')) AS jt
+WHERE jt.userId IS NOT NULL AND jt.userId <> ''//
+
+CREATE TRIGGER trg_conversations_participants_update AFTER UPDATE ON conversations FOR EACH ROW
+BEGIN
+    IF NOT (OLD.id <=> NEW.id AND OLD.participants <=> NEW.participants) THEN
+        DELETE FROM conversation_participants WHERE conversationId = OLD.id;
+        INSERT IGNORE INTO conversation_participants (conversationId, userId)
+        SELECT NEW.id, jt.userId FROM JSON_TABLE(
+            IF(JSON_VALID(NEW.participants), NEW.participants, '[]'),
+            '$[*]' COLUMNS (userId VARCHAR(50) PATH '$')) AS jt
+        WHERE jt.userId IS NOT NULL AND jt.userId <> '';
+    END IF;
+END//
+DELIMITER ;
+
 -- =============================================
 -- 10. 메시지 테이블
 -- =============================================
@@ -191,7 +275,7 @@ CREATE TABLE IF NOT EXISTS messages (
     translatedText TEXT NULL COMMENT '번역된 메시지',
     timestamp VARCHAR(50) NOT NULL COMMENT '전송일시 (ISO8601)',
     `read` BOOLEAN DEFAULT FALSE COMMENT '읽음 여부',
-    INDEX idx_conversation (conversationId),
+    INDEX idx_conversationId_timestamp (conversationId, timestamp),
     INDEX idx_sender (senderId),
     INDEX idx_timestamp (timestamp),
     FOREIGN KEY (conversationId) REFERENCES conversations(id) ON DELETE CASCADE
@@ -224,6 +308,15 @@ CREATE TABLE IF NOT EXISTS users (
     INDEX idx_role (role)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자 인증 정보 (레거시)';
 
+-- =============================================
+-- 13. 앱 메타데이터 테이블
+-- =============================================
+CREATE TABLE IF NOT EXISTS app_meta (
+    `key` VARCHAR(50) PRIMARY KEY COMMENT '키 (schema_version 등)',
+    value VARCHAR(255) NOT NULL COMMENT '값',
+    updatedAt VARCHAR(50) NOT NULL COMMENT '수정일시'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='앱 메타데이터 (부팅 시 스키마 버전 확인용)';
+
 -- =============================================
 -- 국적 데이터 초기 삽입
 -- =============================================